@@ -7,7 +7,6 @@ import json
 import logging
 import os
 import pip
-import pkg_resources
 import platform
 import shutil
 import signal
@@ -32,6 +31,7 @@ from redbot.core.cli import interactive_config, confirm, parse_cli_flags
 from redbot.setup import get_data_dir, get_name, save_config
 from redbot.core import data_manager, drivers
 from redbot.core._sharedlibdeprecation import SharedLibImportWarner
+from redbot.core._startup_tracer import startup_tracer
 
 
 log = logging.getLogger("red.main")
@@ -331,7 +331,8 @@ async def run_bot(red: Red, cli_flags: Namespace) -> None:
 
     driver_cls = drivers.get_driver_class()
 
-    await driver_cls.initialize(**data_manager.storage_details())
+    with startup_tracer.phase("driver initialization"):
+        await driver_cls.initialize(**data_manager.storage_details())
 
     redbot.logging.init_logging(
         level=cli_flags.logging_level, location=data_manager.core_data_path() / "logs"
@@ -354,7 +355,11 @@ async def run_bot(red: Red, cli_flags: Namespace) -> None:
         # `sys.path`, you must invoke the appropriate methods on the `working_set` instance
         # to keep it in sync."
         # Source: https://setuptools.readthedocs.io/en/latest/pkg_resources.html#workingset-objects
-        pkg_resources.working_set.add_entry(str(LIB_PATH))
+        # `pkg_resources` is slow to import so it's only imported when it's needed,
+        # if it wasn't imported yet, it will pick up the new `sys.path` entry on its own.
+        pkg_resources = sys.modules.get("pkg_resources")
+        if pkg_resources is not None:
+            pkg_resources.working_set.add_entry(str(LIB_PATH))
     sys.meta_path.insert(0, SharedLibImportWarner())
 
     if cli_flags.token:
@@ -474,6 +479,8 @@ def red_exception_handler(red, red_task: asyncio.Future):
 def main():
     red = None  # Error handling for users misusing the bot
     cli_flags = parse_cli_flags(sys.argv[1:])
+    if cli_flags.trace_startup or cli_flags.trace_startup_imports:
+        startup_tracer.enable(import_times=cli_flags.trace_startup_imports)
     handle_early_exit_flags(cli_flags)
     if cli_flags.edit:
         handle_edit(cli_flags)
@@ -492,9 +499,10 @@ def main():
             cli_flags.instance_name = "temporary_red"
             data_manager.create_temp_config()
 
-        data_manager.load_basic_configuration(cli_flags.instance_name)
+        with startup_tracer.phase("bot creation"):
+            data_manager.load_basic_configuration(cli_flags.instance_name)
 
-        red = Red(cli_flags=cli_flags, description="Red V3", dm_help=None)
+            red = Red(cli_flags=cli_flags, description="Red V3", dm_help=None)
 
         if os.name != "nt":
             # None of this works on windows.
@@ -416,13 +416,14 @@ class Alias(commands.Cog):
 
         await self._ready_event.wait()
 
+        message_context = self.bot.get_message_context(message)
         if message.guild is not None:
-            if await self.bot.cog_disabled_in_guild(self, message.guild):
+            if message_context.cog_disabled(self):
                 return
 
-        try:
-            prefix = await self.get_prefix(message)
-        except ValueError:
+        # This has usually already been worked out while processing the message for commands
+        prefix = await message_context.get_prefix()
+        if prefix is None:
             return
 
         try:
@@ -6,7 +6,6 @@ from typing import List, Union
 
 import lavalink
 
-from fuzzywuzzy import process
 from redbot.core import commands
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
@@ -112,6 +111,8 @@ class LocalTrackUtilities(MixinMeta, metaclass=CompositeMetaClass):
     async def _build_local_search_list(
         self, to_search: List[Query], search_words: str
     ) -> List[str]:
+        from fuzzywuzzy import process
+
         to_search_string = {
             i.local_track_path.name for i in to_search if i.local_track_path is not None
         }
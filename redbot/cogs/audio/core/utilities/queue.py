@@ -7,7 +7,6 @@ from typing import List, Tuple
 import discord
 import lavalink
 
-from fuzzywuzzy import process
 from redbot.core import commands
 from redbot.core.i18n import Translator
 from redbot.core.utils import AsyncIter
@@ -116,6 +115,8 @@ class QueueUtilities(MixinMeta, metaclass=CompositeMetaClass):
     async def _build_queue_search_list(
         self, queue_list: List[lavalink.Track], search_words: str
     ) -> List[Tuple[int, str]]:
+        from fuzzywuzzy import process
+
         track_list = []
         async for queue_idx, track in AsyncIter(queue_list).enumerate(start=1):
             if not self.match_url(track.uri):
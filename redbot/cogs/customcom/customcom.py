@@ -8,7 +8,6 @@ from typing import Iterable, List, Mapping, Tuple, Dict, Set, Literal
 from urllib.parse import quote_plus
 
 import discord
-from fuzzywuzzy import process
 
 from redbot.core import Config, checks, commands
 from redbot.core.i18n import Translator, cog_i18n
@@ -287,6 +286,8 @@ class CustomCommands(commands.Cog):
     @commands.guild_only()
     async def cc_search(self, ctx: commands.Context, *, query):
         """Searches through custom commands, according to the query."""
+        from fuzzywuzzy import process
+
         cc_commands = await CommandObj.get_commands(self.config.guild(ctx.guild))
         extracted = process.extract(query, list(cc_commands.keys()))
         accepted = []
@@ -556,7 +557,12 @@ class CustomCommands(commands.Cog):
         if len(message.content) < 2 or is_private or not user_allowed or message.author.bot:
             return
 
-        if await self.bot.cog_disabled_in_guild(self, message.guild):
+        message_context = self.bot.get_message_context(message)
+        if message_context.cog_disabled(self):
+            return
+
+        # Skip building a context for messages which weren't invoked with a prefix
+        if await message_context.get_prefix() is None:
             return
 
         ctx = await self.bot.get_context(message)
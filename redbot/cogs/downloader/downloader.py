@@ -4,8 +4,21 @@ import os
 import re
 import shutil
 import sys
+import time
 from pathlib import Path
-from typing import Tuple, Union, Iterable, Collection, Optional, Dict, Set, List, cast
+from typing import (
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 from collections import defaultdict
 
 import discord
@@ -26,6 +39,9 @@ from .repo_manager import RepoManager, Repo
 
 _ = Translator("Downloader", __file__)
 
+# Minimum amount of seconds between two edits of the repo update progress message
+PROGRESS_EDIT_INTERVAL = 5
+
 
 DEPRECATION_NOTICE = _(
     "\n**WARNING:** The following repos are using shared libraries"
@@ -60,6 +76,8 @@ class Downloader(commands.Cog):
         self.LIB_PATH = cog_data_path(self) / "lib"
         self.SHAREDLIB_PATH = self.LIB_PATH / "cog_shared"
         self.SHAREDLIB_INIT = self.SHAREDLIB_PATH / "__init__.py"
+        # kept outside of LIB_PATH so that it survives `[p]cog reinstallreqs`
+        self.PIP_CACHE_PATH = cog_data_path(self) / "pip_cache"
 
         self._create_lib_folder()
 
@@ -381,6 +399,7 @@ class Downloader(commands.Cog):
                     else:
                         failed.append(cog)
             await repo.checkout(exit_to_commit)
+        self.bot._cog_mgr.invalidate_index()
 
         # noinspection PyTypeChecker
         return (tuple(installed), tuple(failed))
@@ -416,7 +435,10 @@ class Downloader(commands.Cog):
             for commit, libs in libs_by_commit.items():
                 await repo.checkout(commit)
                 installed, failed = await repo.install_libraries(
-                    target_dir=self.SHAREDLIB_PATH, req_target_dir=self.LIB_PATH, libraries=libs
+                    target_dir=self.SHAREDLIB_PATH,
+                    req_target_dir=self.LIB_PATH,
+                    libraries=libs,
+                    cache_dir=self.PIP_CACHE_PATH,
                 )
                 all_installed += installed
                 all_failed += failed
@@ -440,22 +462,24 @@ class Downloader(commands.Cog):
         """
 
         # Reduces requirements to a single list with no repeats
-        requirements = {requirement for cog in cogs for requirement in cog.requirements}
-        repos: List[Tuple[Repo, List[str]]] = [(repo, []) for repo in self._repo_manager.repos]
-
-        # This for loop distributes the requirements across all repos
-        # which will allow us to concurrently install requirements
-        for i, req in enumerate(requirements):
-            repo_index = i % len(repos)
-            repos[repo_index][1].append(req)
+        requirements = sorted({requirement for cog in cogs for requirement in cog.requirements})
+        if not requirements:
+            return ()
 
-        has_reqs = list(filter(lambda item: len(item[1]) > 0, repos))
+        repo = Repo("", "", "", "", Path.cwd())
+        # Installing everything at once lets pip resolve all requirements together.
+        if await repo.install_raw_requirements(
+            requirements, self.LIB_PATH, cache_dir=self.PIP_CACHE_PATH
+        ):
+            return ()
 
+        # Find out which requirements failed, the successful ones are skipped as satisfied.
         failed_reqs = []
-        for repo, reqs in has_reqs:
-            for req in reqs:
-                if not await repo.install_raw_requirements([req], self.LIB_PATH):
-                    failed_reqs.append(req)
+        for req in requirements:
+            if not await repo.install_raw_requirements(
+                [req], self.LIB_PATH, cache_dir=self.PIP_CACHE_PATH
+            ):
+                failed_reqs.append(req)
         return tuple(failed_reqs)
 
     @staticmethod
@@ -487,7 +511,10 @@ class Downloader(commands.Cog):
             return
         repo = Repo("", "", "", "", Path.cwd())
         async with ctx.typing():
-            success = await repo.install_raw_requirements(deps, self.LIB_PATH)
+            # Explicitly requested libraries are upgraded, even if they're already installed
+            success = await repo.install_raw_requirements(
+                deps, self.LIB_PATH, cache_dir=self.PIP_CACHE_PATH, skip_satisfied=False
+            )
 
         if success:
             await ctx.send(_("Libraries installed."))
@@ -605,7 +632,9 @@ class Downloader(commands.Cog):
         async with ctx.typing():
             updated: Set[str]
 
-            updated_repos, failed = await self._repo_manager.update_repos(repos)
+            updated_repos, failed = await self._repo_manager.update_repos(
+                repos, progress=self._repo_update_progress(ctx)
+            )
             updated = {repo.name for repo in updated_repos}
 
             if updated:
@@ -653,7 +682,9 @@ class Downloader(commands.Cog):
             all_failed_libs: List[Installable] = []
             for repo in repos:
                 installed_libs, failed_libs = await repo.install_libraries(
-                    target_dir=self.SHAREDLIB_PATH, req_target_dir=self.LIB_PATH
+                    target_dir=self.SHAREDLIB_PATH,
+                    req_target_dir=self.LIB_PATH,
+                    cache_dir=self.PIP_CACHE_PATH,
                 )
                 all_installed_libs += installed_libs
                 all_failed_libs += failed_libs
@@ -746,7 +777,9 @@ class Downloader(commands.Cog):
             if repo.available_libraries:
                 deprecation_notice = DEPRECATION_NOTICE.format(repo_list=inline(repo.name))
             installed_libs, failed_libs = await repo.install_libraries(
-                target_dir=self.SHAREDLIB_PATH, req_target_dir=self.LIB_PATH
+                target_dir=self.SHAREDLIB_PATH,
+                req_target_dir=self.LIB_PATH,
+                cache_dir=self.PIP_CACHE_PATH,
             )
             if rev is not None:
                 for cog in installed_cogs:
@@ -817,6 +850,7 @@ class Downloader(commands.Cog):
                     uninstalled_cogs.append(inline(real_name))
                 else:
                     failed_cogs.append(real_name)
+            self.bot._cog_mgr.invalidate_index()
             await self._remove_from_installed(cogs)
 
             message = ""
@@ -918,7 +952,9 @@ class Downloader(commands.Cog):
         """
 
         async with ctx.typing():
-            cogs_to_check, failed = await self._get_cogs_to_check()
+            cogs_to_check, failed = await self._get_cogs_to_check(
+                progress=self._repo_update_progress(ctx)
+            )
             cogs_to_update, libs_to_update = await self._available_updates(cogs_to_check)
             cogs_to_update, filter_message = self._filter_incorrect_cogs(cogs_to_update)
 
@@ -1020,7 +1056,9 @@ class Downloader(commands.Cog):
                 )
 
             else:
-                cogs_to_check, check_failed = await self._get_cogs_to_check(repos=repos, cogs=cogs)
+                cogs_to_check, check_failed = await self._get_cogs_to_check(
+                    repos=repos, cogs=cogs, progress=self._repo_update_progress(ctx)
+                )
                 failed_repos.update(check_failed)
 
             pinned_cogs = {cog for cog in cogs_to_check if cog.pinned}
@@ -1265,17 +1303,49 @@ class Downloader(commands.Cog):
 
         return tuple(correct_cogs), message
 
+    @staticmethod
+    def _repo_update_progress(ctx: commands.Context) -> Callable[[int, int], Awaitable[None]]:
+        """
+        Get a callback for `RepoManager.update_repos` reporting its progress in ``ctx``.
+
+        The progress message is only sent once the update takes longer than
+        `PROGRESS_EDIT_INTERVAL` seconds, and is edited at most that often.
+        """
+        message: Optional[discord.Message] = None
+        last_report = time.monotonic()
+
+        async def report(done: int, total: int) -> None:
+            nonlocal message, last_report
+            now = time.monotonic()
+            if done < total and now - last_report < PROGRESS_EDIT_INTERVAL:
+                return
+            if done == total and message is None:
+                # the update didn't take long enough for progress to be useful
+                return
+            last_report = now
+            content = _("Updating repos... ({done}/{total})").format(done=done, total=total)
+            try:
+                if message is None:
+                    message = await ctx.send(content)
+                else:
+                    await message.edit(content=content)
+            except discord.HTTPException:
+                pass
+
+        return report
+
     async def _get_cogs_to_check(
         self,
         *,
         repos: Optional[Iterable[Repo]] = None,
         cogs: Optional[Iterable[InstalledModule]] = None,
         update_repos: bool = True,
+        progress: Optional[Callable[[int, int], Awaitable[None]]] = None,
     ) -> Tuple[Set[InstalledModule], List[str]]:
         failed = []
         if not (cogs or repos):
             if update_repos:
-                __, failed = await self._repo_manager.update_repos()
+                __, failed = await self._repo_manager.update_repos(progress=progress)
 
             cogs_to_check = {
                 cog
@@ -1289,7 +1359,7 @@ class Downloader(commands.Cog):
                 repos = {cog.repo for cog in cogs if cog.repo is not None}
 
             if update_repos:
-                __, failed = await self._repo_manager.update_repos(repos)
+                __, failed = await self._repo_manager.update_repos(repos, progress=progress)
 
             if failed:
                 # remove failed repos
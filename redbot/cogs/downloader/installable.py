@@ -68,7 +68,14 @@ class Installable(RepoJSONMixin):
 
     """
 
-    def __init__(self, location: Path, repo: Optional[Repo] = None, commit: str = ""):
+    def __init__(
+        self,
+        location: Path,
+        repo: Optional[Repo] = None,
+        commit: str = "",
+        *,
+        raw_info: Optional[str] = None,
+    ):
         """Base installable initializer.
 
         Parameters
@@ -79,6 +86,9 @@ class Installable(RepoJSONMixin):
             Repo object of the Installable, if repo is missing this will be `None`
         commit : str
             Installable's commit. This is not the same as ``repo.commit``
+        raw_info : str, optional
+            Contents of the installable's info.json. When not provided,
+            they are read from the file at ``location``.
 
         """
         self._location = location
@@ -98,7 +108,7 @@ class Installable(RepoJSONMixin):
         self.tags: Tuple[str, ...]
         self.type: InstallableType
 
-        super().__init__(location)
+        super().__init__(location, raw_info=raw_info)
 
     def __eq__(self, other: Any) -> bool:
         # noinspection PyProtectedMember
@@ -135,8 +145,8 @@ class Installable(RepoJSONMixin):
             return False
         return True
 
-    def _read_info_file(self) -> None:
-        super()._read_info_file()
+    def _load_info(self, raw_info: str) -> None:
+        super()._load_info(raw_info)
 
         update_mixin(self, INSTALLABLE_SCHEMA)
         if self.type == InstallableType.SHARED_LIBRARY:
@@ -1,6 +1,6 @@
 import json
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from .info_schemas import REPO_SCHEMA, update_mixin
 from .log import log
@@ -9,7 +9,7 @@ from .log import log
 class RepoJSONMixin:
     INFO_FILE_NAME = "info.json"
 
-    def __init__(self, repo_folder: Path):
+    def __init__(self, repo_folder: Path, *, raw_info: Optional[str] = None):
         self._repo_folder = repo_folder
 
         self.author: Tuple[str, ...]
@@ -20,19 +20,25 @@ class RepoJSONMixin:
         self._info_file = repo_folder / self.INFO_FILE_NAME
         self._info: Dict[str, Any]
 
-        self._read_info_file()
+        if raw_info is None:
+            self._read_info_file()
+        else:
+            self._load_info(raw_info)
 
     def _read_info_file(self) -> None:
         if self._info_file.exists():
-            try:
-                with self._info_file.open(encoding="utf-8") as f:
-                    info = json.load(f)
-            except json.JSONDecodeError as e:
-                log.error(
-                    "Invalid JSON information file at path: %s\nError: %s", self._info_file, str(e)
-                )
-                info = {}
+            with self._info_file.open(encoding="utf-8") as f:
+                self._load_info(f.read())
         else:
+            self._load_info("{}")
+
+    def _load_info(self, raw_info: str) -> None:
+        try:
+            info = json.loads(raw_info)
+        except json.JSONDecodeError as e:
+            log.error(
+                "Invalid JSON information file at path: %s\nError: %s", self._info_file, str(e)
+            )
             info = {}
         if not isinstance(info, dict):
             log.warning(
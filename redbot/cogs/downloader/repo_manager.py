@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import functools
 import keyword
 import os
 import pkgutil
@@ -9,15 +8,15 @@ import shlex
 import shutil
 import re
 import yarl
-from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from subprocess import run as sp_run, PIPE, CompletedProcess
+from subprocess import PIPE, CompletedProcess
 from string import Formatter
 from sys import executable
 from typing import (
     Any,
     AsyncContextManager,
     Awaitable,
+    Callable,
     Dict,
     Generator,
     Iterable,
@@ -29,6 +28,7 @@ from typing import (
 
 import discord
 from redbot.core import data_manager, commands, Config
+from redbot.core.utils import bounded_gather
 from redbot.core.utils._internal_utils import safe_delete
 from redbot.core.i18n import Translator
 
@@ -127,7 +127,13 @@ class Repo(RepoJSONMixin):
         " -- {module_name}/__init__.py"
     )
 
+    GIT_LS_TREE = "git -C {path} ls-tree -z {rev} -- {paths}"
+    GIT_CAT_FILE_BATCH = "git -C {path} cat-file --batch"
+
     PIP_INSTALL = "{python} -m pip install -U -t {target_dir} {reqs}"
+    PIP_INSTALL_WITH_CACHE = (
+        "{python} -m pip install -U --cache-dir {cache_dir} -t {target_dir} {reqs}"
+    )
 
     MODULE_FOLDER_REGEX = re.compile(r"(\w+)\/")
     AMBIGUOUS_ERROR_REGEX = re.compile(
@@ -156,8 +162,6 @@ class Repo(RepoJSONMixin):
 
         self.available_modules = available_modules
 
-        self._executor = ThreadPoolExecutor(1)
-
         self._repo_lock = asyncio.Lock()
 
     @property
@@ -321,8 +325,8 @@ class Repo(RepoJSONMixin):
             debug_only=True,
         )
         if p.returncode == 0:
-            async with self.checkout(descendant_rev):
-                return discord.utils.get(self.available_modules, name=module_name)
+            modules = await self._get_modules_at_rev(descendant_rev, (module_name,))
+            return discord.utils.get(modules, name=module_name)
 
         git_command = ProcessFormatter().format(
             self.GIT_GET_LAST_MODULE_OCCURRENCE_COMMIT,
@@ -339,8 +343,8 @@ class Repo(RepoJSONMixin):
 
         commit = p.stdout.decode(**DECODE_PARAMS).strip()
         if commit:
-            async with self.checkout(f"{commit}~"):
-                return discord.utils.get(self.available_modules, name=module_name)
+            modules = await self._get_modules_at_rev(f"{commit}~", (module_name,))
+            return discord.utils.get(modules, name=module_name)
         return None
 
     async def _is_module_modified(self, module: Installable, other_hash: str) -> bool:
@@ -400,29 +404,185 @@ class Repo(RepoJSONMixin):
             if match is not None:
                 modified_modules.add(match.group(1))
 
-        async with self.checkout(old_rev):
-            # save old modules
-            old_hash = self.commit
-            old_modules = self.available_modules
-            # save new modules
-            await self.checkout(new_rev)
-            modules = []
-            new_modules = self.available_modules
-            for old_module in old_modules:
-                if old_module.name not in modified_modules:
-                    continue
-                try:
-                    index = new_modules.index(old_module)
-                except ValueError:
-                    # module doesn't exist in this revision, try finding previous occurrence
-                    module = await self.get_last_module_occurrence(old_module.name, new_rev)
-                    if module is not None and await self._is_module_modified(module, old_hash):
-                        modules.append(module)
-                else:
-                    modules.append(new_modules[index])
+        old_hash = await self.get_full_sha1(old_rev)
+        old_module_names = [
+            name
+            for name in await self._get_module_info_blobs(old_hash)
+            if name in modified_modules
+        ]
+        new_modules = {
+            module.name: module
+            for module in await self._get_modules_at_rev(new_rev, old_module_names)
+        }
+        modules = []
+        for name in old_module_names:
+            try:
+                modules.append(new_modules[name])
+            except KeyError:
+                # module doesn't exist in this revision, try finding previous occurrence
+                module = await self.get_last_module_occurrence(name, new_rev)
+                if module is not None and await self._is_module_modified(module, old_hash):
+                    modules.append(module)
 
         return tuple(modules)
 
+    async def _ls_tree(self, rev: str, paths: Iterable[str]) -> List[Tuple[str, str, str]]:
+        """
+        Lists the tree entries matching given paths at the given revision.
+
+        Returns
+        -------
+        `list` of `tuple` of `str`
+            List of :code:`(object type, object name, path)` tuples.
+
+        """
+        git_command = ProcessFormatter().format(
+            self.GIT_LS_TREE, path=self.folder_path, rev=rev, paths=paths
+        )
+        p = await self._run(git_command)
+
+        if p.returncode != 0:
+            raise errors.GitException(
+                f"Git ls-tree failed for repo at path: {self.folder_path}", git_command
+            )
+
+        ret = []
+        for entry in p.stdout.decode(**DECODE_PARAMS).split("\x00"):
+            if not entry:
+                continue
+            info, __, entry_path = entry.partition("\t")
+            __, object_type, object_name = info.split()
+            ret.append((object_type, object_name, entry_path))
+        return ret
+
+    async def _get_module_info_blobs(
+        self, rev: str, names: Optional[Iterable[str]] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        Gets the modules available at the given revision, without checking it out.
+
+        Parameters
+        ----------
+        rev : str
+            Revision to list the modules of.
+        names : `iterable` of `str`, optional
+            Names of the modules to look for, defaults to all modules.
+
+        Returns
+        -------
+        Dict[str, Optional[str]]
+            Mapping of module name -> object name of its info.json,
+            or `None` if the module doesn't have one.
+
+        """
+        if names is None:
+            candidates = [
+                entry_path
+                for object_type, __, entry_path in await self._ls_tree(rev, ())
+                if object_type == "tree"
+            ]
+        else:
+            candidates = list(names)
+        # same rules as in `_update_available_modules()`
+        candidates = [
+            name for name in candidates if name.isidentifier() and not keyword.iskeyword(name)
+        ]
+        if not candidates:
+            return {}
+
+        paths = []
+        for name in candidates:
+            paths.append(f"{name}/__init__.py")
+            paths.append(f"{name}/{Installable.INFO_FILE_NAME}")
+        packages = set()
+        info_blobs = {}
+        for object_type, object_name, entry_path in await self._ls_tree(rev, paths):
+            if object_type != "blob":
+                continue
+            name, __, file_name = entry_path.partition("/")
+            if file_name == "__init__.py":
+                packages.add(name)
+            else:
+                info_blobs[name] = object_name
+
+        return {name: info_blobs.get(name) for name in candidates if name in packages}
+
+    async def _read_blobs(self, object_names: Iterable[str]) -> Dict[str, str]:
+        """
+        Reads the contents of given blobs with a single git process.
+
+        Returns
+        -------
+        Dict[str, str]
+            Mapping of object name -> blob contents.
+
+        """
+        object_names = list(object_names)
+        if not object_names:
+            return {}
+        git_command = ProcessFormatter().format(self.GIT_CAT_FILE_BATCH, path=self.folder_path)
+        p = await self._run(git_command, input="".join(f"{o}\n" for o in object_names).encode())
+
+        if p.returncode != 0:
+            raise errors.GitException(
+                f"Git cat-file failed for repo at path: {self.folder_path}", git_command
+            )
+
+        ret = {}
+        stdout = p.stdout
+        pos = 0
+        for object_name in object_names:
+            header_end = stdout.index(b"\n", pos)
+            header = stdout[pos:header_end].decode(**DECODE_PARAMS).split()
+            pos = header_end + 1
+            if header[-1] == "missing":
+                continue
+            size = int(header[2])
+            ret[object_name] = stdout[pos : pos + size].decode(**DECODE_PARAMS)
+            # contents are followed by a newline
+            pos += size + 1
+        return ret
+
+    async def _get_modules_at_rev(
+        self, rev: str, names: Optional[Iterable[str]] = None
+    ) -> Tuple[Installable, ...]:
+        """
+        Gets the modules available at the given revision
+        straight from git objects, without touching the working tree.
+
+        Parameters
+        ----------
+        rev : str
+            Revision to get the modules of.
+        names : `iterable` of `str`, optional
+            Names of the modules to get, defaults to all modules.
+
+        Returns
+        -------
+        `tuple` of `Installable`
+            Modules available at the given revision.
+
+        Raises
+        ------
+        .UnknownRevision
+            When git cannot find provided revision.
+
+        """
+        commit = await self.get_full_sha1(rev)
+        info_blobs = await self._get_module_info_blobs(commit, names)
+        contents = await self._read_blobs(
+            object_name for object_name in info_blobs.values() if object_name is not None
+        )
+        return tuple(
+            Installable(
+                location=self.folder_path / name,
+                repo=self,
+                commit=commit,
+                raw_info=contents.get(object_name, "{}") if object_name is not None else "{}",
+            )
+            for name, object_name in info_blobs.items()
+        )
+
     async def _get_commit_notes(self, old_rev: str, relative_file_path: str) -> str:
         """
         Gets the commit notes from git log.
@@ -521,14 +681,18 @@ class Repo(RepoJSONMixin):
 
     async def _run(
         self,
-        *args: Any,
+        command: List[str],
+        *,
         valid_exit_codes: Tuple[int, ...] = (0,),
         debug_only: bool = False,
+        input: Optional[bytes] = None,
         **kwargs: Any,
     ) -> CompletedProcess:
         """
         Parameters
         ----------
+        command : `list` of `str`
+            The command to run, as returned by `ProcessFormatter.format`.
         valid_exit_codes : tuple
             Specifies valid exit codes, used to determine
             if stderr should be sent as debug or error level in logging.
@@ -536,6 +700,8 @@ class Repo(RepoJSONMixin):
         debug_only : bool
             Specifies if stderr can be sent only as debug level in logging.
             When not provided, defaults to `False`
+        input : bytes, optional
+            Data to send to the process' stdin.
         """
         env = os.environ.copy()
         env["GIT_TERMINAL_PROMPT"] = "0"
@@ -548,10 +714,15 @@ class Repo(RepoJSONMixin):
         env["LANGUAGE"] = "C"
         kwargs["env"] = env
         async with self._repo_lock:
-            p: CompletedProcess = await asyncio.get_running_loop().run_in_executor(
-                self._executor,
-                functools.partial(sp_run, *args, stdout=PIPE, stderr=PIPE, **kwargs),
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=PIPE if input is not None else None,
+                stdout=PIPE,
+                stderr=PIPE,
+                **kwargs,
             )
+            stdout, stderr = await process.communicate(input)
+            p = CompletedProcess(command, process.returncode, stdout, stderr)
             # logging can't use surrogateescape
             stderr = p.stderr.decode(encoding="utf-8", errors="replace").strip()
             if stderr:
@@ -860,7 +1031,12 @@ class Repo(RepoJSONMixin):
         return InstalledModule.from_installable(cog)
 
     async def install_libraries(
-        self, target_dir: Path, req_target_dir: Path, libraries: Iterable[Installable] = ()
+        self,
+        target_dir: Path,
+        req_target_dir: Path,
+        libraries: Iterable[Installable] = (),
+        *,
+        cache_dir: Optional[Path] = None,
     ) -> Tuple[Tuple[InstalledModule, ...], Tuple[Installable, ...]]:
         """Install shared libraries to the target directory.
 
@@ -875,6 +1051,8 @@ class Repo(RepoJSONMixin):
             Directory to install shared library requirements to.
         libraries : `tuple` of `Installable`
             A subset of available libraries.
+        cache_dir : pathlib.Path, optional
+            Directory for pip to cache downloaded packages and built wheels in.
 
         Returns
         -------
@@ -894,7 +1072,9 @@ class Repo(RepoJSONMixin):
             failed = []
             for lib in libraries:
                 if not (
-                    await self.install_requirements(cog=lib, target_dir=req_target_dir)
+                    await self.install_requirements(
+                        cog=lib, target_dir=req_target_dir, cache_dir=cache_dir
+                    )
                     and await lib.copy_to(target_dir=target_dir)
                 ):
                     failed.append(lib)
@@ -903,7 +1083,9 @@ class Repo(RepoJSONMixin):
             return (tuple(installed), tuple(failed))
         return ((), ())
 
-    async def install_requirements(self, cog: Installable, target_dir: Path) -> bool:
+    async def install_requirements(
+        self, cog: Installable, target_dir: Path, *, cache_dir: Optional[Path] = None
+    ) -> bool:
         """Install a cog's requirements.
 
         Requirements will be installed via pip directly into
@@ -915,6 +1097,8 @@ class Repo(RepoJSONMixin):
             Cog for which to install requirements.
         target_dir : pathlib.Path
             Path to directory  where requirements are to be installed.
+        cache_dir : pathlib.Path, optional
+            Directory for pip to cache downloaded packages and built wheels in.
 
         Returns
         -------
@@ -926,19 +1110,54 @@ class Repo(RepoJSONMixin):
             raise ValueError("Target directory is not a directory.")
         target_dir.mkdir(parents=True, exist_ok=True)
 
-        return await self.install_raw_requirements(cog.requirements, target_dir)
+        return await self.install_raw_requirements(
+            cog.requirements, target_dir, cache_dir=cache_dir
+        )
+
+    @staticmethod
+    def _get_unsatisfied_requirements(requirements: Iterable[str], target_dir: Path) -> List[str]:
+        """
+        Filters out the requirements that are already satisfied
+        by the distributions installed in :code:`target_dir`.
+        """
+        import pkg_resources
+
+        working_set = pkg_resources.WorkingSet([str(target_dir)])
+        ret = []
+        for requirement in requirements:
+            try:
+                if working_set.find(pkg_resources.Requirement.parse(requirement)) is not None:
+                    continue
+            except (ValueError, pkg_resources.VersionConflict):
+                # not a requirement specifier (e.g. an URL) or the wrong version is installed
+                pass
+            ret.append(requirement)
+        return ret
 
     async def install_raw_requirements(
-        self, requirements: Iterable[str], target_dir: Path
+        self,
+        requirements: Iterable[str],
+        target_dir: Path,
+        *,
+        cache_dir: Optional[Path] = None,
+        skip_satisfied: bool = True,
     ) -> bool:
         """Install a list of requirements using pip.
 
+        All requirements are installed with a single pip invocation.
+
         Parameters
         ----------
         requirements : `tuple` of `str`
             List of requirement names to install via pip.
         target_dir : pathlib.Path
             Path to directory where requirements are to be installed.
+        cache_dir : pathlib.Path, optional
+            Directory for pip to cache downloaded packages and built wheels in.
+            When not provided, pip's default cache is used.
+        skip_satisfied : bool
+            Whether requirements already satisfied in :code:`target_dir` should be skipped.
+            When ``False``, they are upgraded to the newest version allowed instead.
 
         Returns
         -------
@@ -946,16 +1165,24 @@ class Repo(RepoJSONMixin):
             Success of the installation
 
         """
+        if skip_satisfied:
+            requirements = self._get_unsatisfied_requirements(requirements, target_dir)
         if not requirements:
             return True
 
-        # TODO: Check and see if any of these modules are already available
-
-        p = await self._run(
-            ProcessFormatter().format(
+        if cache_dir is None:
+            pip_command = ProcessFormatter().format(
                 self.PIP_INSTALL, python=executable, target_dir=target_dir, reqs=requirements
             )
-        )
+        else:
+            pip_command = ProcessFormatter().format(
+                self.PIP_INSTALL_WITH_CACHE,
+                python=executable,
+                cache_dir=cache_dir,
+                target_dir=target_dir,
+                reqs=requirements,
+            )
+        p = await self._run(pip_command)
 
         if p.returncode != 0:
             log.error(
@@ -1003,6 +1230,8 @@ class RepoManager:
 
     GITHUB_OR_GITLAB_RE = re.compile(r"https?://git(?:hub)|(?:lab)\.com/")
     TREE_URL_RE = re.compile(r"(?P<tree>/tree)/(?P<branch>\S+)$")
+    # Maximum number of repos updated at the same time by `update_repos`.
+    UPDATE_CONCURRENCY = 8
 
     def __init__(self) -> None:
         self._repos: Dict[str, Repo] = {}
@@ -1151,17 +1380,25 @@ class RepoManager:
         return (repo, (old, new))
 
     async def update_repos(
-        self, repos: Optional[Iterable[Repo]] = None
+        self,
+        repos: Optional[Iterable[Repo]] = None,
+        *,
+        progress: Optional[Callable[[int, int], Awaitable[None]]] = None,
     ) -> Tuple[Dict[Repo, Tuple[str, str]], List[str]]:
         """Calls `Repo.update` on passed repositories and
         catches failing ones.
 
         Calling without params updates all currently installed repos.
+        Distinct repos are updated concurrently, with at most
+        `UPDATE_CONCURRENCY` updates running at the same time.
 
         Parameters
         ----------
         repos: Iterable
             Iterable of Repos, None to update all
+        progress: Callable[[int, int], Awaitable[None]], optional
+            Called with the number of finished updates and the total number of updates
+            whenever an update finishes.
 
         Returns
         -------
@@ -1177,8 +1414,12 @@ class RepoManager:
         # select all repos if not specified
         if not repos:
             repos = self.repos
+        repos = list(repos)
+        total = len(repos)
+        done = 0
 
-        for repo in repos:
+        async def _update(repo: Repo) -> None:
+            nonlocal done
             try:
                 updated_repo, (old, new) = await self.update_repo(repo.name)
             except errors.UpdateError as err:
@@ -1191,10 +1432,17 @@ class RepoManager:
                 )
 
                 failed.append(repo.name)
-                continue
-
-            if old != new:
-                ret[updated_repo] = (old, new)
+            else:
+                if old != new:
+                    ret[updated_repo] = (old, new)
+            finally:
+                done += 1
+                log.debug("Repo update progress: %s/%s (last: %s)", done, total, repo.name)
+                if progress is not None:
+                    await progress(done, total)
+
+        # Each repo has its own lock, so only updates of distinct repos overlap.
+        await bounded_gather(*map(_update, repos), limit=self.UPDATE_CONCURRENCY)
 
         return ret, failed
 
@@ -385,7 +385,8 @@ class Filter(commands.Cog):
         if isinstance(message.channel, discord.abc.PrivateChannel):
             return
 
-        if await self.bot.cog_disabled_in_guild(self, message.guild):
+        message_context = self.bot.get_message_context(message)
+        if message_context.cog_disabled(self):
             return
 
         author = message.author
@@ -393,10 +394,10 @@ class Filter(commands.Cog):
         if not valid_user:
             return
 
-        if await self.bot.is_automod_immune(message):
+        if await message_context.is_automod_immune():
             return
 
-        await set_contextual_locales_from_guild(self.bot, message.guild)
+        await message_context.set_contextual_locales()
 
         await self.check_filter(message)
 
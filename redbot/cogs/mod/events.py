@@ -4,7 +4,6 @@ from collections import defaultdict, deque
 
 import discord
 from redbot.core import i18n, modlog, commands
-from redbot.core.utils.mod import is_mod_or_superior
 from .abc import MixinMeta
 
 _ = i18n.Translator("Mod", __file__)
@@ -137,7 +136,8 @@ class Events(MixinMeta):
         if message.guild is None or self.bot.user == author:
             return
 
-        if await self.bot.cog_disabled_in_guild(self, message.guild):
+        message_context = self.bot.get_message_context(message)
+        if message_context.cog_disabled(self):
             return
 
         valid_user = isinstance(author, discord.Member) and not author.bot
@@ -145,14 +145,13 @@ class Events(MixinMeta):
             return
 
         #  Bots and mods or superior are ignored from the filter
-        mod_or_superior = await is_mod_or_superior(self.bot, obj=author)
-        if mod_or_superior:
+        if await message_context.is_mod_or_superior():
             return
         # As are anyone configured to be
-        if await self.bot.is_automod_immune(message):
+        if await message_context.is_automod_immune():
             return
 
-        await i18n.set_contextual_locales_from_guild(self.bot, message.guild)
+        await message_context.set_contextual_locales()
 
         deleted = await self.check_duplicates(message)
         if not deleted:
@@ -1,3 +1,4 @@
+import functools
 from datetime import datetime, timezone
 
 from typing import Optional, Union
@@ -8,7 +9,7 @@ from redbot.core import checks, commands, modlog
 from redbot.core.bot import Red
 from redbot.core.i18n import Translator, cog_i18n
 from redbot.core.utils.chat_formatting import box
-from redbot.core.utils.menus import DEFAULT_CONTROLS, menu
+from redbot.core.utils.menus import DEFAULT_CONTROLS, menu, next_page, prev_page
 
 _ = Translator("ModLog", __file__)
 
@@ -129,15 +130,37 @@ class ModLog(commands.Cog):
     @commands.guild_only()
     async def casesfor(self, ctx: commands.Context, *, member: Union[discord.Member, int]):
         """Display cases for the specified member."""
-        try:
-            if isinstance(member, int):
-                cases = await modlog.get_cases_for_member(
-                    bot=ctx.bot, guild=ctx.guild, member_id=member
-                )
-            else:
-                cases = await modlog.get_cases_for_member(
-                    bot=ctx.bot, guild=ctx.guild, member=member
+        member_id = member if isinstance(member, int) else member.id
+        summaries = await modlog.get_case_summaries(ctx.guild, member_id=member_id)
+        if not summaries:
+            return await ctx.send(_("That user does not have any cases."))
+
+        embed_requested = await ctx.embed_requested()
+        # Cases are only built once their page is about to be shown,
+        # the placeholders just need to be of the right type for `menu()`.
+        pages = [discord.Embed() if embed_requested else "" for __ in summaries]
+        rendered = set()
+
+        async def render_page(page: int, *, placeholder_on_error: bool = True) -> None:
+            if page in rendered:
+                return
+            try:
+                case = await summaries[page].fetch_case(self.bot)
+            except discord.HTTPException:
+                if not placeholder_on_error:
+                    raise
+                # not marked as rendered, so loading the case is tried again next time
+                pages[page] = self._format_unavailable_case(
+                    summaries[page].case_number, embed_requested
                 )
+                return
+            if not isinstance(member, int):
+                case.user = member
+            pages[page] = await self._format_case(case, embed_requested)
+            rendered.add(page)
+
+        try:
+            await render_page(0, placeholder_on_error=False)
         except discord.NotFound:
             return await ctx.send(_("That user does not exist."))
         except discord.HTTPException:
@@ -145,24 +168,43 @@ class ModLog(commands.Cog):
                 _("Something unexpected went wrong while fetching that user by ID.")
             )
 
-        if not cases:
-            return await ctx.send(_("That user does not have any cases."))
-
-        embed_requested = await ctx.embed_requested()
-        if embed_requested:
-            rendered_cases = [await case.message_content(embed=True) for case in cases]
-        elif not embed_requested:
-            rendered_cases = []
-            for case in cases:
-                message = _("{case}\n**Timestamp:** {timestamp}").format(
-                    case=await case.message_content(embed=False),
-                    timestamp=datetime.utcfromtimestamp(case.created_at).strftime(
-                        "%Y-%m-%d %H:%M:%S UTC"
-                    ),
-                )
-                rendered_cases.append(message)
+        controls = {
+            emoji: functools.partial(self._lazy_menu_control, render_page, control)
+            for emoji, control in DEFAULT_CONTROLS.items()
+        }
+        await menu(ctx, pages, controls)
+
+    @staticmethod
+    async def _format_case(case: modlog.Case, embed: bool) -> Union[discord.Embed, str]:
+        if embed:
+            return await case.message_content(embed=True)
+        return _("{case}\n**Timestamp:** {timestamp}").format(
+            case=await case.message_content(embed=False),
+            timestamp=datetime.utcfromtimestamp(case.created_at).strftime("%Y-%m-%d %H:%M:%S UTC"),
+        )
 
-        await menu(ctx, rendered_cases, DEFAULT_CONTROLS)
+    @staticmethod
+    def _format_unavailable_case(case_number: int, embed: bool) -> Union[discord.Embed, str]:
+        msg = _("Case #{number} could not be loaded, please try again later.").format(
+            number=case_number
+        )
+        if embed:
+            return discord.Embed(description=msg)
+        return msg
+
+    @staticmethod
+    async def _lazy_menu_control(
+        render_page, control, ctx, pages, controls, message, page, timeout, emoji
+    ):
+        if control is next_page:
+            target = 0 if page == len(pages) - 1 else page + 1
+        elif control is prev_page:
+            target = len(pages) - 1 if page == 0 else page - 1
+        else:
+            target = None
+        if target is not None:
+            await render_page(target)
+        return await control(ctx, pages, controls, message, page, timeout, emoji)
 
     @commands.command()
     @commands.guild_only()
@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class StreamsError(Exception):
     pass
 
@@ -20,3 +23,9 @@ class InvalidYoutubeCredentials(StreamsError):
 
 class OfflineStream(StreamsError):
     pass
+
+
+class RateLimited(APIError):
+    def __init__(self, retry_after: Optional[float] = None):
+        super().__init__(retry_after)
+        self.retry_after = retry_after
@@ -0,0 +1,244 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+import discord
+
+from .errors import OfflineStream, RateLimited
+from .streamtypes import Stream
+
+log = logging.getLogger("red.core.cogs.Streams")
+
+StreamStatus = Optional[Tuple[Optional[discord.Embed], bool]]
+BatchCheck = Callable[[List[Stream]], Awaitable[Dict[Stream, StreamStatus]]]
+
+# (tokens per second, bucket capacity) for each service.
+# A batched service uses a single token for each batch of streams.
+PROVIDER_RATE_LIMITS: Dict[str, Tuple[float, float]] = {
+    "TwitchStream": (1, 5),
+}
+DEFAULT_RATE_LIMIT = (5, 10)
+# Used when a service rate limits us without saying for how long
+DEFAULT_BACKOFF = 60
+# Each check is scheduled within this fraction of the refresh timer from its deadline
+JITTER = 0.1
+# The maximum amount of seconds between two scheduler runs
+MAX_TICK = 15
+
+
+class TokenBucket:
+    """Token bucket limiting how often a service is checked."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def try_acquire(self) -> bool:
+        """Take a token from the bucket if one is available."""
+        now = time.monotonic()
+        if now < self._paused_until:
+            return False
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def pause(self, delay: float) -> None:
+        """Don't hand out any tokens for the given amount of seconds."""
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        self._tokens = 0
+        self._updated = self._paused_until
+
+
+class ProviderStats:
+    """Statistics about the checks of a single service."""
+
+    def __init__(self) -> None:
+        self.polls = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.checked = 0
+        self.last_latency = 0.0
+        self.total_latency = 0.0
+        #: Amount of streams which were due but couldn't be checked in the last run
+        self.backlog = 0
+        #: How late the most overdue stream of the last run was checked, in seconds
+        self.max_delay = 0.0
+
+    @property
+    def average_latency(self) -> float:
+        return self.total_latency / self.polls if self.polls else 0.0
+
+
+class StreamScheduler:
+    """Decides which streams are due to be checked and checks them.
+
+    Every stream gets its own deadline, randomly spread around the refresh timer.
+    Streams of batched services share a single deadline instead,
+    so that all of them are checked with as few requests as possible.
+    Services are checked concurrently, each limited by its own token bucket.
+    Streams which are due but can't be checked yet because of those limits
+    stay due and are checked in a later run.
+
+    Parameters
+    ----------
+    batch_checks : Dict[str, BatchCheck]
+        Functions checking all due streams of the service with the given type at once.
+        Streams of the other services are checked one by one.
+    """
+
+    def __init__(self, batch_checks: Dict[str, BatchCheck]) -> None:
+        self.batch_checks = batch_checks
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.stats: Dict[str, ProviderStats] = {}
+        # keyed by the stream, or by the service's name for batched services
+        self._deadlines: Dict[Union[Stream, str], float] = {}
+
+    def _get_bucket(self, provider: str) -> TokenBucket:
+        try:
+            return self.buckets[provider]
+        except KeyError:
+            bucket = self.buckets[provider] = TokenBucket(
+                *PROVIDER_RATE_LIMITS.get(provider, DEFAULT_RATE_LIMIT)
+            )
+            return bucket
+
+    def _get_stats(self, provider: str) -> ProviderStats:
+        return self.stats.setdefault(provider, ProviderStats())
+
+    def _deadline_key(self, stream: Stream) -> Union[Stream, str]:
+        provider = stream.__class__.__name__
+        return provider if provider in self.batch_checks else stream
+
+    def _reschedule(self, key: Union[Stream, str], refresh_timer: float) -> None:
+        jitter = random.uniform(-JITTER, JITTER) * refresh_timer
+        self._deadlines[key] = time.monotonic() + refresh_timer + jitter
+
+    def time_until_next_run(self) -> float:
+        """Get the amount of seconds to wait before the next run."""
+        if not self._deadlines:
+            return MAX_TICK
+        delay = min(self._deadlines.values()) - time.monotonic()
+        return min(max(delay, 1), MAX_TICK)
+
+    async def run(self, streams: List[Stream], refresh_timer: float) -> Dict[Stream, StreamStatus]:
+        """Check the streams which are due.
+
+        Returns
+        -------
+        Dict[Stream, StreamStatus]
+            A mapping of the checked streams to their embed and whether they're a rerun,
+            or to ``None`` if they're offline. Streams which weren't checked are omitted.
+        """
+        now = time.monotonic()
+        known = set(map(self._deadline_key, streams))
+        for key in list(self._deadlines):
+            if key not in known:
+                del self._deadlines[key]
+
+        for stats in self.stats.values():
+            stats.backlog = 0
+        due: Dict[str, List[Stream]] = {}
+        for stream in streams:
+            # new streams are checked soon, but not all at the same time
+            deadline = self._deadlines.setdefault(
+                self._deadline_key(stream), now + random.uniform(0, MAX_TICK)
+            )
+            if deadline <= now:
+                due.setdefault(stream.__class__.__name__, []).append(stream)
+
+        tasks = []
+        for provider, provider_streams in due.items():
+            bucket = self._get_bucket(provider)
+            stats = self._get_stats(provider)
+            if provider in self.batch_checks:
+                to_check = provider_streams if bucket.try_acquire() else []
+            else:
+                to_check = []
+                for stream in provider_streams:
+                    if not bucket.try_acquire():
+                        break
+                    to_check.append(stream)
+            stats.backlog = len(provider_streams) - len(to_check)
+            if to_check:
+                stats.max_delay = now - min(
+                    self._deadlines[self._deadline_key(s)] for s in to_check
+                )
+                tasks.append(self._check_provider(provider, to_check, refresh_timer))
+
+        statuses: Dict[Stream, StreamStatus] = {}
+        for result in await asyncio.gather(*tasks):
+            statuses.update(result)
+        return statuses
+
+    async def _check_provider(
+        self, provider: str, streams: List[Stream], refresh_timer: float
+    ) -> Dict[Stream, StreamStatus]:
+        stats = self._get_stats(provider)
+        start = time.perf_counter()
+        batch_check = self.batch_checks.get(provider)
+        if batch_check is not None:
+            try:
+                statuses = await batch_check(streams)
+            except Exception as exc:
+                if not isinstance(exc, RateLimited):
+                    log.debug("Failed to check %s streams.", provider, exc_info=exc)
+                statuses = {}
+                errors: List[Optional[BaseException]] = [exc] * len(streams)
+            else:
+                errors = [None] * len(streams)
+        else:
+            results = await asyncio.gather(
+                *(self._check_stream(stream) for stream in streams), return_exceptions=True
+            )
+            statuses = {}
+            errors = []
+            for stream, result in zip(streams, results):
+                if isinstance(result, BaseException):
+                    errors.append(result)
+                else:
+                    statuses[stream] = result
+                    errors.append(None)
+
+        latency = time.perf_counter() - start
+        stats.polls += 1
+        stats.checked += len(statuses)
+        stats.last_latency = latency
+        stats.total_latency += latency
+
+        retry_after = None
+        for stream, error in zip(streams, errors):
+            if isinstance(error, RateLimited):
+                # the stream stays due, so it's checked once the service lets us
+                retry_after = max(retry_after or 0, error.retry_after or DEFAULT_BACKOFF)
+                continue
+            if error is not None:
+                stats.errors += 1
+                if batch_check is None:
+                    log.debug("Failed to check %r.", stream, exc_info=error)
+            if batch_check is None:
+                self._reschedule(stream, refresh_timer)
+        if batch_check is not None and retry_after is None:
+            self._reschedule(provider, refresh_timer)
+        if retry_after is not None:
+            stats.rate_limited += 1
+            log.debug("%s is rate limited, backing off for %s seconds.", provider, retry_after)
+            self._get_bucket(provider).pause(retry_after)
+
+        log.debug("Checked %s %s streams in %.2f seconds.", len(streams), provider, latency)
+        return statuses
+
+    @staticmethod
+    async def _check_stream(stream: Stream) -> StreamStatus:
+        try:
+            info = await stream.is_online()
+        except OfflineStream:
+            return None
+        return info if isinstance(info, tuple) else (info, False)
@@ -3,7 +3,7 @@ from redbot.core.bot import Red
 from redbot.core import checks, commands, Config
 from redbot.core.i18n import cog_i18n, Translator, set_contextual_locales_from_guild
 from redbot.core.utils._internal_utils import send_to_owners_with_prefix_replaced
-from redbot.core.utils.chat_formatting import escape, pagify
+from redbot.core.utils.chat_formatting import box, escape, pagify
 
 from .streamtypes import (
     HitboxStream,
@@ -20,6 +20,7 @@ from .errors import (
     StreamNotFound,
     StreamsError,
 )
+from .scheduler import StreamScheduler
 from . import streamtypes as _streamtypes
 
 import re
@@ -34,6 +35,11 @@ from typing import Optional, List, Tuple, Union, Dict
 _ = Translator("Streams", __file__)
 log = logging.getLogger("red.core.cogs.Streams")
 
+# Limits of the connection pool shared by all stream checks
+MAX_CONNECTIONS = 100
+MAX_CONNECTIONS_PER_HOST = 10
+DNS_CACHE_TTL = 300
+
 
 @cog_i18n(_)
 class Streams(commands.Cog):
@@ -73,6 +79,8 @@ class Streams(commands.Cog):
 
         self.streams: List[Stream] = []
         self.task: Optional[asyncio.Task] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.scheduler = StreamScheduler({"TwitchStream": self._get_twitch_statuses})
 
         self.yt_cid_pattern = re.compile("^UC[-_A-Za-z0-9]{21}[AQgw]$")
 
@@ -91,6 +99,12 @@ class Streams(commands.Cog):
 
     async def initialize(self) -> None:
         """Should be called straight after cog instantiation."""
+        connector = aiohttp.TCPConnector(
+            limit=MAX_CONNECTIONS,
+            limit_per_host=MAX_CONNECTIONS_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL,
+        )
+        self._session = aiohttp.ClientSession(connector=connector)
         await self.bot.wait_until_ready()
 
         try:
@@ -210,6 +224,7 @@ class Streams(commands.Cog):
             name=channel_name,
             token=token,
             bearer=self.ttv_bearer_cache.get("access_token", None),
+            session=self._session,
         )
         await self.check_online(ctx, stream)
 
@@ -222,21 +237,21 @@ class Streams(commands.Cog):
         apikey = await self.bot.get_shared_api_tokens("youtube")
         is_name = self.check_name_or_id(channel_id_or_name)
         if is_name:
-            stream = YoutubeStream(name=channel_id_or_name, token=apikey)
+            stream = YoutubeStream(name=channel_id_or_name, token=apikey, session=self._session)
         else:
-            stream = YoutubeStream(id=channel_id_or_name, token=apikey)
+            stream = YoutubeStream(id=channel_id_or_name, token=apikey, session=self._session)
         await self.check_online(ctx, stream)
 
     @commands.command()
     async def smashcast(self, ctx: commands.Context, channel_name: str):
         """Check if a smashcast channel is live."""
-        stream = HitboxStream(name=channel_name)
+        stream = HitboxStream(name=channel_name, session=self._session)
         await self.check_online(ctx, stream)
 
     @commands.command()
     async def picarto(self, ctx: commands.Context, channel_name: str):
         """Check if a Picarto channel is live."""
-        stream = PicartoStream(name=channel_name)
+        stream = PicartoStream(name=channel_name, session=self._session)
         await self.check_online(ctx, stream)
 
     async def check_online(
@@ -385,16 +400,17 @@ class Streams(commands.Cog):
             is_yt = _class.__name__ == "YoutubeStream"
             is_twitch = _class.__name__ == "TwitchStream"
             if is_yt and not self.check_name_or_id(channel_name):
-                stream = _class(id=channel_name, token=token)
+                stream = _class(id=channel_name, token=token, session=self._session)
             elif is_twitch:
                 await self.maybe_renew_twitch_bearer_token()
                 stream = _class(
                     name=channel_name,
                     token=token.get("client_id"),
                     bearer=self.ttv_bearer_cache.get("access_token", None),
+                    session=self._session,
                 )
             else:
-                stream = _class(name=channel_name, token=token)
+                stream = _class(name=channel_name, token=token, session=self._session)
             try:
                 exists = await self.check_exists(stream)
             except InvalidTwitchCredentials:
@@ -442,6 +458,34 @@ class Streams(commands.Cog):
             _("Refresh timer set to {refresh_time} seconds".format(refresh_time=refresh_time))
         )
 
+    @streamset.command(name="stats")
+    @checks.is_owner()
+    async def _streamset_stats(self, ctx: commands.Context):
+        """Show statistics about the stream checks of each service."""
+        if not self.scheduler.stats:
+            await ctx.send(_("No streams have been checked yet."))
+            return
+        msg = ""
+        for provider, stats in sorted(self.scheduler.stats.items()):
+            msg += _(
+                "{provider}:\n"
+                "  Checks: {polls} ({checked} streams, {errors} errors,"
+                " rate limited {rate_limited} times)\n"
+                "  Latency: {last_latency:.2f}s (average: {average_latency:.2f}s)\n"
+                "  Backlog: {backlog} streams (most overdue: {max_delay:.0f}s)\n"
+            ).format(
+                provider=provider,
+                polls=stats.polls,
+                checked=stats.checked,
+                errors=stats.errors,
+                rate_limited=stats.rate_limited,
+                last_latency=stats.last_latency,
+                average_latency=stats.average_latency,
+                backlog=stats.backlog,
+                max_delay=stats.max_delay,
+            )
+        await ctx.send(box(msg))
+
     @streamset.command()
     @checks.is_owner()
     async def twitchtoken(self, ctx: commands.Context):
@@ -678,19 +722,51 @@ class Streams(commands.Cog):
                 await self.check_streams()
             except asyncio.CancelledError:
                 pass
-            await asyncio.sleep(await self.config.refresh_timer())
+            await asyncio.sleep(self.scheduler.time_until_next_run())
+
+    async def _get_twitch_statuses(
+        self, streams: List[TwitchStream]
+    ) -> Dict[Stream, Optional[Tuple[Optional[discord.Embed], bool]]]:
+        """Check all of the given Twitch streams with as few requests as possible.
+
+        Streams which were already announced get ``None`` instead of an embed.
+        """
+        await self.maybe_renew_twitch_bearer_token()
+        tokens = await self.bot.get_shared_api_tokens("twitch")
+        online_streams = await TwitchStream.get_online_streams(
+            streams,
+            client_id=tokens.get("client_id"),
+            bearer=self.ttv_bearer_cache.get("access_token", None),
+            session=self._session,
+        )
+        return {stream: online_streams.get(stream) for stream in streams if stream.id}
+
+    async def get_stream_statuses(self) -> Dict[Stream, Optional[Tuple[discord.Embed, bool]]]:
+        """Check the streams with alerts which are due to be checked.
+
+        Returns
+        -------
+        Dict[Stream, Optional[Tuple[discord.Embed, bool]]]
+            A mapping of the streams to their embed and whether they're a rerun,
+            or to ``None`` if they're offline. Streams which weren't checked are omitted.
+        """
+        return await self.scheduler.run(self.streams, await self.config.refresh_timer())
 
     async def check_streams(self):
+        try:
+            await self._check_streams()
+        finally:
+            # Changes made while checking the streams are saved once, at the end of the check.
+            await self.save_dirty_streams()
+
+    async def _check_streams(self):
+        statuses = await self.get_stream_statuses()
         for stream in self.streams:
+            if stream not in statuses:
+                continue
+            info = statuses[stream]
             with contextlib.suppress(Exception):
-                try:
-                    if stream.__class__.__name__ == "TwitchStream":
-                        await self.maybe_renew_twitch_bearer_token()
-                        embed, is_rerun = await stream.is_online()
-                    else:
-                        embed = await stream.is_online()
-                        is_rerun = False
-                except OfflineStream:
+                if info is None:
                     if not stream._messages_cache:
                         continue
                     for message in stream._messages_cache:
@@ -701,10 +777,11 @@ class Streams(commands.Cog):
                             if autodelete:
                                 await message.delete()
                     stream._messages_cache.clear()
-                    await self.save_streams()
+                    stream.mark_dirty()
                 else:
                     if stream._messages_cache:
                         continue
+                    embed, is_rerun = info
                     for channel_id in stream.channels:
                         channel = self.bot.get_channel(channel_id)
                         if not channel:
@@ -762,10 +839,10 @@ class Streams(commands.Cog):
                             allowed_mentions=discord.AllowedMentions(roles=True, everyone=True),
                         )
                         stream._messages_cache.append(m)
+                        stream.mark_dirty()
                         if edited_roles:
                             for role in edited_roles:
                                 await role.edit(mentionable=False)
-                        await self.save_streams()
 
     async def _get_mention_str(
         self, guild: discord.Guild, channel: discord.TextChannel
@@ -831,19 +908,41 @@ class Streams(commands.Cog):
                     raw_stream["bearer"] = self.ttv_bearer_cache.get("access_token", None)
                 else:
                     raw_stream["token"] = token
-            streams.append(_class(**raw_stream))
+            stream = _class(**raw_stream, session=self._session)
+            stream.mark_clean()
+            streams.append(stream)
 
         return streams
 
     async def save_streams(self):
+        # Streams are marked clean before they're exported,
+        # so that changes made while saving are saved the next time.
+        streams = list(self.streams)
         raw_streams = []
-        for stream in self.streams:
+        for stream in streams:
+            stream.mark_clean()
             raw_streams.append(stream.export())
 
-        await self.config.streams.set(raw_streams)
+        try:
+            await self.config.streams.set(raw_streams)
+        except Exception:
+            for stream in streams:
+                stream.mark_dirty()
+            raise
+
+    async def save_dirty_streams(self):
+        """Save the streams if any of them changed since they were last saved."""
+        if any(stream.dirty for stream in self.streams):
+            await self.save_streams()
 
     def cog_unload(self):
         if self.task:
             self.task.cancel()
+        if self._session is not None and not self._session.closed:
+            self.bot.loop.create_task(self._session.close())
 
-    __del__ = cog_unload
+    def __del__(self):
+        # The loop may already be closed by the time this runs, so the
+        # session is only closed from cog_unload.
+        if self.task and not self.bot.loop.is_closed():
+            self.task.cancel()
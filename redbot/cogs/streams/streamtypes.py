@@ -1,9 +1,12 @@
+import asyncio
+import contextlib
 import json
 import logging
+import time
 from random import choice
 from string import ascii_letters
 import xml.etree.ElementTree as ET
-from typing import ClassVar, Optional, List
+from typing import Any, AsyncIterator, ClassVar, Dict, Iterable, List, Optional, Tuple
 
 import aiohttp
 import discord
@@ -13,15 +16,22 @@ from .errors import (
     OfflineStream,
     InvalidTwitchCredentials,
     InvalidYoutubeCredentials,
+    RateLimited,
     StreamNotFound,
 )
 from redbot.core.i18n import Translator
+from redbot.core.utils import bounded_gather
 from redbot.core.utils.chat_formatting import humanize_number
 
 TWITCH_BASE_URL = "https://api.twitch.tv"
 TWITCH_ID_ENDPOINT = TWITCH_BASE_URL + "/helix/users"
 TWITCH_STREAMS_ENDPOINT = TWITCH_BASE_URL + "/helix/streams/"
 TWITCH_COMMUNITIES_ENDPOINT = TWITCH_BASE_URL + "/helix/communities"
+TWITCH_GAMES_ENDPOINT = TWITCH_BASE_URL + "/helix/games"
+TWITCH_FOLLOWS_ENDPOINT = TWITCH_BASE_URL + "/helix/users/follows"
+# Maximum amount of `id`, `login` or `user_id` parameters accepted by a single Helix request
+TWITCH_MAX_IDS_PER_REQUEST = 100
+TWITCH_FOLLOWS_CONCURRENCY = 10
 
 YOUTUBE_BASE_URL = "https://www.googleapis.com/youtube/v3"
 YOUTUBE_CHANNELS_ENDPOINT = YOUTUBE_BASE_URL + "/channels"
@@ -34,11 +44,46 @@ _ = Translator("Streams", __file__)
 log = logging.getLogger("redbot.cogs.Streams")
 
 
+_MISSING = object()
+
+
 def rnd(url):
     """Appends a random parameter to the url to avoid Discord's caching"""
     return url + "?rnd=" + "".join([choice(ascii_letters) for _loop_counter in range(6)])
 
 
+def chunks(items: List[Any], size: int) -> Iterable[List[Any]]:
+    """Splits the given list into lists of at most ``size`` items."""
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+@contextlib.asynccontextmanager
+async def http_get(
+    session: Optional[aiohttp.ClientSession], url: str, **kwargs
+) -> AsyncIterator[aiohttp.ClientResponse]:
+    """Make a GET request to the given url.
+
+    The request is made with the given session,
+    or with a temporary session if it isn't an open one.
+    """
+    if session is not None and not session.closed:
+        async with session.get(url, **kwargs) as r:
+            yield r
+    else:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url, **kwargs) as r:
+                yield r
+
+
+def get_retry_after(r: aiohttp.ClientResponse) -> Optional[float]:
+    """Get the amount of seconds to wait before retrying a rate limited request."""
+    try:
+        return float(r.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
 def get_video_ids_from_feed(feed):
     root = ET.fromstring(feed)
     rss_video_ids = []
@@ -56,7 +101,43 @@ class Stream:
         self.channels = kwargs.pop("channels", [])
         # self.already_online = kwargs.pop("already_online", False)
         self._messages_cache = kwargs.pop("_messages_cache", [])
+        self._session: Optional[aiohttp.ClientSession] = kwargs.pop("session", None)
         self.type = self.__class__.__name__
+        self._dirty = True
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if not name.startswith("_") and getattr(self, name, _MISSING) != value:
+            super().__setattr__("_dirty", True)
+        super().__setattr__(name, value)
+
+    @property
+    def dirty(self) -> bool:
+        """Whether the exported data of this stream changed since it was last saved.
+
+        Changes made by assigning attributes are tracked automatically,
+        anything else which changes the exported data has to call `mark_dirty`.
+        """
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        self._dirty = True
+
+    def mark_clean(self) -> None:
+        self._dirty = False
+
+    @contextlib.asynccontextmanager
+    async def _get(self, url: str, **kwargs) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Make a GET request to the given url with this stream's session.
+
+        Raises
+        ------
+        RateLimited
+            The service rejected the request because of its rate limits.
+        """
+        async with http_get(self._session, url, **kwargs) as r:
+            if r.status == 429:
+                raise RateLimited(get_retry_after(r))
+            yield r
 
     async def is_online(self):
         raise NotImplementedError()
@@ -99,9 +180,8 @@ class YoutubeStream(Stream):
         elif not self.name:
             self.name = await self.fetch_name()
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(YOUTUBE_CHANNEL_RSS.format(channel_id=self.id)) as r:
-                rssdata = await r.text()
+        async with self._get(YOUTUBE_CHANNEL_RSS.format(channel_id=self.id)) as r:
+            rssdata = await r.text()
 
         if self.not_livestreams:
             self.not_livestreams = list(dict.fromkeys(self.not_livestreams))
@@ -119,23 +199,23 @@ class YoutubeStream(Stream):
                 "id": video_id,
                 "part": "id,liveStreamingDetails",
             }
-            async with aiohttp.ClientSession() as session:
-                async with session.get(YOUTUBE_VIDEOS_ENDPOINT, params=params) as r:
-                    data = await r.json()
-                    stream_data = data.get("items", [{}])[0].get("liveStreamingDetails", {})
-                    log.debug(f"stream_data for {video_id}: {stream_data}")
-                    if (
-                        stream_data
-                        and stream_data != "None"
-                        and stream_data.get("actualStartTime", None) is not None
-                        and stream_data.get("actualEndTime", None) is None
-                    ):
-                        if video_id not in self.livestreams:
-                            self.livestreams.append(data["items"][0]["id"])
-                    else:
-                        self.not_livestreams.append(data["items"][0]["id"])
-                        if video_id in self.livestreams:
-                            self.livestreams.remove(video_id)
+            async with self._get(YOUTUBE_VIDEOS_ENDPOINT, params=params) as r:
+                data = await r.json()
+                stream_data = data.get("items", [{}])[0].get("liveStreamingDetails", {})
+                log.debug(f"stream_data for {video_id}: {stream_data}")
+                if (
+                    stream_data
+                    and stream_data != "None"
+                    and stream_data.get("actualStartTime", None) is not None
+                    and stream_data.get("actualEndTime", None) is None
+                ):
+                    if video_id not in self.livestreams:
+                        self.livestreams.append(data["items"][0]["id"])
+                else:
+                    self.not_livestreams.append(data["items"][0]["id"])
+                    if video_id in self.livestreams:
+                        self.livestreams.remove(video_id)
+                self.mark_dirty()
         log.debug(f"livestreams for {self.name}: {self.livestreams}")
         log.debug(f"not_livestreams for {self.name}: {self.not_livestreams}")
         # This is technically redundant since we have the
@@ -143,9 +223,8 @@ class YoutubeStream(Stream):
         # code for this part, as this is only a 2 quota query.
         if self.livestreams:
             params = {"key": self._token["api_key"], "id": self.livestreams[-1], "part": "snippet"}
-            async with aiohttp.ClientSession() as session:
-                async with session.get(YOUTUBE_VIDEOS_ENDPOINT, params=params) as r:
-                    data = await r.json()
+            async with self._get(YOUTUBE_VIDEOS_ENDPOINT, params=params) as r:
+                data = await r.json()
             return self.make_embed(data)
         raise OfflineStream()
 
@@ -176,9 +255,8 @@ class YoutubeStream(Stream):
         else:
             params["id"] = self.id
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(YOUTUBE_CHANNELS_ENDPOINT, params=params) as r:
-                data = await r.json()
+        async with self._get(YOUTUBE_CHANNELS_ENDPOINT, params=params) as r:
+            data = await r.json()
 
         if (
             "error" in data
@@ -216,68 +294,183 @@ class TwitchStream(Stream):
         if not self.id:
             self.id = await self.fetch_id()
 
-        url = TWITCH_STREAMS_ENDPOINT
-        header = {"Client-ID": str(self._client_id)}
-        if self._bearer is not None:
-            header = {**header, "Authorization": f"Bearer {self._bearer}"}
-        params = {"user_id": self.id}
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=header, params=params) as r:
+        online_streams = await self.get_online_streams(
+            [self], client_id=self._client_id, bearer=self._bearer, session=self._session
+        )
+        if self not in online_streams:
+            raise OfflineStream()
+        return online_streams[self]
+
+    @staticmethod
+    async def _helix_get(
+        session: Optional[aiohttp.ClientSession],
+        url: str,
+        headers: Dict[str, str],
+        params: List[Tuple[str, str]],
+    ) -> Dict[str, Any]:
+        """Make a request to Twitch's Helix API and return its JSON response.
+
+        If the rate limit is exhausted, this waits until it resets
+        before returning, or before retrying if the request was rejected.
+        """
+        for attempt in range(2):
+            async with http_get(session, url, headers=headers, params=params) as r:
                 data = await r.json(encoding="utf-8")
-        if r.status == 200:
-            if not data["data"]:
-                raise OfflineStream()
-            self.name = data["data"][0]["user_name"]
-            data = data["data"][0]
-            data["game_name"] = None
-            data["followers"] = None
-            data["view_count"] = None
-            data["profile_image_url"] = None
-            data["login"] = None
-
-            game_id = data["game_id"]
-            if game_id:
-                params = {"id": game_id}
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        "https://api.twitch.tv/helix/games", headers=header, params=params
-                    ) as r:
-                        game_data = await r.json(encoding="utf-8")
-                if game_data:
-                    game_data = game_data["data"][0]
-                    data["game_name"] = game_data["name"]
-            params = {"to_id": self.id}
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    "https://api.twitch.tv/helix/users/follows", headers=header, params=params
-                ) as r:
-                    user_data = await r.json(encoding="utf-8")
-            if user_data:
-                followers = user_data["total"]
-                data["followers"] = followers
-
-            params = {"id": self.id}
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    "https://api.twitch.tv/helix/users", headers=header, params=params
-                ) as r:
-                    user_profile_data = await r.json(encoding="utf-8")
-            if user_profile_data:
-                profile_image_url = user_profile_data["data"][0]["profile_image_url"]
-                data["profile_image_url"] = profile_image_url
-                data["view_count"] = user_profile_data["data"][0]["view_count"]
-                data["login"] = user_profile_data["data"][0]["login"]
-
-            is_rerun = False
-            return self.make_embed(data), is_rerun
-        elif r.status == 400:
+                status = r.status
+                remaining = r.headers.get("Ratelimit-Remaining")
+                reset = r.headers.get("Ratelimit-Reset")
+            retry_after = None
+            if remaining == "0" and reset is not None:
+                retry_after = min(max(int(reset) - time.time(), 0), 60)
+            if status == 429 and attempt == 1:
+                raise RateLimited(retry_after)
+            if retry_after is not None:
+                log.debug("Twitch rate limit exhausted, waiting %.1f seconds.", retry_after)
+                await asyncio.sleep(retry_after)
+            if status != 429:
+                break
+
+        if status == 200:
+            return data
+        elif status in (400, 401):
             raise InvalidTwitchCredentials()
-        elif r.status == 404:
+        elif status == 404:
             raise StreamNotFound()
         else:
             raise APIError()
 
+    @classmethod
+    async def get_online_streams(
+        cls,
+        streams: List["TwitchStream"],
+        *,
+        client_id: Optional[str],
+        bearer: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> Dict["TwitchStream", Tuple[Optional[discord.Embed], bool]]:
+        """Check which of the given streams are online.
+
+        Up to 100 streams are checked with a single request,
+        which makes this much cheaper than checking each stream separately.
+
+        Streams which don't have an ID yet are looked up by name,
+        streams which can't be found are considered offline.
+
+        The details shown in the embed are only fetched for streams
+        which haven't been announced yet, the others get ``None`` instead of an embed.
+
+        Parameters
+        ----------
+        streams : List[TwitchStream]
+            The streams to check.
+        client_id : Optional[str]
+            The Client ID used to authenticate the requests.
+        bearer : Optional[str]
+            The OAuth token used to authenticate the requests.
+        session : Optional[aiohttp.ClientSession]
+            The session used to make the requests.
+
+        Returns
+        -------
+        Dict[TwitchStream, Tuple[Optional[discord.Embed], bool]]
+            A mapping of the online streams to their embed and whether they're a rerun.
+
+        Raises
+        ------
+        InvalidTwitchCredentials
+            The given credentials are invalid.
+        RateLimited
+            Twitch's rate limit was exceeded.
+        APIError
+            Twitch's API returned an unexpected response.
+        """
+        headers = {"Client-ID": str(client_id)}
+        if bearer is not None:
+            headers["Authorization"] = f"Bearer {bearer}"
+
+        async def get_all(
+            url: str, key: str, values: Iterable[str], *extra_params: Tuple[str, str]
+        ) -> List[Dict[str, Any]]:
+            ret = []
+            for chunk in chunks(list(dict.fromkeys(values)), TWITCH_MAX_IDS_PER_REQUEST):
+                params = [(key, value) for value in chunk]
+                params.extend(extra_params)
+                ret.extend((await cls._helix_get(session, url, headers, params))["data"])
+            return ret
+
+        users: Dict[str, Dict[str, Any]] = {}
+        missing_ids = [stream.name for stream in streams if not stream.id and stream.name]
+        if missing_ids:
+            found = {}
+            for user in await get_all(TWITCH_ID_ENDPOINT, "login", missing_ids):
+                users[user["id"]] = user
+                found[user["login"].lower()] = user["id"]
+            for stream in streams:
+                if not stream.id and stream.name:
+                    stream.id = found.get(stream.name.lower())
+
+        live_streams = {
+            data["user_id"]: data
+            for data in await get_all(
+                TWITCH_STREAMS_ENDPOINT,
+                "user_id",
+                (s.id for s in streams if s.id),
+                ("first", str(TWITCH_MAX_IDS_PER_REQUEST)),
+            )
+        }
+        if not live_streams:
+            return {}
+
+        # Streams which were already announced don't need an embed
+        new_ids = list(
+            dict.fromkeys(s.id for s in streams if s.id in live_streams and not s._messages_cache)
+        )
+        missing_users = [user_id for user_id in new_ids if user_id not in users]
+        for user in await get_all(TWITCH_ID_ENDPOINT, "id", missing_users):
+            users[user["id"]] = user
+        games = {
+            game["id"]: game
+            for game in await get_all(
+                TWITCH_GAMES_ENDPOINT,
+                "id",
+                (
+                    live_streams[user_id]["game_id"]
+                    for user_id in new_ids
+                    if live_streams[user_id]["game_id"]
+                ),
+            )
+        }
+        # Helix can't get the follower count of multiple users at once.
+        follows = await bounded_gather(
+            *(
+                cls._helix_get(session, TWITCH_FOLLOWS_ENDPOINT, headers, [("to_id", user_id)])
+                for user_id in new_ids
+            ),
+            limit=TWITCH_FOLLOWS_CONCURRENCY,
+        )
+        followers = {user_id: data["total"] for user_id, data in zip(new_ids, follows)}
+
+        ret = {}
+        for stream in streams:
+            data = live_streams.get(stream.id)
+            if data is None:
+                continue
+            stream.name = data["user_name"]
+            if stream._messages_cache:
+                ret[stream] = (None, False)
+                continue
+            data = dict(data)
+            user = users.get(stream.id, {})
+            game = games.get(data["game_id"], {})
+            data["game_name"] = game.get("name")
+            data["followers"] = followers.get(stream.id)
+            data["view_count"] = user.get("view_count")
+            data["profile_image_url"] = user.get("profile_image_url")
+            data["login"] = user.get("login")
+            is_rerun = False
+            ret[stream] = (stream.make_embed(data), is_rerun)
+        return ret
+
     async def fetch_id(self):
         header = {"Client-ID": str(self._client_id)}
         if self._bearer is not None:
@@ -285,9 +478,8 @@ class TwitchStream(Stream):
         url = TWITCH_ID_ENDPOINT
         params = {"login": self.name}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=header, params=params) as r:
-                data = await r.json()
+        async with self._get(url, headers=header, params=params) as r:
+            data = await r.json()
 
         if r.status == 200:
             if not data["data"]:
@@ -333,10 +525,9 @@ class HitboxStream(Stream):
     async def is_online(self):
         url = "https://api.smashcast.tv/media/live/" + self.name
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as r:
-                # data = await r.json(encoding='utf-8')
-                data = await r.text()
+        async with self._get(url) as r:
+            # data = await r.json(encoding='utf-8')
+            data = await r.text()
         data = json.loads(data, strict=False)
         if "livestream" not in data:
             raise StreamNotFound()
@@ -372,9 +563,8 @@ class PicartoStream(Stream):
     async def is_online(self):
         url = "https://api.picarto.tv/v1/channel/name/" + self.name
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as r:
-                data = await r.text(encoding="utf-8")
+        async with self._get(url) as r:
+            data = await r.text(encoding="utf-8")
         if r.status == 200:
             data = json.loads(data)
             if data["online"] is True:
@@ -6,7 +6,6 @@ from collections import Counter
 from typing import List, Literal
 
 import io
-import yaml
 import discord
 
 from redbot.core import Config, commands, checks
@@ -243,6 +242,8 @@ class Trivia(commands.Cog):
     @triviaset_custom.command(name="upload", aliases=["add"])
     async def trivia_upload(self, ctx: commands.Context):
         """Upload a trivia file."""
+        import yaml
+
         if not ctx.message.attachments:
             await ctx.send(_("Supply a file with next message or type anything to cancel."))
             try:
@@ -598,6 +599,8 @@ class Trivia(commands.Cog):
             A dict mapping questions (`str`) to answers (`list` of `str`).
 
         """
+        import yaml
+
         try:
             path = next(p for p in self._all_lists() if p.stem == category)
         except StopIteration:
@@ -670,6 +673,8 @@ class Trivia(commands.Cog):
                 await ctx.send(_("I am not replacing the existing file."))
                 return
 
+        import yaml
+
         buffer = io.BytesIO(await attachment.read())
         yaml.safe_load(buffer)
         buffer.seek(0)
@@ -3,7 +3,7 @@ import contextlib
 from datetime import timezone
 from collections import namedtuple
 from copy import copy
-from typing import Union, Optional, Literal
+from typing import Union, Optional, Literal, Set
 
 import discord
 
@@ -54,6 +54,14 @@ class Warnings(commands.Cog):
         *,
         requester: Literal["discord_deleted_user", "owner", "user", "user_strict"],
         user_id: int,
+    ):
+        await self.red_delete_data_for_users(requester=requester, user_ids={user_id})
+
+    async def red_delete_data_for_users(
+        self,
+        *,
+        requester: Literal["discord_deleted_user", "owner", "user", "user_strict"],
+        user_ids: Set[int],
     ):
         if requester != "discord_deleted_user":
             return
@@ -67,10 +75,12 @@ class Warnings(commands.Cog):
             if not c % 100:
                 await asyncio.sleep(0)
 
-            if user_id in guild_data:
+            for user_id in user_ids.intersection(guild_data):
                 await self.config.member_from_ids(guild_id, user_id).clear()
 
             for remaining_user, user_warns in guild_data.items():
+                if remaining_user in user_ids:
+                    continue
                 c += 1
                 if not c % 100:
                     await asyncio.sleep(0)
@@ -80,7 +90,7 @@ class Warnings(commands.Cog):
                     if not c % 100:
                         await asyncio.sleep(0)
 
-                    if warning.get("mod", 0) == user_id:
+                    if warning.get("mod", 0) in user_ids:
                         grp = self.config.member_from_ids(guild_id, remaining_user)
                         await grp.set_raw("warnings", warn_id, "mod", value=0xDE1)
 
@@ -0,0 +1,202 @@
+import contextlib
+import json
+import sys
+import threading
+import time
+from importlib.abc import MetaPathFinder
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+__all__ = ["StartupTracer", "startup_tracer"]
+
+
+class PhaseTiming(NamedTuple):
+    name: str
+    wall: float
+    cpu: float
+
+
+class _ImportTimer(MetaPathFinder):
+    """
+    Import time recorder, similar to ``python -X importtime``.
+
+    This class sits at the front of `sys.meta_path` and wraps the ``exec_module``
+    method of the loaders found by the other finders to time execution of the imported
+    modules. The loaders themselves are left in place, as e.g. ``pkg_resources``
+    looks up its providers by the loader's type.
+    """
+
+    def __init__(self) -> None:
+        # module name -> (self time, cumulative time)
+        self.imports: Dict[str, List[float]] = {}
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None:
+                self._wrap_exec_module(spec.loader)
+            return spec
+        return None
+
+    def _wrap_exec_module(self, loader: Any) -> None:
+        # Loaders which are classes (e.g. for built-in modules) are shared by many modules
+        # and loaders which are shared instances are only wrapped once.
+        if isinstance(loader, type) or "exec_module" in getattr(loader, "__dict__", {}):
+            return
+        exec_module = getattr(loader, "exec_module", None)
+        if exec_module is None:
+            return
+
+        def timed_exec_module(module) -> None:
+            with self.timed(module.__name__):
+                exec_module(module)
+
+        try:
+            loader.exec_module = timed_exec_module
+        except AttributeError:
+            # loaders without a `__dict__` can't be timed
+            pass
+
+    @contextlib.contextmanager
+    def timed(self, name: str) -> Iterator[None]:
+        # each entry is the time spent importing the children of a module being imported
+        stack = self._local.__dict__.setdefault("stack", [])
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            self.imports[name] = [elapsed - children, elapsed]
+
+
+class StartupTracer:
+    """
+    Records the wall-clock and CPU time of Red's startup phases.
+
+    CPU time is the CPU time of the whole process during the phase,
+    so it also includes the work of phases which run concurrently with it.
+
+    The tracer does nothing until it's enabled.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.finished = False
+        self.phases: List[PhaseTiming] = []
+        self.cogs: List[PhaseTiming] = []
+        self._started: Dict[str, Tuple[float, float]] = {}
+        self._start_time = 0.0
+        self._total: Optional[PhaseTiming] = None
+        self._import_timer: Optional[_ImportTimer] = None
+
+    def enable(self, *, import_times: bool = False) -> None:
+        """
+        Enable the tracer.
+
+        Parameters
+        ----------
+        import_times : bool
+            Whether to also record the time spent importing each module.
+            Only imports which happen after this is called are recorded.
+        """
+        self.enabled = True
+        self._start_time = time.perf_counter()
+        if import_times and self._import_timer is None:
+            self._import_timer = _ImportTimer()
+            sys.meta_path.insert(0, self._import_timer)
+
+    def begin(self, name: str) -> None:
+        """Mark the start of the given phase."""
+        if self.enabled and not self.finished:
+            self._started[name] = (time.perf_counter(), time.process_time())
+
+    def end(self, name: str) -> None:
+        """Mark the end of the given phase."""
+        try:
+            wall_start, cpu_start = self._started.pop(name)
+        except KeyError:
+            return
+        self.phases.append(
+            PhaseTiming(name, time.perf_counter() - wall_start, time.process_time() - cpu_start)
+        )
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Context manager recording the time spent in the given phase."""
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    @contextlib.contextmanager
+    def cog_setup(self, name: str) -> Iterator[None]:
+        """Context manager recording the time spent loading the given package.
+
+        Times recorded for the same package are added together.
+        """
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            if self.enabled and not self.finished:
+                wall = time.perf_counter() - wall_start
+                cpu = time.process_time() - cpu_start
+                for idx, timing in enumerate(self.cogs):
+                    if timing.name == name:
+                        self.cogs[idx] = PhaseTiming(name, timing.wall + wall, timing.cpu + cpu)
+                        break
+                else:
+                    self.cogs.append(PhaseTiming(name, wall, cpu))
+
+    def finish(self) -> None:
+        """Stop recording, this should be called once the bot is ready."""
+        if not self.enabled or self.finished:
+            return
+        self.finished = True
+        self._total = PhaseTiming(
+            "total", time.perf_counter() - self._start_time, time.process_time()
+        )
+        if self._import_timer is not None:
+            with contextlib.suppress(ValueError):
+                sys.meta_path.remove(self._import_timer)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the recorded timings as a JSON serializable dict."""
+        ret: Dict[str, Any] = {
+            "total": self._total._asdict() if self._total is not None else None,
+            "phases": [p._asdict() for p in self.phases],
+            "cogs": [c._asdict() for c in sorted(self.cogs, key=lambda c: -c.wall)],
+        }
+        if self._import_timer is not None:
+            packages: Dict[str, float] = {}
+            for module_name, (self_time, __) in self._import_timer.imports.items():
+                top_level = module_name.partition(".")[0]
+                packages[top_level] = packages.get(top_level, 0.0) + self_time
+            ret["imports"] = {
+                "packages": dict(sorted(packages.items(), key=lambda i: -i[1])),
+                "modules": {
+                    name: {"self": self_time, "cumulative": cumulative}
+                    for name, (self_time, cumulative) in sorted(
+                        self._import_timer.imports.items(), key=lambda i: -i[1][1]
+                    )
+                },
+            }
+        return ret
+
+    def dump(self, path: Path) -> None:
+        """Write the recorded timings to the given path as JSON."""
+        with path.open("w", encoding="utf-8") as fs:
+            json.dump(self.to_dict(), fs, indent=4)
+
+
+startup_tracer = StartupTracer()
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import contextlib
 import logging
 from datetime import datetime, timezone
-from typing import Union, List, Optional, TYPE_CHECKING, Literal
-from functools import wraps
+from typing import Dict, Iterator, Union, List, Optional, Set, Tuple, TYPE_CHECKING, Literal
+from functools import partial, wraps
 
 import discord
 
@@ -28,6 +30,8 @@ __all__ = [
     "deposit_credits",
     "can_spend",
     "transfer_credits",
+    "transaction",
+    "Transaction",
     "wipe_bank",
     "get_account",
     "is_global",
@@ -76,8 +80,88 @@ log = logging.getLogger("red.core.bank")
 _data_deletion_lock = asyncio.Lock()
 
 
+class _LeaderboardIndex:
+    """Balances of all accounts in a single bank scope, kept in leaderboard order.
+
+    Accounts are stored in a list sorted by ``(-balance, user_id)``, which makes
+    looking up an account's rank a binary search and top-k queries a slice.
+    """
+
+    def __init__(self):
+        self._ranked: List[Tuple[int, int]] = []
+        self._balances: Dict[int, int] = {}
+        # IDs updated while the index was still loading, these must not be
+        # overwritten with the (possibly stale) data read from config.
+        self._touched: Optional[Set[int]] = set()
+        self._loaded = asyncio.Event()
+
+    def load(self, accounts: dict) -> None:
+        for user_id, account in accounts.items():
+            if user_id not in self._touched:
+                self._set(user_id, account["balance"])
+        self._touched = None
+        self._loaded.set()
+
+    async def wait_until_loaded(self) -> None:
+        await self._loaded.wait()
+
+    def set(self, user_id: int, balance: int) -> None:
+        if self._touched is not None:
+            self._touched.add(user_id)
+        self._set(user_id, balance)
+
+    def remove(self, user_id: int) -> None:
+        if self._touched is not None:
+            self._touched.add(user_id)
+        self._discard(user_id)
+
+    def rank(self, user_id: int) -> Optional[int]:
+        balance = self._balances.get(user_id)
+        if balance is None:
+            return None
+        return bisect.bisect_left(self._ranked, (-balance, user_id)) + 1
+
+    def __iter__(self) -> Iterator[int]:
+        return (user_id for __, user_id in self._ranked)
+
+    def _set(self, user_id: int, balance: int) -> None:
+        self._discard(user_id)
+        self._balances[user_id] = balance
+        bisect.insort(self._ranked, (-balance, user_id))
+
+    def _discard(self, user_id: int) -> None:
+        old_balance = self._balances.pop(user_id, None)
+        if old_balance is not None:
+            del self._ranked[bisect.bisect_left(self._ranked, (-old_balance, user_id))]
+
+
+# Keyed by guild ID for local banks and None for the global bank.
+_leaderboard_indexes: Dict[Optional[int], _LeaderboardIndex] = {}
+
+
+async def _get_leaderboard_index(guild: Optional[discord.Guild]) -> _LeaderboardIndex:
+    key = guild.id if guild is not None else None
+    index = _leaderboard_indexes.get(key)
+    if index is None:
+        index = _leaderboard_indexes[key] = _LeaderboardIndex()
+        try:
+            if guild is None:
+                accounts = await _config.all_users()
+            else:
+                accounts = await _config.all_members(guild)
+        except BaseException:
+            if _leaderboard_indexes.get(key) is index:
+                del _leaderboard_indexes[key]
+            raise
+        index.load(accounts)
+    else:
+        await index.wait_until_loaded()
+    return index
+
+
 async def _init():
     global _config
+    _leaderboard_indexes.clear()
     _config = Config.get_conf(None, 384734293238749, cog_name="Bank", force_registration=True)
     _config.register_global(**_DEFAULT_GLOBAL)
     _config.register_guild(**_DEFAULT_GUILD)
@@ -130,6 +214,17 @@ async def _process_data_deletion(
     if the user doesn't want it kept,
     we won't special case any request type
     """
+    await _process_bulk_data_deletion(requester=requester, user_ids={user_id})
+
+
+async def _process_bulk_data_deletion(
+    *,
+    requester: Literal["discord_deleted_user", "owner", "user", "user_strict"],
+    user_ids: Set[int],
+):
+    """
+    Same as `_process_data_deletion`, for many users at once.
+    """
     if requester not in ("discord_deleted_user", "owner", "user", "user_strict"):
         log.warning(
             "Got unknown data request type `{req_type}` for user, deleting anyway",
@@ -137,11 +232,15 @@ async def _process_data_deletion(
         )
 
     async with _data_deletion_lock:
-        await _config.user_from_id(user_id).clear()
-        all_members = await _config.all_members()
-        async for guild_id, member_dict in AsyncIter(all_members.items(), steps=100):
-            if user_id in member_dict:
+        async for user_id in AsyncIter(user_ids, steps=100):
+            await _config.user_from_id(user_id).clear()
+        member_guilds = await _config.guilds_with_member_data(user_ids)
+        async for user_id, guild_ids in AsyncIter(member_guilds.items(), steps=100):
+            for guild_id in guild_ids:
                 await _config.member_from_ids(guild_id, user_id).clear()
+        for index in _leaderboard_indexes.values():
+            for user_id in user_ids:
+                index.remove(user_id)
 
 
 class Account:
@@ -277,6 +376,18 @@ async def set_balance(member: Union[discord.Member, discord.User], amount: int)
         If the amount is not an `int`.
 
     """
+    async with (await _get_account_group(member)).get_lock():
+        return await _set_balance(member, amount)
+
+
+async def _get_account_group(member: Union[discord.Member, discord.User]):
+    if await is_global():
+        return _config.user(member)
+    return _config.member(member)
+
+
+async def _set_balance(member: Union[discord.Member, discord.User], amount: int) -> int:
+    # Callers must hold the account's lock.
     if not isinstance(amount, int):
         raise TypeError("Amount must be of type int, not {}.".format(type(amount)))
     if amount < 0:
@@ -290,9 +401,16 @@ async def set_balance(member: Union[discord.Member, discord.User], amount: int)
         )
     if await is_global():
         group = _config.user(member)
+        index_key = None
     else:
         group = _config.member(member)
+        index_key = member.guild.id
     await group.balance.set(amount)
+    # The index may have been built while the balance was being written,
+    # so it's looked up afterwards.
+    index = _leaderboard_indexes.get(index_key)
+    if index is not None:
+        index.set(member.id, amount)
 
     if await group.created_at() == 0:
         time = _encoded_current_time()
@@ -341,16 +459,17 @@ async def withdraw_credits(member: discord.Member, amount: int) -> int:
             )
         )
 
-    bal = await get_balance(member)
-    if amount > bal:
-        raise ValueError(
-            "Insufficient funds {} > {}".format(
-                humanize_number(amount, override_locale="en_US"),
-                humanize_number(bal, override_locale="en_US"),
+    async with (await _get_account_group(member)).get_lock():
+        bal = await get_balance(member)
+        if amount > bal:
+            raise ValueError(
+                "Insufficient funds {} > {}".format(
+                    humanize_number(amount, override_locale="en_US"),
+                    humanize_number(bal, override_locale="en_US"),
+                )
             )
-        )
 
-    return await set_balance(member, bal - amount)
+        return await _set_balance(member, bal - amount)
 
 
 async def deposit_credits(member: discord.Member, amount: int) -> int:
@@ -385,8 +504,9 @@ async def deposit_credits(member: discord.Member, amount: int) -> int:
             )
         )
 
-    bal = await get_balance(member)
-    return await set_balance(member, amount + bal)
+    async with (await _get_account_group(member)).get_lock():
+        bal = await get_balance(member)
+        return await _set_balance(member, amount + bal)
 
 
 async def transfer_credits(
@@ -430,17 +550,258 @@ async def transfer_credits(
                 humanize_number(amount, override_locale="en_US")
             )
         )
-    guild = getattr(to, "guild", None)
-    max_bal = await get_max_balance(guild)
+    async with transaction() as txn:
+        return await txn.transfer_credits(from_, to, amount)
 
-    if await get_balance(to) + amount > max_bal:
-        currency = await get_currency_name(guild)
-        raise errors.BalanceTooHigh(
-            user=to.display_name, max_balance=max_bal, currency_name=currency
-        )
 
-    await withdraw_credits(from_, amount)
-    return await deposit_credits(to, amount)
+class _StagedAccount:
+    __slots__ = ("member", "group", "original", "balance", "absolute")
+
+    def __init__(self, member: Union[discord.Member, discord.User], group, balance: int):
+        self.member = member
+        self.group = group
+        self.original = balance
+        self.balance = balance
+        # Whether the balance was set outright, rather than changed by an amount.
+        self.absolute = False
+
+
+class Transaction:
+    """Balance changes to multiple accounts, written to the bank all at once.
+
+    Changes are only staged by this object's methods, and are validated
+    and persisted in a single write when the ``async with`` block exits.
+    If the block raises, nothing is written.
+
+    The accounts are read again on exit while holding their locks, so
+    credits withdrawn or deposited in the transaction are applied on top
+    of any changes made to those accounts in the meantime. Balances set
+    with `set_balance` replace them.
+
+    This should only be created through `bank.transaction() <transaction>`.
+    """
+
+    def __init__(self):
+        self._is_global: Optional[bool] = None
+        self._staged: Dict[Tuple[Optional[int], int], _StagedAccount] = {}
+
+    async def __aenter__(self) -> Transaction:
+        self._is_global = await is_global()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            await self._commit()
+
+    async def _get_staged(self, member: Union[discord.Member, discord.User]) -> _StagedAccount:
+        if self._is_global:
+            key = (None, member.id)
+        else:
+            key = (member.guild.id, member.id)
+        staged = self._staged.get(key)
+        if staged is None:
+            group = _config.user(member) if self._is_global else _config.member(member)
+            __, balance = await self._read_account(group, member)
+            staged = self._staged[key] = _StagedAccount(member, group, balance)
+        return staged
+
+    async def _read_account(
+        self, group, member: Union[discord.Member, discord.User]
+    ) -> Tuple[dict, int]:
+        raw_account = await group.get_raw(default=None)
+        if raw_account is None:
+            balance = await get_default_balance(None if self._is_global else member.guild)
+            return _DEFAULT_MEMBER.copy(), balance
+        data = {**_DEFAULT_MEMBER, **raw_account}
+        return data, data["balance"]
+
+    async def get_balance(self, member: Union[discord.Member, discord.User]) -> int:
+        """Get a member's balance, including changes staged in this transaction.
+
+        Parameters
+        ----------
+        member : Union[discord.Member, discord.User]
+            The member whose balance to check.
+
+        Returns
+        -------
+        int
+            The member's balance.
+
+        """
+        return (await self._get_staged(member)).balance
+
+    async def set_balance(self, member: Union[discord.Member, discord.User], amount: int) -> int:
+        """Stage setting an account balance.
+
+        See `bank.set_balance() <set_balance>` for details. Unlike that function,
+        the maximum balance is only checked when the transaction is committed.
+        """
+        if not isinstance(amount, int):
+            raise TypeError("Amount must be of type int, not {}.".format(type(amount)))
+        if amount < 0:
+            raise ValueError("Not allowed to have negative balance.")
+        staged = await self._get_staged(member)
+        staged.balance = amount
+        staged.absolute = True
+        return amount
+
+    async def withdraw_credits(
+        self, member: Union[discord.Member, discord.User], amount: int
+    ) -> int:
+        """Stage removing a certain amount of credits from an account.
+
+        See `bank.withdraw_credits() <withdraw_credits>` for details.
+        """
+        if not isinstance(amount, int):
+            raise TypeError("Withdrawal amount must be of type int, not {}.".format(type(amount)))
+        if _invalid_amount(amount):
+            raise ValueError(
+                "Invalid withdrawal amount {} < 0".format(
+                    humanize_number(amount, override_locale="en_US")
+                )
+            )
+
+        staged = await self._get_staged(member)
+        if amount > staged.balance:
+            raise ValueError(
+                "Insufficient funds {} > {}".format(
+                    humanize_number(amount, override_locale="en_US"),
+                    humanize_number(staged.balance, override_locale="en_US"),
+                )
+            )
+
+        staged.balance -= amount
+        return staged.balance
+
+    async def deposit_credits(
+        self, member: Union[discord.Member, discord.User], amount: int
+    ) -> int:
+        """Stage adding a given amount of credits to an account.
+
+        See `bank.deposit_credits() <deposit_credits>` for details.
+        """
+        if not isinstance(amount, int):
+            raise TypeError("Deposit amount must be of type int, not {}.".format(type(amount)))
+        if _invalid_amount(amount):
+            raise ValueError(
+                "Invalid deposit amount {} <= 0".format(
+                    humanize_number(amount, override_locale="en_US")
+                )
+            )
+
+        staged = await self._get_staged(member)
+        staged.balance += amount
+        return staged.balance
+
+    async def transfer_credits(
+        self,
+        from_: Union[discord.Member, discord.User],
+        to: Union[discord.Member, discord.User],
+        amount: int,
+    ) -> int:
+        """Stage transferring a given amount of credits from one account to another.
+
+        See `bank.transfer_credits() <transfer_credits>` for details.
+        """
+        if not isinstance(amount, int):
+            raise TypeError("Transfer amount must be of type int, not {}.".format(type(amount)))
+        if _invalid_amount(amount):
+            raise ValueError(
+                "Invalid transfer amount {} <= 0".format(
+                    humanize_number(amount, override_locale="en_US")
+                )
+            )
+
+        await self.withdraw_credits(from_, amount)
+        return await self.deposit_credits(to, amount)
+
+    async def _commit(self) -> None:
+        if not self._staged:
+            return
+
+        # Locks are always taken in the same order, so that two transactions
+        # sharing accounts can't wait on each other.
+        keys = sorted(self._staged)
+        async with contextlib.AsyncExitStack() as stack:
+            for key in keys:
+                await stack.enter_async_context(self._staged[key].group.get_lock())
+            await self._write(keys)
+
+    async def _write(self, keys: List[Tuple[Optional[int], int]]) -> None:
+        max_balances: Dict[Optional[int], int] = {}
+        now = _encoded_current_time()
+        to_write = []
+        for key in keys:
+            guild_id = key[0]
+            staged = self._staged[key]
+            data, current = await self._read_account(staged.group, staged.member)
+            if not staged.absolute:
+                if current < staged.original - staged.balance:
+                    raise ValueError(
+                        "Insufficient funds {} > {}".format(
+                            humanize_number(
+                                staged.original - staged.balance, override_locale="en_US"
+                            ),
+                            humanize_number(current, override_locale="en_US"),
+                        )
+                    )
+                staged.balance = current + staged.balance - staged.original
+                staged.original = current
+
+            if guild_id not in max_balances:
+                guild = None if guild_id is None else staged.member.guild
+                max_balances[guild_id] = await get_max_balance(guild)
+            max_bal = max_balances[guild_id]
+            if staged.balance > max_bal:
+                guild = None if guild_id is None else staged.member.guild
+                currency = await get_currency_name(guild)
+                raise errors.BalanceTooHigh(
+                    user=staged.member.display_name, max_balance=max_bal, currency_name=currency
+                )
+
+            data["balance"] = staged.balance
+            if data["created_at"] == 0:
+                data["created_at"] = now
+            if data["name"] == "":
+                data["name"] = staged.member.display_name
+            to_write.append((staged.group.identifier_data, data))
+
+        await _config.driver.set_many(to_write)
+        for identifier_data, value in to_write:
+            _config._track_member_write(identifier_data, value)
+
+        for (guild_id, user_id), staged in self._staged.items():
+            index = _leaderboard_indexes.get(guild_id)
+            if index is not None:
+                index.set(user_id, staged.balance)
+
+
+def transaction() -> Transaction:
+    """Stage balance changes to multiple accounts and write them all at once.
+
+    This is meant to be used as an async context manager. Staged changes
+    only become visible to the rest of the bank once the block exits,
+    at which point maximum balances are checked and all changed accounts
+    are saved in a single write. If the block raises (including
+    `BalanceTooHigh` from the checks on exit), nothing is saved.
+
+    Example
+    -------
+    ::
+
+        async with bank.transaction() as txn:
+            await txn.withdraw_credits(buyer, price)
+            await txn.deposit_credits(seller, price - fee)
+            await txn.deposit_credits(ctx.guild.owner, fee)
+
+    Returns
+    -------
+    Transaction
+        The transaction, to be entered with ``async with``.
+
+    """
+    return Transaction()
 
 
 async def wipe_bank(guild: Optional[discord.Guild] = None) -> None:
@@ -455,8 +816,13 @@ async def wipe_bank(guild: Optional[discord.Guild] = None) -> None:
     """
     if await is_global():
         await _config.clear_all_users()
+        _leaderboard_indexes.pop(None, None)
     else:
         await _config.clear_all_members(guild)
+        if guild is None:
+            _leaderboard_indexes.clear()
+        else:
+            _leaderboard_indexes.pop(guild.id, None)
 
 
 async def bank_prune(bot: Red, guild: discord.Guild = None, user_id: int = None) -> None:
@@ -519,6 +885,9 @@ async def bank_prune(bot: Red, guild: discord.Guild = None, user_id: int = None)
             if user_id in bank_data:
                 del bank_data[user_id]
 
+    # pruning works on the raw data, the index will be rebuilt on next use
+    _leaderboard_indexes.pop(None if global_bank else guild.id, None)
+
 
 async def get_leaderboard(positions: int = None, guild: discord.Guild = None) -> List[tuple]:
     """
@@ -544,21 +913,34 @@ async def get_leaderboard(positions: int = None, guild: discord.Guild = None) ->
 
     """
     if await is_global():
-        raw_accounts = await _config.all_users()
-        if guild is not None:
-            tmp = raw_accounts.copy()
-            for acc in tmp:
-                if not guild.get_member(acc):
-                    del raw_accounts[acc]
+        index = await _get_leaderboard_index(None)
+        if positions is None:
+            raw_accounts = await _config.all_users()
+        get_group = _config.user_from_id
     else:
         if guild is None:
             raise TypeError("Expected a guild, got NoneType object instead!")
-        raw_accounts = await _config.all_members(guild)
-    sorted_acc = sorted(raw_accounts.items(), key=lambda x: x[1]["balance"], reverse=True)
-    if positions is None:
-        return sorted_acc
-    else:
-        return sorted_acc[:positions]
+        index = await _get_leaderboard_index(guild)
+        if positions is None:
+            raw_accounts = await _config.all_members(guild)
+        get_group = partial(_config.member_from_ids, guild.id)
+        # members of a local bank are all in the guild already
+        guild = None
+
+    sorted_acc = []
+    for user_id in index:
+        if positions is not None and len(sorted_acc) >= positions:
+            break
+        if guild is not None and not guild.get_member(user_id):
+            continue
+        if positions is None:
+            raw_account = raw_accounts.get(user_id)
+            if raw_account is None:
+                continue
+        else:
+            raw_account = await get_group(user_id).all()
+        sorted_acc.append((user_id, raw_account))
+    return sorted_acc
 
 
 async def get_leaderboard_position(
@@ -585,18 +967,12 @@ async def get_leaderboard_position(
     """
     if await is_global():
         guild = None
+    elif hasattr(member, "guild"):
+        guild = member.guild
     else:
-        guild = member.guild if hasattr(member, "guild") else None
-    try:
-        leaderboard = await get_leaderboard(None, guild)
-    except TypeError:
-        raise
-    else:
-        pos = discord.utils.find(lambda x: x[1][0] == member.id, enumerate(leaderboard, 1))
-        if pos is None:
-            return None
-        else:
-            return pos[0]
+        raise TypeError("Expected a guild, got NoneType object instead!")
+    index = await _get_leaderboard_index(guild)
+    return index.rank(member.id)
 
 
 async def get_account(member: Union[discord.Member, discord.User]) -> Account:
@@ -616,18 +992,20 @@ async def get_account(member: Union[discord.Member, discord.User]) -> Account:
 
     """
     if await is_global():
-        all_accounts = await _config.all_users()
+        group = _config.user(member)
     else:
-        all_accounts = await _config.all_members(member.guild)
+        group = _config.member(member)
 
-    if member.id not in all_accounts:
+    # Only read this one account, `default=None` tells us whether it exists at all
+    raw_account = await group.get_raw(default=None)
+    if raw_account is None:
         acc_data = {"name": member.display_name, "created_at": _DEFAULT_MEMBER["created_at"]}
         try:
             acc_data["balance"] = await get_default_balance(member.guild)
         except AttributeError:
             acc_data["balance"] = await get_default_balance()
     else:
-        acc_data = all_accounts[member.id]
+        acc_data = {**_DEFAULT_MEMBER, **raw_account}
 
     acc_data["created_at"] = _decode_time(acc_data["created_at"])
     return Account(**acc_data)
@@ -677,6 +1055,7 @@ async def set_global(global_: bool) -> bool:
         await _config.clear_all_members()
 
     await _config.is_global.set(global_)
+    _leaderboard_indexes.clear()
     return global_
 
 
@@ -5,10 +5,13 @@ import os
 import platform
 import shutil
 import sys
+import time
 import contextlib
+import contextvars
+import json
 import weakref
 import functools
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 from datetime import datetime
 from enum import IntEnum
 from importlib.machinery import ModuleSpec
@@ -28,7 +31,7 @@ from typing import (
     MutableMapping,
     overload,
 )
-from types import MappingProxyType
+from types import MappingProxyType, ModuleType
 
 import discord
 from discord.ext import commands as dpy_commands
@@ -44,12 +47,14 @@ from .global_checks import init_global_checks
 from .settings_caches import (
     PrefixManager,
     IgnoreManager,
+    AutoImmuneManager,
     WhitelistBlacklistManager,
     DisabledCogCache,
     I18nManager,
 )
 from .rpc import RPCMixin
-from .utils import common_filters, AsyncIter
+from ._startup_tracer import startup_tracer
+from .utils import common_filters, deduplicate_iterables
 from .utils._internal_utils import send_to_owners_with_prefix_replaced
 
 CUSTOM_GROUPS = "CUSTOM_GROUPS"
@@ -57,12 +62,19 @@ SHARED_API_TOKENS = "SHARED_API_TOKENS"
 
 log = logging.getLogger("red")
 
-__all__ = ["RedBase", "Red", "ExitCodes"]
+__all__ = ["RedBase", "Red", "ExitCodes", "MessageContext"]
 
 NotMessage = namedtuple("NotMessage", "guild")
 
 DataDeletionResults = namedtuple("DataDeletionResults", "failed_modules failed_cogs unhandled")
 
+# How long to wait for more Discord deletion requests before handling them together
+DELETION_BATCH_WINDOW = 5.0
+# Packages loaded before the others during startup, each group waits for the previous one
+PRIORITY_PACKAGES = (("permissions",),)
+# Maximum number of packages loaded at the same time during startup
+STARTUP_LOAD_CONCURRENCY = 16
+
 PreInvokeCoroutine = Callable[[commands.Context], Awaitable[Any]]
 T_BIC = TypeVar("T_BIC", bound=PreInvokeCoroutine)
 
@@ -71,6 +83,141 @@ def _is_submodule(parent, child):
     return parent == child or child.startswith(parent + ".")
 
 
+class _StagedSetup:
+    """Cogs and commands added by a package's setup while packages are loaded at startup."""
+
+    __slots__ = ("registrations", "committed")
+
+    def __init__(self) -> None:
+        self.registrations: List[Tuple[Callable[[Any], None], Any]] = []
+        self.committed = False
+
+
+# Set while a package is set up at startup, see `RedBase._load_packages_at_startup`
+_staged_setup: contextvars.ContextVar[Optional[_StagedSetup]] = contextvars.ContextVar(
+    "_staged_setup", default=None
+)
+
+
+async def _delete_data_for_each_user(
+    handler: Callable[..., Awaitable[Any]],
+    *,
+    requester: Literal["discord_deleted_user", "owner", "user", "user_strict"],
+    user_ids: Set[int],
+):
+    for user_id in user_ids:
+        await handler(requester=requester, user_id=user_id)
+
+
+class MessageContext:
+    """
+    Results of checks commonly made by listeners handling a message.
+
+    Get this with `Red.get_message_context`. The same object is shared by
+    every listener handling the same message, and each value is only
+    worked out the first time a listener asks for it,
+    so the cost of these checks doesn't grow with the number of loaded cogs.
+
+    Attributes
+    ----------
+    message: discord.Message
+        The message this is for.
+    prefix: Optional[str]
+        The prefix the message was invoked with, if any. This is only known
+        once the message has been processed for commands, and may not be
+        known to ``on_message`` listeners. Use `get_prefix` to work it out
+        when it isn't known.
+    """
+
+    __slots__ = (
+        "bot",
+        "message",
+        "_prefix",
+        "_prefix_known",
+        "_locales",
+        "_mod_or_superior",
+        "_automod_immune",
+    )
+
+    def __init__(self, bot: "RedBase", message: discord.Message):
+        self.bot = bot
+        self.message = message
+        self._prefix: Optional[str] = None
+        self._prefix_known = False
+        self._locales: Optional[tuple] = None
+        self._mod_or_superior: Optional[bool] = None
+        self._automod_immune: Optional[bool] = None
+
+    @property
+    def prefix(self) -> Optional[str]:
+        return self._prefix
+
+    @prefix.setter
+    def prefix(self, value: Optional[str]) -> None:
+        self._prefix = value
+        self._prefix_known = True
+
+    async def get_prefix(self) -> Optional[str]:
+        """
+        Get the prefix the message was invoked with, if any.
+
+        This is the `prefix` found while processing the message for commands.
+        If it isn't known, e.g. because this context was evicted from the bot's cache
+        before a listener got to it, it's worked out with `Red.get_context`.
+        """
+        if not self._prefix_known:
+            self.prefix = (await self.bot.get_context(self.message)).prefix
+        return self._prefix
+
+    async def set_contextual_locales(self) -> None:
+        """
+        Set the contextual locales for the message's guild.
+
+        Like `i18n.set_contextual_locales_from_guild`,
+        this must be called in each listener, as contextual locales are per task.
+        """
+        if self._locales is None:
+            guild = self.message.guild
+            self._locales = (
+                await i18n.get_locale_from_guild(self.bot, guild),
+                await i18n.get_regional_format_from_guild(self.bot, guild),
+            )
+        locale, regional_format = self._locales
+        i18n.set_contextual_locale(locale)
+        i18n.set_contextual_regional_format(regional_format)
+
+    def cog_disabled(self, cog: commands.Cog) -> bool:
+        """
+        Check if a cog is disabled in the message's guild.
+
+        See `Red.cog_disabled_in_guild_nowait`.
+        """
+        return self.bot.cog_disabled_in_guild_nowait(cog, self.message.guild)
+
+    async def is_mod_or_superior(self) -> bool:
+        """
+        Check if the message's author is the owner, or a mod or admin of the guild.
+
+        See `redbot.core.utils.mod.is_mod_or_superior`.
+        """
+        if self._mod_or_superior is None:
+            author = self.message.author
+            self._mod_or_superior = await self.bot.is_owner(author) or await self.bot.is_mod(
+                author
+            )
+        return self._mod_or_superior
+
+    async def is_automod_immune(self) -> bool:
+        """
+        Check if the message should be immune from automated moderation actions.
+
+        See `Red.is_automod_immune`.
+        """
+        if self._automod_immune is None:
+            self._automod_immune = await self.bot.is_automod_immune(self.message)
+        return self._automod_immune
+
+
 # Order of inheritance here matters.
 # d.py autoshardedbot should be at the end
 # all of our mixins should happen before,
@@ -159,6 +306,7 @@ class RedBase(
         self._prefix_cache = PrefixManager(self._config, cli_flags)
         self._disabled_cog_cache = DisabledCogCache(self._config)
         self._ignored_cache = IgnoreManager(self._config)
+        self._autoimmune_cache = AutoImmuneManager(self._config)
         self._whiteblacklist_cache = WhitelistBlacklistManager(self._config)
         self._i18n_cache = I18nManager(self._config)
 
@@ -220,6 +368,11 @@ class RedBase(
         self._red_before_invoke_objs: Set[PreInvokeCoroutine] = set()
 
         self._deletion_requests: MutableMapping[int, asyncio.Lock] = weakref.WeakValueDictionary()
+        # Discord deletion requests waiting to be handled together
+        self._discord_deletion_queue: Dict[int, asyncio.Future] = {}
+        self._discord_deletion_task: Optional[asyncio.Task] = None
+
+        self._message_contexts: "OrderedDict[int, MessageContext]" = OrderedDict()
 
     def set_help_formatter(self, formatter: commands.help.HelpFormatterABC):
         """
@@ -323,6 +476,28 @@ class RedBase(
             return False
         return await self._disabled_cog_cache.cog_disabled_in_guild(cog.qualified_name, guild.id)
 
+    def cog_disabled_in_guild_nowait(
+        self, cog: commands.Cog, guild: Optional[discord.Guild]
+    ) -> bool:
+        """
+        Check if a cog is disabled in a guild, without awaiting.
+
+        This is meant for listeners of frequent events, and gives the same
+        result as `cog_disabled_in_guild` once the bot has started.
+
+        Parameters
+        ----------
+        cog: commands.Cog
+        guild: Optional[discord.Guild]
+
+        Returns
+        -------
+        bool
+        """
+        if guild is None:
+            return False
+        return self._disabled_cog_cache.cog_disabled_in_guild_nowait(cog.qualified_name, guild.id)
+
     async def cog_disabled_in_guild_raw(self, cog_name: str, guild_id: int) -> bool:
         """
         Check if a cog is disabled in a guild without the cog or guild object
@@ -787,7 +962,8 @@ class RedBase(
         """
         This should only be run once, prior to connecting to discord.
         """
-        await self._maybe_update_config()
+        with startup_tracer.phase("config migrations"):
+            await self._maybe_update_config()
         self.description = await self._config.description()
 
         init_global_checks(self)
@@ -808,8 +984,12 @@ class RedBase(
         if cli_flags.dev:
             self.add_cog(Dev())
 
-        await modlog._init(self)
-        await bank._init()
+        with startup_tracer.phase("settings caches initialization"):
+            await self._disabled_cog_cache.initialize()
+        with startup_tracer.phase("modlog initialization"):
+            await modlog._init(self)
+        with startup_tracer.phase("bank initialization"):
+            await bank._init()
 
         packages = []
 
@@ -869,49 +1049,182 @@ class RedBase(
             )
 
         if packages:
-            # Load permissions first, for security reasons
+            print("Loading packages...")
+            with startup_tracer.phase("package loading"):
+                packages = await self._load_packages_at_startup(packages)
+            if packages:
+                print("Loaded packages: " + ", ".join(packages))
+
+        if self.rpc_enabled:
+            await self.rpc.initialize(self.rpc_port)
+
+    async def _load_packages_at_startup(self, packages: List[str]) -> List[str]:
+        """
+        Loads the given packages, returning the ones that were loaded successfully.
+
+        All specs are found with a single scan of the cog paths.
+        Packages from `PRIORITY_PACKAGES` are loaded first, in order.
+
+        The remaining ones are imported one by one and their setups run concurrently.
+        Cogs and commands added by a setup are only added to the bot once the setups
+        of all packages before it are done, one package at a time, so that name
+        conflicts are resolved in the given order. A package is only set up once
+        the packages listed in the ``required_cogs`` of its ``info.json`` are loaded,
+        and is loaded after them.
+        """
+        packages = list(deduplicate_iterables(packages))
+        specs = await self._cog_mgr.find_cogs(packages)
+        loaded = set()
+        libs = {}
+
+        async def import_package(package: str) -> bool:
+            spec = specs[package]
+            if spec is None:
+                log.error(
+                    "Failed to load package %s (package was not found in any cog path)", package
+                )
+                await self.remove_loaded_package(package)
+                return False
             try:
-                packages.remove("permissions")
-            except ValueError:
-                pass
-            else:
-                packages.insert(0, "permissions")
+                with startup_tracer.cog_setup(package):
+                    libs[package] = self._import_extension(spec)
+            except Exception as e:
+                log.exception("Failed to load package %s", package, exc_info=e)
+                await self.remove_loaded_package(package)
+                return False
+            return True
 
-            to_remove = []
-            print("Loading packages...")
-            for package in packages:
+        remaining = packages.copy()
+        # Load permissions first, for security reasons
+        for group in PRIORITY_PACKAGES:
+            for package in group:
+                if package in remaining:
+                    remaining.remove(package)
+                    if not await import_package(package):
+                        continue
+                    try:
+                        with startup_tracer.cog_setup(package):
+                            await asyncio.wait_for(
+                                self._setup_extension(package, libs.pop(package)), 30
+                            )
+                    except asyncio.TimeoutError:
+                        log.exception("Failed to load package %s (timeout)", package)
+                    except Exception as e:
+                        log.exception("Failed to load package %s", package, exc_info=e)
+                        await self.remove_loaded_package(package)
+                    else:
+                        loaded.add(package)
+
+        requirements = {
+            package: [
+                required
+                for required in self._get_required_packages(specs[package])
+                if required in remaining
+            ]
+            for package in remaining
+            if specs[package] is not None
+        }
+        order = []
+
+        def add_to_order(package: str, visiting: Set[str]) -> None:
+            if package in order or package in visiting:
+                # already ordered, or a dependency cycle
+                return
+            visiting.add(package)
+            for required in requirements.get(package, ()):
+                add_to_order(required, visiting)
+            order.append(package)
+
+        for package in remaining:
+            add_to_order(package, set())
+        order = [package for package in order if await import_package(package)]
+
+        semaphore = asyncio.Semaphore(STARTUP_LOAD_CONCURRENCY)
+        done = {package: asyncio.Event() for package in order}
+
+        async def setup_package(package: str) -> Optional[_StagedSetup]:
+            for required in requirements[package]:
+                if required in done:
+                    await done[required].wait()
+            async with semaphore:
+                staged = _StagedSetup()
+                _staged_setup.set(staged)
+                start = time.perf_counter()
                 try:
-                    spec = await self._cog_mgr.find_cog(package)
-                    if spec is None:
-                        log.error(
-                            "Failed to load package %s (package was not found in any cog path)",
-                            package,
+                    with startup_tracer.cog_setup(package):
+                        # only the package's own setup counts towards the timeout
+                        await asyncio.wait_for(
+                            self._run_extension_setup(package, libs[package]), 30
                         )
-                        await self.remove_loaded_package(package)
-                        to_remove.append(package)
-                        continue
-                    await asyncio.wait_for(self.load_extension(spec), 30)
                 except asyncio.TimeoutError:
                     log.exception("Failed to load package %s (timeout)", package)
-                    to_remove.append(package)
                 except Exception as e:
                     log.exception("Failed to load package %s", package, exc_info=e)
                     await self.remove_loaded_package(package)
-                    to_remove.append(package)
-            for package in to_remove:
-                packages.remove(package)
-            if packages:
-                print("Loaded packages: " + ", ".join(packages))
+                else:
+                    log.debug("Set up package %s in %.3fs", package, time.perf_counter() - start)
+                    return staged
+                finally:
+                    _staged_setup.set(None)
+            return None
 
-        if self.rpc_enabled:
-            await self.rpc.initialize(self.rpc_port)
+        tasks = {package: asyncio.ensure_future(setup_package(package)) for package in order}
+        try:
+            for package in order:
+                try:
+                    staged = await tasks[package]
+                    if staged is not None and await self._commit_staged_setup(
+                        package, libs[package], staged
+                    ):
+                        loaded.add(package)
+                finally:
+                    done[package].set()
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+        ordered = [package for group in PRIORITY_PACKAGES for package in group]
+        ordered += [package for package in packages if package not in ordered]
+        return [package for package in ordered if package in loaded]
+
+    @staticmethod
+    def _get_required_packages(spec: Optional[ModuleSpec]) -> List[str]:
+        """Get the packages listed in the ``required_cogs`` of the package's ``info.json``."""
+        if spec is None or spec.origin is None:
+            return []
+        try:
+            with open(Path(spec.origin).parent / "info.json", encoding="utf-8") as fs:
+                info = json.load(fs)
+        except (OSError, ValueError):
+            return []
+        required = info.get("required_cogs") if isinstance(info, dict) else None
+        return list(required) if isinstance(required, dict) else []
+
+    async def _commit_staged_setup(
+        self, package: str, lib: ModuleType, staged: _StagedSetup
+    ) -> bool:
+        """Add the cogs and commands staged by the package's setup to the bot."""
+        staged.committed = True
+        try:
+            for add, obj in staged.registrations:
+                add(obj)
+        except Exception as e:
+            self._remove_module_references(lib.__name__)
+            self._call_module_finalizers(lib, package)
+            log.exception("Failed to load package %s", package, exc_info=e)
+            await self.remove_loaded_package(package)
+            return False
+        self._BotBase__extensions[package] = lib
+        return True
 
     async def start(self, *args, **kwargs):
         """
         Overridden start which ensures cog load and other pre-connection tasks are handled
         """
         cli_flags = kwargs.pop("cli_flags")
-        await self.pre_flight(cli_flags=cli_flags)
+        with startup_tracer.phase("pre-flight"):
+            await self.pre_flight(cli_flags=cli_flags)
+        startup_tracer.begin("connecting to Discord")
         return await super().start(*args, **kwargs)
 
     async def send_help_for(
@@ -1159,6 +1472,33 @@ class RedBase(
     async def get_context(self, message, *, cls=commands.Context):
         return await super().get_context(message, cls=cls)
 
+    def get_message_context(self, message: discord.Message) -> MessageContext:
+        """
+        Get the `MessageContext` shared by all listeners handling a message.
+
+        Listeners should prefer its methods over making the equivalent
+        checks themselves.
+
+        Parameters
+        ----------
+        message: discord.Message
+
+        Returns
+        -------
+        MessageContext
+        """
+        # This is keyed by the object rather than the message's ID, as edits of a message
+        # and copies of it made by e.g. Alias shouldn't share results with the original.
+        # Holding a reference to the message makes sure the key isn't reused while cached.
+        contexts = self._message_contexts
+        message_context = contexts.get(id(message))
+        if message_context is None:
+            message_context = contexts[id(message)] = MessageContext(self, message)
+            # Listeners only need this while the message is being dispatched
+            while len(contexts) > 256:
+                contexts.popitem(last=False)
+        return message_context
+
     async def process_commands(self, message: discord.Message):
         """
         Same as base method, but dispatches an additional event for cogs
@@ -1168,6 +1508,7 @@ class RedBase(
         """
         if not message.author.bot:
             ctx = await self.get_context(message)
+            self.get_message_context(message).prefix = ctx.prefix
             await self.invoke(ctx)
         else:
             ctx = None
@@ -1195,6 +1536,11 @@ class RedBase(
 
     async def load_extension(self, spec: ModuleSpec):
         # NB: this completely bypasses `discord.ext.commands.Bot._load_from_module_spec`
+        name = spec.name.split(".")[-1]
+        lib = self._import_extension(spec)
+        await self._setup_extension(name, lib)
+
+    def _import_extension(self, spec: ModuleSpec) -> ModuleType:
         name = spec.name.split(".")[-1]
         if name in self.extensions:
             raise errors.PackageAlreadyLoaded(spec)
@@ -1203,18 +1549,22 @@ class RedBase(
         if not hasattr(lib, "setup"):
             del lib
             raise discord.ClientException(f"extension {name} does not have a setup function")
+        return lib
+
+    async def _setup_extension(self, name: str, lib: ModuleType) -> None:
+        await self._run_extension_setup(name, lib)
+        self._BotBase__extensions[name] = lib
 
+    async def _run_extension_setup(self, name: str, lib: ModuleType) -> None:
         try:
             if asyncio.iscoroutinefunction(lib.setup):
                 await lib.setup(self)
             else:
                 lib.setup(self)
-        except Exception as e:
+        except BaseException:
             self._remove_module_references(lib.__name__)
             self._call_module_finalizers(lib, name)
             raise
-        else:
-            self._BotBase__extensions[name] = lib
 
     def remove_cog(self, cogname: str):
         cog = self.get_cog(cogname)
@@ -1230,6 +1580,7 @@ class RedBase(
                 self.remove_permissions_hook(hook)
 
         super().remove_cog(cogname)
+        commands.help._page_cache.clear()
 
         cog.requires.reset()
 
@@ -1261,22 +1612,25 @@ class RedBase(
             return False
 
         if isinstance(to_check, discord.Role):
-            ids_to_check = [to_check.id]
-        else:
-            author = getattr(to_check, "author", to_check)
-            try:
-                ids_to_check = [r.id for r in author.roles]
-            except AttributeError:
-                # webhook messages are a user not member,
-                # cheaper than isinstance
-                if author.bot and author.discriminator == "0000":
-                    return True  # webhooks require significant permissions to enable.
-            else:
-                ids_to_check.append(author.id)
+            return to_check.id in await self._autoimmune_cache.get_immune_ids(guild)
 
-        immune_ids = await self._config.guild(guild).autoimmune_ids()
-
-        return any(i in immune_ids for i in ids_to_check)
+        author = getattr(to_check, "author", to_check)
+        try:
+            role_ids = author._roles
+        except AttributeError:
+            # webhook messages are a user not member,
+            # cheaper than isinstance
+            if author.bot and author.discriminator == "0000":
+                return True  # webhooks require significant permissions to enable.
+            role_ids = ()
+
+        immune_ids = await self._autoimmune_cache.get_immune_ids(guild)
+        # `Member._roles` doesn't include the default role, which has the guild's ID
+        return (
+            author.id in immune_ids
+            or guild.id in immune_ids
+            or not immune_ids.isdisjoint(role_ids)
+        )
 
     @staticmethod
     async def send_filtered(
@@ -1318,6 +1672,11 @@ class RedBase(
         return await destination.send(content=content, **kwargs)
 
     def add_cog(self, cog: commands.Cog):
+        staged = _staged_setup.get()
+        if staged is not None and not staged.committed:
+            # added once the packages before this one are loaded
+            staged.registrations.append((self.add_cog, cog))
+            return
         if not isinstance(cog, commands.Cog):
             raise RuntimeError(
                 f"The {cog.__class__.__name__} cog in the {cog.__module__} package does "
@@ -1342,6 +1701,7 @@ class RedBase(
                     added_hooks.append(hook)
 
             super().add_cog(cog)
+            commands.help._page_cache.clear()
             self.dispatch("cog_add", cog)
             if "permissions" not in self.extensions:
                 cog.requires.ready_event.set()
@@ -1359,10 +1719,15 @@ class RedBase(
             raise
 
     def add_command(self, command: commands.Command) -> None:
+        staged = _staged_setup.get()
+        if staged is not None and not staged.committed:
+            staged.registrations.append((self.add_command, command))
+            return
         if not isinstance(command, commands.Command):
             raise RuntimeError("Commands must be instances of `redbot.core.commands.Command`")
 
         super().add_command(command)
+        commands.help._page_cache.clear()
 
         permissions_not_loaded = "permissions" not in self.extensions
         self.dispatch("command_add", command)
@@ -1378,6 +1743,7 @@ class RedBase(
         command = super().remove_command(name)
         if not command:
             return
+        commands.help._page_cache.clear()
         command.requires.reset()
         if isinstance(command, commands.Group):
             for subcommand in command.walk_commands():
@@ -1580,22 +1946,22 @@ class RedBase(
         *,
         requester: Literal["discord_deleted_user", "owner", "user", "user_strict"],
         user_id: int,
+    ):
+        await self._core_bulk_data_deletion(requester=requester, user_ids={user_id})
+
+    async def _core_bulk_data_deletion(
+        self,
+        *,
+        requester: Literal["discord_deleted_user", "owner", "user", "user_strict"],
+        user_ids: Set[int],
     ):
         if requester != "discord_deleted_user":
             return
 
-        await self._config.user_from_id(user_id).clear()
-        all_guilds = await self._config.all_guilds()
-
-        async for guild_id, guild_data in AsyncIter(all_guilds.items(), steps=100):
-            if user_id in guild_data.get("autoimmune_ids", []):
-                async with self._config.guild_from_id(guild_id).autoimmune_ids() as ids:
-                    # prevent a racy crash here without locking
-                    # up the vals in all guilds first
-                    with contextlib.suppress(ValueError):
-                        ids.remove(user_id)
-
-        await self._whiteblacklist_cache.discord_deleted_user(user_id)
+        for user_id in user_ids:
+            await self._config.user_from_id(user_id).clear()
+        await self._autoimmune_cache.discord_deleted_users(user_ids)
+        await self._whiteblacklist_cache.discord_deleted_users(user_ids)
 
     async def handle_data_deletion_request(
         self,
@@ -1612,6 +1978,10 @@ class RedBase(
         See ``redbot.core.commands.Cog.delete_data_for_user``
         for details about the parameters and intent.
 
+        Requests from Discord (``"discord_deleted_user"``) are queued for up to
+        a few seconds, and handled together with any others received in that time.
+        The returned results are then for the whole batch.
+
         Parameters
         ----------
         requester
@@ -1625,10 +1995,49 @@ class RedBase(
             and cogs that didn't handle data deletion request.
         """
         await self.wait_until_red_ready()
+        if requester == "discord_deleted_user":
+            return await self._queue_discord_deletion_request(user_id)
         lock = self._deletion_requests.setdefault(user_id, asyncio.Lock())
         async with lock:
             return await self._handle_data_deletion_request(requester=requester, user_id=user_id)
 
+    async def _queue_discord_deletion_request(self, user_id: int) -> DataDeletionResults:
+        fut = self._discord_deletion_queue.get(user_id)
+        if fut is None:
+            fut = self._discord_deletion_queue[user_id] = self.loop.create_future()
+        if self._discord_deletion_task is None:
+            self._discord_deletion_task = asyncio.create_task(self._process_discord_deletions())
+        # Don't cancel the request for everyone waiting on it if one caller is cancelled.
+        return await asyncio.shield(fut)
+
+    async def _process_discord_deletions(self):
+        try:
+            while self._discord_deletion_queue:
+                await asyncio.sleep(DELETION_BATCH_WINDOW)
+                batch = self._discord_deletion_queue
+                self._discord_deletion_queue = {}
+                try:
+                    results = await self._handle_bulk_data_deletion_request(
+                        requester="discord_deleted_user", user_ids=set(batch)
+                    )
+                except asyncio.CancelledError:
+                    for fut in batch.values():
+                        fut.cancel()
+                    raise
+                except Exception as exc:
+                    for fut in batch.values():
+                        fut.set_exception(exc)
+                else:
+                    for fut in batch.values():
+                        fut.set_result(results)
+        except asyncio.CancelledError:
+            for fut in self._discord_deletion_queue.values():
+                fut.cancel()
+            self._discord_deletion_queue = {}
+            raise
+        finally:
+            self._discord_deletion_task = None
+
     async def _handle_data_deletion_request(
         self,
         *,
@@ -1647,20 +2056,45 @@ class RedBase(
         -------
         DataDeletionResults
         """
-        extension_handlers = {
-            extension_name: handler
-            for extension_name, extension in self.extensions.items()
-            if (handler := getattr(extension, "red_delete_data_for_user", None))
-        }
+        return await self._handle_bulk_data_deletion_request(
+            requester=requester, user_ids={user_id}
+        )
+
+    async def _handle_bulk_data_deletion_request(
+        self,
+        *,
+        requester: Literal["discord_deleted_user", "owner", "user", "user_strict"],
+        user_ids: Set[int],
+    ) -> DataDeletionResults:
+        """
+        Tells everything to delete data for all of the given users at once.
+
+        Parameters
+        ----------
+        requester
+        user_ids
+
+        Returns
+        -------
+        DataDeletionResults
+        """
+        extension_handlers = {}
+        for extension_name, extension in self.extensions.items():
+            if handler := getattr(extension, "red_delete_data_for_users", None):
+                extension_handlers[extension_name] = handler
+            elif handler := getattr(extension, "red_delete_data_for_user", None):
+                extension_handlers[extension_name] = functools.partial(
+                    _delete_data_for_each_user, handler
+                )
 
         cog_handlers = {
-            cog_qualname: cog.red_delete_data_for_user for cog_qualname, cog in self.cogs.items()
+            cog_qualname: cog.red_delete_data_for_users for cog_qualname, cog in self.cogs.items()
         }
 
         special_handlers = {
-            "Red Core Modlog API": modlog._process_data_deletion,
-            "Red Core Bank API": bank._process_data_deletion,
-            "Red Core Bot Data": self._core_data_deletion,
+            "Red Core Modlog API": modlog._process_bulk_data_deletion,
+            "Red Core Bank API": bank._process_bulk_data_deletion,
+            "Red Core Bot Data": self._core_bulk_data_deletion,
         }
 
         failures = {
@@ -1671,7 +2105,7 @@ class RedBase(
 
         async def wrapper(func, stype, sname):
             try:
-                await func(requester=requester, user_id=user_id)
+                await func(requester=requester, user_ids=user_ids)
             except commands.commands.RedUnhandledAPI:
                 log.warning(f"{stype}.{sname} did not handle data deletion ")
                 failures["unhandled"].append(sname)
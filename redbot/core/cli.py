@@ -187,6 +187,19 @@ def parse_cli_flags(args):
         help="Sets the loggers level as debug",
     )
     parser.add_argument("--dev", action="store_true", help="Enables developer mode")
+    parser.add_argument(
+        "--trace-startup",
+        action="store_true",
+        help="Records the time spent in each startup phase and cog setup. "
+        "The report can be seen with `[p]debuginfo startup` "
+        "and is saved as JSON in the logs folder once the bot is ready.",
+    )
+    parser.add_argument(
+        "--trace-startup-imports",
+        action="store_true",
+        help="Also records the time spent importing each module during startup. "
+        "Implies --trace-startup.",
+    )
     parser.add_argument(
         "--mentionable",
         action="store_true",
@@ -4,7 +4,7 @@ import pkgutil
 from importlib import import_module, invalidate_caches
 from importlib.machinery import ModuleSpec
 from pathlib import Path
-from typing import Union, List, Optional
+from typing import Dict, Iterable, Union, List, Optional, Tuple
 
 import redbot.cogs
 from redbot.core.utils import deduplicate_iterables
@@ -43,6 +43,9 @@ class CogManager:
         tmp_cog_install_path = cog_data_path(self) / "cogs"
         tmp_cog_install_path.mkdir(parents=True, exist_ok=True)
         self.config.register_global(paths=[], install_path=str(tmp_cog_install_path))
+        # path -> (mtime of the path, names of the modules available in it)
+        self._index: Dict[Path, Tuple[int, Dict[str, None]]] = {}
+        self._ext_paths: Optional[List[Path]] = None
 
     async def paths(self) -> List[Path]:
         """Get all currently valid path directories, in order of priority
@@ -112,6 +115,7 @@ class CogManager:
             raise ValueError("The install path must be an existing directory.")
         resolved = path.resolve()
         await self.config.install_path.set(str(resolved))
+        self.invalidate_index()
         return resolved
 
     @staticmethod
@@ -194,6 +198,57 @@ class CogManager:
         """
         str_paths = list(map(str, paths_))
         await self.config.paths.set(str_paths)
+        self.invalidate_index()
+
+    def invalidate_index(self) -> None:
+        """Drop the cached index of available cogs.
+
+        The index is refreshed on its own when a cog path is modified
+        or a cog can't be found in it, this should be called after changing
+        the contents of a cog package in place, e.g. after installing a cog.
+        """
+        self._index.clear()
+        self._ext_paths = None
+
+    def _get_path_modules(self, path: Path) -> Dict[str, None]:
+        """Get the names of the modules available in the given path, using the index.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+
+        Returns
+        -------
+        Dict[str, None]
+            Ordered mapping with the module names as keys.
+
+        """
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            self._index.pop(path, None)
+            return {}
+        try:
+            cached_mtime, modules = self._index[path]
+        except KeyError:
+            pass
+        else:
+            if cached_mtime == mtime:
+                return modules
+
+        modules = dict.fromkeys(
+            module_name
+            for finder, module_name, _ in pkgutil.iter_modules([str(path)])
+            # reject package names that can't be valid python identifiers
+            if module_name.isidentifier() and not keyword.iskeyword(module_name)
+        )
+        self._index[path] = (mtime, modules)
+        return modules
+
+    async def _get_ext_paths(self) -> List[Path]:
+        if self._ext_paths is None:
+            self._ext_paths = [await self.install_path()] + await self.user_defined_paths()
+        return self._ext_paths
 
     async def _find_ext_cog(self, name: str) -> ModuleSpec:
         """
@@ -222,13 +277,18 @@ class CogManager:
                 name=name,
             )
 
-        real_paths = list(map(str, [await self.install_path()] + await self.user_defined_paths()))
-
-        for finder, module_name, _ in pkgutil.iter_modules(real_paths):
-            if name == module_name:
-                spec = finder.find_spec(name)
-                if spec:
-                    return spec
+        paths = await self._get_ext_paths()
+        # The index only notices changes to the cog paths' own mtime, which misses
+        # e.g. an __init__.py added to an existing directory, so the paths
+        # are scanned again before giving up.
+        for rescan in (False, True):
+            for path in paths:
+                if rescan:
+                    self._index.pop(path, None)
+                if name in self._get_path_modules(path):
+                    spec = pkgutil.get_importer(str(path)).find_spec(name)
+                    if spec:
+                        return spec
 
         raise NoSuchCog(
             f"No 3rd party module by the name of '{name}' was found in any available path.",
@@ -291,16 +351,26 @@ class CogManager:
         with contextlib.suppress(NoSuchCog):
             return await self._find_core_cog(name)
 
+    async def find_cogs(self, names: Iterable[str]) -> Dict[str, Optional[ModuleSpec]]:
+        """Find multiple cogs in the list of available paths.
+
+        Parameters
+        ----------
+        names : Iterable[str]
+            Names of the cogs to find.
+
+        Returns
+        -------
+        Dict[str, Optional[importlib.machinery.ModuleSpec]]
+            Mapping of cog name to a module spec to be used
+            for specialized cog loading, or `None` if it wasn't found.
+
+        """
+        return {name: await self.find_cog(name) for name in names}
+
     async def available_modules(self) -> List[str]:
         """Finds the names of all available modules to load."""
-        paths = list(map(str, await self.paths()))
-
-        ret = []
-        for finder, module_name, _ in pkgutil.iter_modules(paths):
-            # reject package names that can't be valid python identifiers
-            if module_name.isidentifier() and not keyword.iskeyword(module_name):
-                ret.append(module_name)
-        return ret
+        return deduplicate_iterables(*map(self._get_path_modules, await self.paths()))
 
     @staticmethod
     def invalidate_caches():
@@ -18,6 +18,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    Set,
     Tuple,
     Union,
     MutableMapping,
@@ -545,20 +546,17 @@ class Command(CogCommandMixin, DPYCommand):
             ``True`` if this command is visible in the given context.
 
         """
-        for cmd in (self, *self.parents):
-            if cmd.hidden:
-                return False
-            try:
-                can_run = await self.can_run(
-                    ctx, check_all_parents=True, change_permission_state=False
-                )
-            except (CheckFailure, DisabledCommand):
-                return False
-            else:
-                if can_run is False:
-                    return False
+        if any(cmd.hidden for cmd in (self, *self.parents)):
+            return False
+        # This already checks the whole chain of parents
+        try:
+            can_run = await self.can_run(
+                ctx, check_all_parents=True, change_permission_state=False
+            )
+        except (CheckFailure, DisabledCommand):
+            return False
 
-        return True
+        return can_run is not False
 
     def disable_in(self, guild: discord.Guild) -> bool:
         """Disable this command in the given guild.
@@ -965,6 +963,40 @@ class CogMixin(CogGroupMixin, CogCommandMixin):
         """
         raise RedUnhandledAPI()
 
+    async def red_delete_data_for_users(
+        self,
+        *,
+        requester: Literal["discord_deleted_user", "owner", "user", "user_strict"],
+        user_ids: Set[int],
+    ):
+        """
+        Same as `red_delete_data_for_user`, but for many users at once.
+
+        Bots may receive many deletion requests from Discord in a short time,
+        these are then handled together using this method.
+        By default, this calls `red_delete_data_for_user` for each user.
+
+        Cogs which have to go through all of their data to find a user's data
+        should override this, so that they only need to do that once
+        for all of the users.
+
+        This method may also be implemented for an extension.
+
+        Parameters
+        ----------
+        requester: Literal["discord_deleted_user", "owner", "user", "user_strict"]
+            See `red_delete_data_for_user` for details about this parameter
+        user_ids: Set[int]
+            The user IDs which need deletion handling
+
+        Raises
+        ------
+        RedUnhandledAPI
+            If `red_delete_data_for_user` is not handling this
+        """
+        for user_id in user_ids:
+            await self.red_delete_data_for_user(requester=requester, user_id=user_id)
+
     async def can_run(self, ctx: "Context", **kwargs) -> bool:
         """
         This really just exists to allow easy use with other methods using can_run
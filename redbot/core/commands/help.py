@@ -29,16 +29,17 @@
 
 import abc
 import asyncio
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 from dataclasses import dataclass, asdict as dc_asdict
-from typing import Union, List, AsyncIterator, Iterable, cast
+from typing import Union, List, AsyncIterator, Iterable, Hashable, Optional, Tuple, cast
 
 import discord
 from discord.ext import commands as dpy_commands
 
 from . import commands
 from .context import Context
-from ..i18n import Translator
+from .requires import _shared_check_cache
+from ..i18n import Translator, get_locale
 from ..utils import menus
 from ..utils.mod import mass_purge
 from ..utils._internal_utils import fuzzy_command_search, format_fuzzy_results
@@ -54,6 +55,8 @@ HelpTarget = Union[commands.Command, commands.Group, commands.Cog, dpy_commands.
 SupportsCanSee = Union[commands.Command, commands.Group, dpy_commands.bot.BotBase, commands.Cog]
 
 EmbedField = namedtuple("EmbedField", "name value inline")
+# Whether the pages are embeds, and the pages
+_RenderedPages = Tuple[bool, List[Union[str, discord.Embed]]]
 EMPTY_STRING = "\N{ZERO WIDTH SPACE}"
 
 
@@ -133,6 +136,41 @@ class HelpSettings:
         ).format_map(data)
 
 
+class _HelpPageCache:
+    """LRU cache of rendered help pages.
+
+    Entries are keyed by everything which goes into rendering the pages,
+    including the context-formatted help of the objects which passed
+    `RedHelpFormatter.help_filter_func` and the `HelpSettings` in use,
+    so changing help settings or permissions, or help text which depends on
+    the context, never serves stale pages. Loading or unloading cogs and commands changes the
+    help text of existing names as well, so the bot clears this cache when that happens.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._pages: "OrderedDict[Hashable, _RenderedPages]" = OrderedDict()
+
+    def get(self, key: Hashable) -> "Optional[_RenderedPages]":
+        try:
+            self._pages.move_to_end(key)
+        except KeyError:
+            return None
+        return self._pages[key]
+
+    def put(self, key: Hashable, pages: "_RenderedPages") -> None:
+        self._pages[key] = pages
+        self._pages.move_to_end(key)
+        while len(self._pages) > self.maxsize:
+            self._pages.popitem(last=False)
+
+    def clear(self) -> None:
+        self._pages.clear()
+
+
+_page_cache = _HelpPageCache()
+
+
 class NoCommand(Exception):
     pass
 
@@ -204,6 +242,13 @@ class RedHelpFormatter(HelpFormatterABC):
         use in third party code.
         The internal methods used here may change,
         with this class being updated at the same time.
+
+    .. note::
+
+        Rendered pages are cached. The cache accounts for the prefix, locale,
+        bot's name in the guild, help settings and visible commands,
+        but help text which changes based on anything else in the context
+        will not be re-rendered until cogs or commands are next loaded or unloaded.
     """
 
     async def send_help(
@@ -267,6 +312,43 @@ class RedHelpFormatter(HelpFormatterABC):
                 sorted_iterable.append((cogname, cm))
         return sorted_iterable
 
+    async def get_page_cache_key(
+        self, ctx: Context, topic: Hashable, visible: Hashable, help_settings: HelpSettings
+    ) -> Hashable:
+        """
+        Get the key rendered help pages are cached under.
+
+        ``topic`` identifies what help is being rendered for,
+        and ``visible`` which of its commands passed the help filter.
+        Both should include the output of ``format_help_for_context``
+        and ``format_shortdoc_for_context``, since those may be overridden
+        to depend on the context.
+        """
+        use_embeds = await ctx.embed_requested()
+        color = (await ctx.embed_color()) if use_embeds else None
+        me = ctx.me
+        return (
+            type(self),
+            topic,
+            visible,
+            help_settings,
+            use_embeds,
+            color,
+            get_locale(),
+            ctx.clean_prefix,
+            me.id,
+            me.display_name,
+            str(me.avatar_url),
+            ctx.bot.description,
+        )
+
+    @staticmethod
+    def _get_shortdocs(ctx: Context, coms: dict) -> Tuple[Tuple[str, str], ...]:
+        return tuple(
+            (name, command.format_shortdoc_for_context(ctx))
+            for name, command in sorted(coms.items())
+        )
+
     @staticmethod
     def get_default_tagline(ctx: Context):
         return _(
@@ -296,17 +378,44 @@ class RedHelpFormatter(HelpFormatterABC):
 
         command = obj
 
+        subcommands = None
+        if hasattr(command, "all_commands"):
+            grp = cast(commands.Group, command)
+            subcommands = await self.get_group_help_mapping(ctx, grp, help_settings=help_settings)
+
+        cache_key = await self.get_page_cache_key(
+            ctx,
+            ("command", command.qualified_name, command.format_help_for_context(ctx)),
+            self._get_shortdocs(ctx, subcommands or {}),
+            help_settings=help_settings,
+        )
+        if (cached := _page_cache.get(cache_key)) is None:
+            embed, pages = await self.make_command_help_pages(
+                ctx, command, subcommands, help_settings=help_settings
+            )
+            _page_cache.put(cache_key, (embed, pages))
+        else:
+            embed, pages = cached
+        await self.send_pages(ctx, pages, embed=embed, help_settings=help_settings)
+
+    async def make_command_help_pages(
+        self,
+        ctx: Context,
+        command: commands.Command,
+        subcommands: Optional[dict],
+        help_settings: HelpSettings,
+    ):
+        """
+        Renders the pages for `format_command_help`.
+
+        Returns whether the pages are embeds, and the pages.
+        """
         description = command.description or ""
 
         tagline = (help_settings.tagline) or self.get_default_tagline(ctx)
         signature = _(
             "`Syntax: {ctx.clean_prefix}{command.qualified_name} {command.signature}`"
         ).format(ctx=ctx, command=command)
-        subcommands = None
-
-        if hasattr(command, "all_commands"):
-            grp = cast(commands.Group, command)
-            subcommands = await self.get_group_help_mapping(ctx, grp, help_settings=help_settings)
 
         if await ctx.embed_requested():
             emb = {"embed": {"title": "", "description": ""}, "footer": {"text": ""}, "fields": []}
@@ -346,7 +455,7 @@ class RedHelpFormatter(HelpFormatterABC):
                     field = EmbedField(title, page, False)
                     emb["fields"].append(field)
 
-            await self.make_and_send_embeds(ctx, emb, help_settings=help_settings)
+            return True, await self.make_embeds(ctx, emb, help_settings=help_settings)
 
         else:  # Code blocks:
 
@@ -382,8 +491,7 @@ class RedHelpFormatter(HelpFormatterABC):
                     ),
                 )
             )
-            pages = [box(p) for p in pagify(to_page)]
-            await self.send_pages(ctx, pages, embed=False, help_settings=help_settings)
+            return False, [box(p) for p in pagify(to_page)]
 
     @staticmethod
     def group_embed_fields(fields: List[EmbedField], max_chars=1000):
@@ -410,7 +518,15 @@ class RedHelpFormatter(HelpFormatterABC):
         return ret
 
     async def make_and_send_embeds(self, ctx, embed_dict: dict, help_settings: HelpSettings):
+        pages = await self.make_embeds(ctx, embed_dict, help_settings=help_settings)
+        await self.send_pages(ctx, pages, embed=True, help_settings=help_settings)
 
+    async def make_embeds(
+        self, ctx, embed_dict: dict, help_settings: HelpSettings
+    ) -> List[discord.Embed]:
+        """
+        Splits the content of ``embed_dict`` over as many embeds as needed.
+        """
         pages = []
 
         page_char_limit = help_settings.page_char_limit
@@ -478,7 +594,7 @@ class RedHelpFormatter(HelpFormatterABC):
 
             pages.append(embed)
 
-        await self.send_pages(ctx, pages, embed=True, help_settings=help_settings)
+        return pages
 
     async def format_cog_help(self, ctx: Context, obj: commands.Cog, help_settings: HelpSettings):
 
@@ -486,6 +602,29 @@ class RedHelpFormatter(HelpFormatterABC):
         if not (coms or help_settings.verify_exists):
             return
 
+        cache_key = await self.get_page_cache_key(
+            ctx,
+            ("cog", obj.qualified_name, obj.format_help_for_context(ctx)),
+            self._get_shortdocs(ctx, coms),
+            help_settings=help_settings,
+        )
+        if (cached := _page_cache.get(cache_key)) is None:
+            embed, pages = await self.make_cog_help_pages(
+                ctx, obj, coms, help_settings=help_settings
+            )
+            _page_cache.put(cache_key, (embed, pages))
+        else:
+            embed, pages = cached
+        await self.send_pages(ctx, pages, embed=embed, help_settings=help_settings)
+
+    async def make_cog_help_pages(
+        self, ctx: Context, obj: commands.Cog, coms: dict, help_settings: HelpSettings
+    ):
+        """
+        Renders the pages for `format_cog_help`.
+
+        Returns whether the pages are embeds, and the pages.
+        """
         description = obj.format_help_for_context(ctx)
         tagline = (help_settings.tagline) or self.get_default_tagline(ctx)
 
@@ -521,7 +660,7 @@ class RedHelpFormatter(HelpFormatterABC):
                     field = EmbedField(title, page, False)
                     emb["fields"].append(field)
 
-            await self.make_and_send_embeds(ctx, emb, help_settings=help_settings)
+            return True, await self.make_embeds(ctx, emb, help_settings=help_settings)
 
         else:
             subtext = None
@@ -544,8 +683,7 @@ class RedHelpFormatter(HelpFormatterABC):
                 )
 
             to_page = "\n\n".join(filter(None, (description, subtext_header, subtext)))
-            pages = [box(p) for p in pagify(to_page)]
-            await self.send_pages(ctx, pages, embed=False, help_settings=help_settings)
+            return False, [box(p) for p in pagify(to_page)]
 
     async def format_bot_help(self, ctx: Context, help_settings: HelpSettings):
 
@@ -553,6 +691,25 @@ class RedHelpFormatter(HelpFormatterABC):
         if not coms:
             return
 
+        cache_key = await self.get_page_cache_key(
+            ctx,
+            ("bot",),
+            tuple((cog_name, self._get_shortdocs(ctx, data)) for cog_name, data in coms),
+            help_settings=help_settings,
+        )
+        if (cached := _page_cache.get(cache_key)) is None:
+            embed, pages = await self.make_bot_help_pages(ctx, coms, help_settings=help_settings)
+            _page_cache.put(cache_key, (embed, pages))
+        else:
+            embed, pages = cached
+        await self.send_pages(ctx, pages, embed=embed, help_settings=help_settings)
+
+    async def make_bot_help_pages(self, ctx: Context, coms: list, help_settings: HelpSettings):
+        """
+        Renders the pages for `format_bot_help`.
+
+        Returns whether the pages are embeds, and the pages.
+        """
         description = ctx.bot.description or ""
         tagline = (help_settings.tagline) or self.get_default_tagline(ctx)
 
@@ -586,7 +743,7 @@ class RedHelpFormatter(HelpFormatterABC):
                     field = EmbedField(title, page, False)
                     emb["fields"].append(field)
 
-            await self.make_and_send_embeds(ctx, emb, help_settings=help_settings)
+            return True, await self.make_embeds(ctx, emb, help_settings=help_settings)
 
         else:
             to_join = []
@@ -620,8 +777,7 @@ class RedHelpFormatter(HelpFormatterABC):
 
             to_join.append(f"\n{tagline}")
             to_page = "\n".join(to_join)
-            pages = [box(p) for p in pagify(to_page)]
-            await self.send_pages(ctx, pages, embed=False, help_settings=help_settings)
+            return False, [box(p) for p in pagify(to_page)]
 
     @staticmethod
     async def help_filter_func(
@@ -636,24 +792,34 @@ class RedHelpFormatter(HelpFormatterABC):
         show_hidden = bypass_hidden or help_settings.show_hidden
         verify_checks = help_settings.verify_checks
 
-        # TODO: Settings for this in core bot db
-        for obj in objects:
-            if verify_checks and not show_hidden:
-                # Default Red behavior, can_see includes a can_run check.
-                if await obj.can_see(ctx) and getattr(obj, "enabled", True):
-                    yield obj
-            elif verify_checks:
-                try:
-                    can_run = await obj.can_run(ctx)
-                except discord.DiscordException:
-                    can_run = False
-                if can_run and getattr(obj, "enabled", True):
-                    yield obj
-            elif not show_hidden:
-                if not getattr(obj, "hidden", False):  # Cog compatibility
+        if not verify_checks:
+            for obj in objects:
+                if show_hidden or not getattr(obj, "hidden", False):  # Cog compatibility
                     yield obj
-            else:
-                yield obj
+            return
+
+        # Checks which only depend on the context (owner, privilege level, bot permissions)
+        # are evaluated once and reused for every object checked here.
+        # These are all evaluated up front, so that the cache doesn't outlive this call
+        # while we're suspended at a `yield`.
+        visible = []
+        with _shared_check_cache(ctx):
+            # TODO: Settings for this in core bot db
+            for obj in objects:
+                if not show_hidden:
+                    # Default Red behavior, can_see includes a can_run check.
+                    if await obj.can_see(ctx) and getattr(obj, "enabled", True):
+                        visible.append(obj)
+                else:
+                    try:
+                        can_run = await obj.can_run(ctx)
+                    except discord.DiscordException:
+                        can_run = False
+                    if can_run and getattr(obj, "enabled", True):
+                        visible.append(obj)
+
+        for obj in visible:
+            yield obj
 
     async def command_not_found(self, ctx, help_for, help_settings: HelpSettings):
         """
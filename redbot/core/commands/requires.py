@@ -7,6 +7,7 @@ as well as custom checks which can be overridden, and some special
 checks like bot permissions checks.
 """
 import asyncio
+import contextlib
 import enum
 import inspect
 from collections import ChainMap
@@ -17,6 +18,7 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -496,7 +498,7 @@ class Requires:
         await self._verify_bot(ctx)
 
         # Owner should never be locked out of commands for user permissions.
-        if await ctx.bot.is_owner(ctx.author):
+        if await _SharedCheckCache.is_owner(ctx):
             return True
         # Owner-only commands are non-overrideable, and we already checked for owner.
         if self.privilege_level is PrivilegeLevel.BOT_OWNER:
@@ -509,15 +511,12 @@ class Requires:
         return await self._transition_state(ctx)
 
     async def _verify_bot(self, ctx: "Context") -> None:
-        if ctx.guild is None:
-            bot_user = ctx.bot.user
-        else:
-            bot_user = ctx.guild.me
+        if ctx.guild is not None:
             cog = ctx.cog
             if cog and await ctx.bot.cog_disabled_in_guild(cog, ctx.guild):
                 raise discord.ext.commands.DisabledCommand()
 
-        bot_perms = ctx.channel.permissions_for(bot_user)
+        bot_perms = _SharedCheckCache.bot_perms(ctx)
         if not (bot_perms.administrator or bot_perms >= self.bot_perms):
             raise BotMissingPermissions(missing=self._missing_perms(self.bot_perms, bot_perms))
 
@@ -560,7 +559,7 @@ class Requires:
                 return True
 
         if self.privilege_level is not None:
-            privilege_level = await PrivilegeLevel.from_ctx(ctx)
+            privilege_level = await _SharedCheckCache.privilege_level(ctx)
             if privilege_level >= self.privilege_level:
                 return True
 
@@ -576,36 +575,62 @@ class Requires:
                 return rule
             return self.get_rule(self.DEFAULT, self.GLOBAL)
 
+        # Resolving rules runs for every invocation and for every command shown in help,
+        # so rather than building a chain of model objects (which requires sorting all
+        # of the author's roles) we look up IDs directly, and only resolve role objects
+        # for roles which actually have a rule set.
+        model_ids = [author.id]
+        if author.voice is not None:
+            model_ids.append(author.voice.channel.id)
+        model_ids.append(ctx.channel.id)
+        category_id = getattr(ctx.channel, "category_id", None)
+        if category_id is not None:
+            model_ids.append(category_id)
+
         rules_chain = [self._global_rules]
-        guild_rules = self._guild_rules.get(ctx.guild.id)
+        guild_rules = self._guild_rules.get(guild.id)
         if guild_rules:
             rules_chain.append(guild_rules)
 
-        channels = []
-        if author.voice is not None:
-            channels.append(author.voice.channel)
-        channels.append(ctx.channel)
-        category = ctx.channel.category
-        if category is not None:
-            channels.append(category)
-
-        # We want author roles sorted highest to lowest, and exclude the @everyone role
-        author_roles = reversed(author.roles[1:])
-
-        model_chain = [author, *channels, *author_roles, guild]
-
         for rules in rules_chain:
-            for model in model_chain:
-                rule = rules.get(model.id)
+            if len(rules) <= (self.DEFAULT in rules):
+                # Only a default rule, no need to look through the models
+                continue
+            for model_id in model_ids:
+                rule = rules.get(model_id)
+                if rule is not None:
+                    return rule
+            rule = self._get_role_rule(rules, author, guild)
+            if rule is not None:
+                return rule
+            if rules is self._global_rules:
+                # We don't check for the guild in guild rules
+                rule = rules.get(guild.id)
                 if rule is not None:
                     return rule
-            del model_chain[-1]  # We don't check for the guild in guild rules
 
         default_rule = self.get_rule(self.DEFAULT, guild.id)
         if default_rule is PermState.NORMAL:
             default_rule = self.get_rule(self.DEFAULT, self.GLOBAL)
         return default_rule
 
+    @staticmethod
+    def _get_role_rule(
+        rules: Mapping[Union[int, str], PermState], author: discord.Member, guild: discord.Guild
+    ) -> Optional[PermState]:
+        # The rule of the author's highest role with a rule applies.
+        # This doesn't include the @everyone role, which isn't in `Member._roles`.
+        top_role = None
+        top_rule = None
+        for role_id in author._roles:  # DEP-WARN
+            rule = rules.get(role_id)
+            if rule is None:
+                continue
+            role = guild.get_role(role_id)
+            if role is not None and (top_role is None or role > top_role):
+                top_role, top_rule = role, rule
+        return top_rule
+
     async def _verify_checks(self, ctx: "Context") -> bool:
         if not self.checks:
             return True
@@ -648,6 +673,71 @@ class Requires:
         )
 
 
+class _SharedCheckCache:
+    """Results of the parts of `Requires.verify` which only depend on the context.
+
+    These are the same for every command checked against a context, so when
+    checking many commands at once (e.g. when rendering help), they only need
+    to be worked out once. The cache is only used inside of
+    `_shared_check_cache`, since e.g. a command changing the mod roles must
+    see that change reflected in any later checks.
+    """
+
+    __slots__ = ("_is_owner", "_privilege_level", "_bot_perms")
+
+    def __init__(self):
+        self._is_owner: Optional[bool] = None
+        self._privilege_level: Optional[PrivilegeLevel] = None
+        self._bot_perms: Optional[discord.Permissions] = None
+
+    @staticmethod
+    def _get(ctx: "Context") -> "Optional[_SharedCheckCache]":
+        return getattr(ctx, "_shared_check_cache", None)
+
+    @classmethod
+    async def is_owner(cls, ctx: "Context") -> bool:
+        cache = cls._get(ctx)
+        if cache is None:
+            return await ctx.bot.is_owner(ctx.author)
+        if cache._is_owner is None:
+            cache._is_owner = await ctx.bot.is_owner(ctx.author)
+        return cache._is_owner
+
+    @classmethod
+    async def privilege_level(cls, ctx: "Context") -> PrivilegeLevel:
+        cache = cls._get(ctx)
+        if cache is None:
+            return await PrivilegeLevel.from_ctx(ctx)
+        if cache._privilege_level is None:
+            cache._privilege_level = await PrivilegeLevel.from_ctx(ctx)
+        return cache._privilege_level
+
+    @classmethod
+    def bot_perms(cls, ctx: "Context") -> discord.Permissions:
+        cache = cls._get(ctx)
+        if cache is not None and cache._bot_perms is not None:
+            return cache._bot_perms
+        bot_user = ctx.bot.user if ctx.guild is None else ctx.guild.me
+        bot_perms = ctx.channel.permissions_for(bot_user)
+        if cache is not None:
+            cache._bot_perms = bot_perms
+        return bot_perms
+
+
+@contextlib.contextmanager
+def _shared_check_cache(ctx: "Context") -> Iterator[None]:
+    """Reuse context-only check results for every `Requires.verify` call inside this block."""
+    if _SharedCheckCache._get(ctx) is not None:
+        # Already inside of one, let the outermost block own it
+        yield
+        return
+    ctx._shared_check_cache = _SharedCheckCache()
+    try:
+        yield
+    finally:
+        ctx._shared_check_cache = None
+
+
 # check decorators
 
 
@@ -8,8 +8,11 @@ from typing import (
     AsyncContextManager,
     Awaitable,
     Dict,
+    Iterable,
+    List,
     MutableMapping,
     Optional,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -255,6 +258,7 @@ class Value:
         if isinstance(value, dict):
             value = _str_key_dict(value)
         await self.driver.set(self.identifier_data, value=value)
+        self._config._track_member_write(self.identifier_data, value)
 
     async def clear(self):
         """
@@ -587,6 +591,7 @@ class Group(Value):
         if isinstance(value, dict):
             value = _str_key_dict(value)
         await self.driver.set(identifier_data, value=value)
+        self._config._track_member_write(identifier_data, value)
 
 
 class Config(metaclass=ConfigMeta):
@@ -652,6 +657,13 @@ class Config(metaclass=ConfigMeta):
             IdentifierData, asyncio.Lock
         ] = weakref.WeakValueDictionary()
 
+        # Maps member IDs to the IDs of the guilds they may have member data in.
+        # This is only built when first needed, see `guilds_with_member_data`.
+        self._member_index: Optional[Dict[int, Set[int]]] = None
+        self._member_index_lock = asyncio.Lock()
+        # Writes made while the index is being built
+        self._member_index_writes: Optional[List[Tuple[int, int]]] = None
+
     @property
     def defaults(self):
         return pickle.loads(pickle.dumps(self._defaults, -1))
@@ -1279,6 +1291,88 @@ class Config(metaclass=ConfigMeta):
                 ret = self._all_members_from_guild(guild_data)
         return ret
 
+    def _track_member_write(self, identifier_data: IdentifierData, value: Any) -> None:
+        """Keep the member index up to date with data written to the member scope."""
+        if identifier_data.category != self.MEMBER:
+            return
+        if self._member_index is None and self._member_index_writes is None:
+            return
+
+        primary_key = identifier_data.primary_key
+        if len(primary_key) == 2:
+            locations = [primary_key]
+        elif not isinstance(value, dict):
+            return
+        elif len(primary_key) == 1:
+            locations = [(primary_key[0], member_id) for member_id in value]
+        else:
+            locations = [
+                (guild_id, member_id)
+                for guild_id, guild_data in value.items()
+                for member_id in guild_data
+            ]
+
+        if self._member_index is not None:
+            for guild_id, member_id in locations:
+                self._member_index.setdefault(int(member_id), set()).add(int(guild_id))
+        else:
+            self._member_index_writes.extend((int(g), int(m)) for g, m in locations)
+
+    async def _get_member_index(self) -> Dict[int, Set[int]]:
+        async with self._member_index_lock:
+            if self._member_index is not None:
+                return self._member_index
+
+            self._member_index_writes = []
+            member_index: Dict[int, Set[int]] = {}
+            try:
+                all_data = await self.driver.get(self._get_base_group(self.MEMBER).identifier_data)
+            except KeyError:
+                all_data = {}
+            for guild_id, guild_data in all_data.items():
+                guild_id = int(guild_id)
+                for member_id in guild_data:
+                    member_index.setdefault(int(member_id), set()).add(guild_id)
+            for guild_id, member_id in self._member_index_writes:
+                member_index.setdefault(member_id, set()).add(guild_id)
+
+            self._member_index = member_index
+            self._member_index_writes = None
+            return member_index
+
+    async def guilds_with_member_data(self, user_ids: Iterable[int]) -> Dict[int, Set[int]]:
+        """Find which guilds have member data for the given users.
+
+        This is meant for handling data deletion requests without
+        reading and scanning all member data for every user.
+        The first call reads all member data once to build an index,
+        which is kept up to date as member data is set afterwards.
+
+        Note
+        ----
+        Clearing data doesn't remove guilds from the index,
+        so the result may include guilds which no longer have
+        any data for the user. Clearing their data in those is harmless.
+
+        Parameters
+        ----------
+        user_ids : Iterable[int]
+            The IDs of the users to look for.
+
+        Returns
+        -------
+        Dict[int, Set[int]]
+            A dictionary mapping :code:`USER_ID -> {GUILD_ID, ...}`.
+            Users without any member data are omitted.
+
+        """
+        member_index = await self._get_member_index()
+        return {
+            user_id: member_index[user_id].copy()
+            for user_id in user_ids
+            if member_index.get(user_id)
+        }
+
     async def _clear_scope(self, *scopes: str):
         """Clear all data in a particular scope.
 
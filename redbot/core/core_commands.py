@@ -3,11 +3,11 @@ import contextlib
 import datetime
 import importlib
 import itertools
+import json
 import keyword
 import logging
 import io
 import random
-import markdown
 import os
 import re
 import sys
@@ -44,8 +44,10 @@ from .utils.chat_formatting import (
     humanize_timedelta,
     inline,
     pagify,
+    text_to_file,
 )
 from .commands.requires import PrivilegeLevel
+from ._startup_tracer import startup_tracer
 
 
 _entities = {
@@ -597,6 +599,8 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
             for ext in no_statements:
                 parts.append(f"\n - {entity_transformer(ext)}")
 
+        import markdown
+
         generated = markdown.markdown("\n".join(parts), output_format="html")
 
         html = "\n".join((PRETTY_HTML_HEAD, generated, HTML_CLOSING))
@@ -2642,7 +2646,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         msg = _("Data path: {path}").format(path=data_dir)
         await ctx.send(box(msg))
 
-    @commands.command(hidden=True)
+    @commands.group(hidden=True, invoke_without_command=True)
     @checks.is_owner()
     async def debuginfo(self, ctx: commands.Context):
         """Shows debug information useful for debugging."""
@@ -2729,6 +2733,42 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
             )
             await ctx.send(box(info))
 
+    @debuginfo.command(name="startup")
+    async def debuginfo_startup(self, ctx: commands.Context):
+        """Shows where the time was spent during startup.
+
+        This is only available when Red was started with the `--trace-startup` flag.
+        """
+        if not startup_tracer.enabled:
+            await ctx.send(
+                _(
+                    "Startup wasn't traced. Start the bot with the `--trace-startup` flag"
+                    " (or `--trace-startup-imports` to also trace module imports) to use this."
+                )
+            )
+            return
+
+        report = startup_tracer.to_dict()
+        lines = []
+        if report["total"] is not None:
+            lines.append("Total: {wall:.3f}s wall, {cpu:.3f}s CPU\n".format(**report["total"]))
+        lines.append("Phases:")
+        for phase in report["phases"]:
+            lines.append("  {name}: {wall:.3f}s wall, {cpu:.3f}s CPU".format(**phase))
+        if report["cogs"]:
+            lines.append("\nSlowest packages:")
+            for cog in report["cogs"][:10]:
+                lines.append("  {name}: {wall:.3f}s wall, {cpu:.3f}s CPU".format(**cog))
+        if "imports" in report:
+            lines.append("\nSlowest imports (by top-level package):")
+            for name, self_time in list(report["imports"]["packages"].items())[:10]:
+                lines.append(f"  {name}: {self_time:.3f}s")
+
+        await ctx.send(
+            box("\n".join(lines)),
+            file=text_to_file(json.dumps(report, indent=4), filename="startup_trace.json"),
+        )
+
     @commands.group(aliases=["whitelist"])
     @checks.is_owner()
     async def allowlist(self, ctx: commands.Context):
@@ -3340,7 +3380,7 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         Gets the current members and roles configured for automatic
         moderation action immunity.
         """
-        ai_ids = await ctx.bot._config.guild(ctx.guild).autoimmune_ids()
+        ai_ids = await ctx.bot._autoimmune_cache.get_immune_ids(ctx.guild)
 
         roles = {r.name for r in ctx.guild.roles if r.id in ai_ids}
         members = {str(m) for m in ctx.guild.members if m.id in ai_ids}
@@ -3368,10 +3408,8 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         """
         Makes a user or role immune from automated moderation actions.
         """
-        async with ctx.bot._config.guild(ctx.guild).autoimmune_ids() as ai_ids:
-            if user_or_role.id in ai_ids:
-                return await ctx.send(_("Already added."))
-            ai_ids.append(user_or_role.id)
+        if not await ctx.bot._autoimmune_cache.add_immune_id(ctx.guild, user_or_role.id):
+            return await ctx.send(_("Already added."))
         await ctx.tick()
 
     @autoimmune_group.command(name="remove")
@@ -3381,10 +3419,8 @@ class Core(commands.commands._RuleDropper, commands.Cog, CoreLogic):
         """
         Makes a user or role immune from automated moderation actions.
         """
-        async with ctx.bot._config.guild(ctx.guild).autoimmune_ids() as ai_ids:
-            if user_or_role.id not in ai_ids:
-                return await ctx.send(_("Not in list."))
-            ai_ids.remove(user_or_role.id)
+        if not await ctx.bot._autoimmune_cache.remove_immune_id(ctx.guild, user_or_role.id):
+            return await ctx.send(_("Not in list."))
         await ctx.tick()
 
     @autoimmune_group.command(name="isimmune")
@@ -1,6 +1,6 @@
 import abc
 import enum
-from typing import Tuple, Dict, Any, Union, List, AsyncIterator, Type
+from typing import Tuple, Dict, Any, Union, List, AsyncIterator, Iterable, Type
 
 __all__ = ["BaseDriver", "IdentifierData", "ConfigCategory"]
 
@@ -231,6 +231,23 @@ class BaseDriver(abc.ABC):
         """
         raise NotImplementedError
 
+    async def set_many(self, items: Iterable[Tuple[IdentifierData, Any]]) -> None:
+        """
+        Sets the values of multiple keys at once.
+
+        Drivers which can write several keys in a single operation
+        (or transaction) should override this, the default
+        implementation simply calls :py:meth:`set` for each key.
+
+        Parameters
+        ----------
+        items
+            Pairs of identifier data and the JSON serializable value
+            to set for it.
+        """
+        for identifier_data, value in items:
+            await self.set(identifier_data, value=value)
+
     @abc.abstractmethod
     async def clear(self, identifier_data: IdentifierData) -> None:
         """
@@ -6,7 +6,7 @@ import pickle
 import weakref
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, Tuple
 from uuid import uuid4
 
 from .. import data_manager, errors
@@ -19,6 +19,8 @@ _shared_datastore = {}
 _driver_counts = {}
 _finalizers = []
 _locks = defaultdict(asyncio.Lock)
+_data_paths: Dict[str, Path] = {}
+_MISSING = object()
 
 log = logging.getLogger("redbot.json_driver")
 
@@ -34,6 +36,7 @@ def finalize_driver(cog_name):
             del _shared_datastore[cog_name]
         if cog_name in _locks:
             del _locks[cog_name]
+        _data_paths.pop(cog_name, None)
 
     for f in _finalizers:
         if not f.alive:
@@ -72,6 +75,7 @@ class JsonDriver(BaseDriver):
             self.data_path = data_manager.cog_data_path(raw_name=cog_name)
         self.data_path.mkdir(parents=True, exist_ok=True)
         self.data_path = self.data_path / self.file_name
+        _data_paths[cog_name] = self.data_path
         self._load_data()
 
     @property
@@ -139,21 +143,42 @@ class JsonDriver(BaseDriver):
         return pickle.loads(pickle.dumps(partial, -1))
 
     async def set(self, identifier_data: IdentifierData, value=None):
-        partial = self.data
-        full_identifiers = identifier_data.to_tuple()[1:]
-        # This is both our deepcopy() and our way of making sure this value is actually JSON
-        # serializable.
-        value_copy = json.loads(json.dumps(value))
+        await self.set_many(((identifier_data, value),))
 
-        async with self._lock:
-            for i in full_identifiers[:-1]:
-                try:
-                    partial = partial.setdefault(i, {})
-                except AttributeError:
-                    # Tried to set sub-field of non-object
-                    raise errors.CannotSetSubfield
+    async def set_many(self, items: Iterable[Tuple[IdentifierData, Any]]):
+        # This is both our deepcopy() and our way of making sure the values are actually JSON
+        # serializable. It's done up front so that nothing is written if any of them isn't.
+        items = [
+            (identifier_data.to_tuple()[1:], json.loads(json.dumps(value)))
+            for identifier_data, value in items
+        ]
 
-            partial[full_identifiers[-1]] = value_copy
+        async with self._lock:
+            # (container, key, previous value) for each change made to the data,
+            # so that the earlier items can be undone if a later one can't be set.
+            changes = []
+            try:
+                for full_identifiers, value_copy in items:
+                    partial = self.data
+                    for i in full_identifiers[:-1]:
+                        if i not in partial:
+                            changes.append((partial, i, _MISSING))
+                            partial[i] = {}
+                        partial = partial[i]
+                        if not isinstance(partial, dict):
+                            # Tried to set sub-field of non-object
+                            raise errors.CannotSetSubfield
+
+                    key = full_identifiers[-1]
+                    changes.append((partial, key, partial.get(key, _MISSING)))
+                    partial[key] = value_copy
+            except errors.CannotSetSubfield:
+                for container, key, previous in reversed(changes):
+                    if previous is _MISSING:
+                        del container[key]
+                    else:
+                        container[key] = previous
+                raise
             await self._save()
 
     async def clear(self, identifier_data: IdentifierData):
@@ -221,6 +246,34 @@ class JsonDriver(BaseDriver):
         await loop.run_in_executor(None, _save_json, self.data_path, self.data)
 
 
+async def snapshot_json_data() -> Dict[Path, bytes]:
+    """
+    Take a consistent snapshot of the data held by the loaded JSON drivers.
+
+    Each cog's data is serialized while holding that cog's lock, so a write
+    can't land halfway through, but the serialization itself happens in
+    an executor to avoid blocking the event loop.
+
+    Returns
+    -------
+    Dict[pathlib.Path, bytes]
+        Mapping of the path of each data file to its serialized contents.
+    """
+    loop = asyncio.get_running_loop()
+    snapshot = {}
+    for cog_name, path in list(_data_paths.items()):
+        async with _locks[cog_name]:
+            data = _shared_datastore.get(cog_name)
+            if data is None:
+                continue
+            snapshot[path] = await loop.run_in_executor(None, _dump_json, data)
+    return snapshot
+
+
+def _dump_json(data: Dict[str, Any]) -> bytes:
+    return json.dumps(data).encode("utf-8")
+
+
 def _save_json(path: Path, data: Dict[str, Any]) -> None:
     """
     This fsync stuff here is entirely necessary.
@@ -2,7 +2,7 @@ import getpass
 import json
 import sys
 from pathlib import Path
-from typing import Optional, Any, AsyncIterator, Tuple, Union, Callable, List
+from typing import Optional, Any, AsyncIterator, Iterable, Tuple, Union, Callable, List
 
 try:
     # pylint: disable=import-error
@@ -162,6 +162,20 @@ class PostgresDriver(BaseDriver):
         except asyncpg.ErrorInAssignmentError:
             raise errors.CannotSetSubfield
 
+    async def set_many(self, items: Iterable[Tuple[IdentifierData, Any]]):
+        query = "SELECT red_config.set($1, $2::jsonb)"
+        args = [
+            (encode_identifier_data(identifier_data), json.dumps(value))
+            for identifier_data, value in items
+        ]
+        log.invisible("Query (in transaction, %s times): %s", len(args), query)
+        try:
+            async with self._pool.acquire() as conn, conn.transaction():
+                for arg in args:
+                    await conn.execute(query, *arg)
+        except asyncpg.ErrorInAssignmentError:
+            raise errors.CannotSetSubfield
+
     async def clear(self, identifier_data: IdentifierData):
         try:
             await self._execute(
@@ -9,9 +9,7 @@ from datetime import datetime, timedelta
 
 import aiohttp
 import discord
-import pkg_resources
 from colorama import Fore, Style, init
-from pkg_resources import DistributionNotFound
 from redbot.core import data_manager
 
 from redbot.core.commands import RedHelpFormatter, HelpSettings
@@ -19,12 +17,12 @@ from redbot.core.i18n import (
     Translator,
     set_contextual_locale,
     set_contextual_regional_format,
-    set_contextual_locales_from_guild,
 )
 from .utils import AsyncIter
 from .. import __version__ as red_version, version_info as red_version_info, VersionInfo
 from . import commands
 from .config import get_latest_confs
+from ._startup_tracer import startup_tracer
 from .utils._internal_utils import (
     fuzzy_command_search,
     format_fuzzy_results,
@@ -60,6 +58,12 @@ def init_events(bot, cli_flags):
             return
 
         bot._uptime = datetime.utcnow()
+        startup_tracer.end("connecting to Discord")
+        startup_tracer.finish()
+        if startup_tracer.enabled:
+            trace_path = data_manager.core_data_path() / "logs" / "startup_trace.json"
+            startup_tracer.dump(trace_path)
+            log.info("Startup trace saved to %s", trace_path)
 
         guilds = len(bot.guilds)
         users = len(set([m for m in bot.get_all_members()]))
@@ -80,6 +84,8 @@ def init_events(bot, cli_flags):
 
         prefixes = cli_flags.prefix or (await bot._config.prefix())
         lang = await bot._config.locale()
+        import pkg_resources
+
         red_pkg = pkg_resources.get_distribution("Red-DiscordBot")
         dpy_version = discord.__version__
 
@@ -170,7 +176,7 @@ def init_events(bot, cli_flags):
             reqs = [x.name for x in red_pkg._dep_map[key]]
             try:
                 pkg_resources.require(reqs)
-            except DistributionNotFound:
+            except pkg_resources.DistributionNotFound:
                 reqs_installed[key] = False
             else:
                 reqs_installed[key] = True
@@ -318,7 +324,7 @@ def init_events(bot, cli_flags):
 
     @bot.event
     async def on_message(message):
-        await set_contextual_locales_from_guild(bot, message.guild)
+        await bot.get_message_context(message).set_contextual_locales()
 
         await bot.process_commands(message)
         discord_now = message.created_at
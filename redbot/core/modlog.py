@@ -1,9 +1,20 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import logging
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import List, Literal, Union, Optional, cast, TYPE_CHECKING
+from typing import (
+    Dict,
+    List,
+    Literal,
+    Union,
+    Optional,
+    Set,
+    cast,
+    TYPE_CHECKING,
+)
 
 import discord
 
@@ -27,10 +38,13 @@ log = logging.getLogger("red.core.modlog")
 
 __all__ = [
     "Case",
+    "CaseSummary",
     "CaseType",
     "get_case",
     "get_all_cases",
     "get_cases_for_member",
+    "get_case_numbers_for_member",
+    "get_case_summaries",
     "create_case",
     "get_casetype",
     "get_all_casetypes",
@@ -53,8 +67,128 @@ _data_deletion_lock = asyncio.Lock()
 _ = Translator("ModLog", __file__)
 
 
+class _GuildCaseIndex:
+    """In-memory index over a single guild's cases.
+
+    Keeps a mapping of user ID -> sorted case numbers, so that looking up
+    a member's cases doesn't require loading every case in the guild.
+    """
+
+    __slots__ = ("by_user",)
+
+    def __init__(self):
+        self.by_user: Dict[int, List[int]] = {}
+
+    @classmethod
+    def from_cases(cls, cases: dict) -> _GuildCaseIndex:
+        index = cls()
+        for case_number_str, case_data in cases.items():
+            case_number = int(case_number_str)
+            index.by_user.setdefault(case_data.get("user") or 0, []).append(case_number)
+        for case_numbers in index.by_user.values():
+            case_numbers.sort()
+        return index
+
+    def add(self, case_number: int, user_id: Optional[int]) -> None:
+        _insort_unique(self.by_user.setdefault(user_id or 0, []), case_number)
+
+    def move(self, case_number: int, old_user_id: Optional[int], new_user_id: Optional[int]):
+        old_user_id, new_user_id = old_user_id or 0, new_user_id or 0
+        if old_user_id == new_user_id:
+            return
+        user_cases = self.by_user.get(old_user_id)
+        if user_cases:
+            pos = bisect.bisect_left(user_cases, case_number)
+            if pos < len(user_cases) and user_cases[pos] == case_number:
+                del user_cases[pos]
+            if not user_cases:
+                del self.by_user[old_user_id]
+        _insort_unique(self.by_user.setdefault(new_user_id, []), case_number)
+
+    def for_user(self, user_id: int) -> List[int]:
+        return self.by_user.get(user_id, []).copy()
+
+
+def _insort_unique(seq: List[int], value: int) -> None:
+    pos = bisect.bisect_left(seq, value)
+    if pos == len(seq) or seq[pos] != value:
+        seq.insert(pos, value)
+
+
+_case_indexes: Dict[int, _GuildCaseIndex] = {}
+
+
+class _CaseMessageCache:
+    """Small LRU cache of modlog messages, keyed by message ID.
+
+    Concurrent lookups of the same message share a single fetch.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._cached: "OrderedDict[int, Optional[discord.Message]]" = OrderedDict()
+        self._pending: Dict[int, asyncio.Future] = {}
+
+    def clear(self) -> None:
+        self._cached.clear()
+
+    async def get(
+        self, bot: Red, mod_channel: Optional[discord.TextChannel], message_id: int
+    ) -> Optional[discord.Message]:
+        try:
+            self._cached.move_to_end(message_id)
+        except KeyError:
+            pass
+        else:
+            return self._cached[message_id]
+
+        message = discord.utils.get(bot.cached_messages, id=message_id)
+        if message is not None or mod_channel is None:
+            return message
+
+        fut = self._pending.get(message_id)
+        if fut is None:
+            fut = asyncio.ensure_future(self._fetch(mod_channel, message_id))
+            self._pending[message_id] = fut
+            fut.add_done_callback(lambda _fut: self._pending.pop(message_id, None))
+        return await asyncio.shield(fut)
+
+    async def _fetch(
+        self, mod_channel: discord.TextChannel, message_id: int
+    ) -> Optional[discord.Message]:
+        try:
+            message = await mod_channel.fetch_message(message_id)
+        except (discord.NotFound, AttributeError):
+            message = None
+        self._cached[message_id] = message
+        if len(self._cached) > self.maxsize:
+            self._cached.popitem(last=False)
+        return message
+
+
+_message_cache = _CaseMessageCache()
+
+
+async def _get_case_index(guild_id: int) -> _GuildCaseIndex:
+    index = _case_indexes.get(guild_id)
+    if index is None:
+        cases = await _config.custom(_CASES, str(guild_id)).all()
+        # Another task may have built (and since updated) the index while we were waiting
+        # on config, in which case that one needs to win.
+        index = _case_indexes.setdefault(guild_id, _GuildCaseIndex.from_cases(cases))
+    return index
+
+
 async def _process_data_deletion(
     *, requester: Literal["discord_deleted_user", "owner", "user", "user_strict"], user_id: int
+):
+    await _process_bulk_data_deletion(requester=requester, user_ids={user_id})
+
+
+async def _process_bulk_data_deletion(
+    *,
+    requester: Literal["discord_deleted_user", "owner", "user", "user_strict"],
+    user_ids: Set[int],
 ):
     if requester != "discord_deleted_user":
         return
@@ -64,22 +198,27 @@ async def _process_data_deletion(
     key_paths = []
 
     async with _data_deletion_lock:
+        # A single scan handles all of the users
         all_cases = await _config.custom(_CASES).all()
         async for guild_id_str, guild_cases in AsyncIter(all_cases.items(), steps=100):
             async for case_num_str, case in AsyncIter(guild_cases.items(), steps=100):
                 for keyname in ("user", "moderator", "amended_by"):
-                    if (case.get(keyname, 0) or 0) == user_id:  # this could be None...
+                    if (case.get(keyname, 0) or 0) in user_ids:  # this could be None...
                         key_paths.append((guild_id_str, case_num_str))
+                        break
 
         async with _config.custom(_CASES).all() as all_cases:
             for guild_id_str, case_num_str in key_paths:
                 case = all_cases[guild_id_str][case_num_str]
-                if (case.get("user", 0) or 0) == user_id:
+                if (user_id := case.get("user", 0) or 0) in user_ids:
                     case["user"] = 0xDE1
                     case.pop("last_known_username", None)
-                if (case.get("moderator", 0) or 0) == user_id:
+                    index = _case_indexes.get(int(guild_id_str))
+                    if index is not None:
+                        index.move(int(case_num_str), user_id, 0xDE1)
+                if (case.get("moderator", 0) or 0) in user_ids:
                     case["moderator"] = 0xDE1
-                if (case.get("amended_by", 0) or 0) == user_id:
+                if (case.get("amended_by", 0) or 0) in user_ids:
                     case["amended_by"] = 0xDE1
 
 
@@ -87,6 +226,8 @@ async def _init(bot: Red):
     global _config
     global _bot_ref
     _bot_ref = bot
+    _case_indexes.clear()
+    _message_cache.clear()
     _config = Config.get_conf(None, 1354799444, cog_name="ModLog")
     _config.register_global(schema_version=1)
     _config.register_guild(mod_log=None, casetypes={}, latest_case_number=0)
@@ -287,6 +428,7 @@ class Case:
         data.pop("case_number", None)
         # last username is set based on passed user object
         data.pop("last_known_username", None)
+        old_user_id = self._get_user_id()
         for item, value in data.items():
             if isinstance(value, discord.Object):
                 # probably expensive to call but meh should capture all cases
@@ -298,7 +440,9 @@ class Case:
         if not isinstance(self.user, int):
             self.last_known_username = f"{self.user.name}#{self.user.discriminator}"
 
+        index = await _get_case_index(self.guild.id)
         await _config.custom(_CASES, str(self.guild.id), str(self.case_number)).set(self.to_json())
+        index.move(self.case_number, old_user_id, self._get_user_id())
         self.bot.dispatch("modlog_case_edit", self)
         if not self.message:
             return
@@ -467,6 +611,11 @@ class Case:
                 case_text += _("**Last modified at:** {}\n").format(last_modified)
             return case_text.strip()
 
+    def _get_user_id(self) -> Optional[int]:
+        if self.user is None or isinstance(self.user, int):
+            return self.user
+        return self.user.id
+
     def to_json(self) -> dict:
         """Transform the object to a dict
 
@@ -484,10 +633,7 @@ class Case:
             amended_by = self.amended_by
         else:
             amended_by = self.amended_by.id
-        if isinstance(self.user, int):
-            user_id = self.user
-        else:
-            user_id = self.user.id
+        user_id = self._get_user_id()
         data = {
             "case_number": self.case_number,
             "action_type": self.action_type,
@@ -546,18 +692,7 @@ class Case:
         if message is None:
             message_id = data.get("message")
             if message_id is not None:
-                try:
-                    message = discord.utils.get(bot.cached_messages, id=message_id)
-                except AttributeError:
-                    # bot.cached_messages didn't exist prior to discord.py 1.1.0
-                    message = None
-                if message is None:
-                    try:
-                        message = await mod_channel.fetch_message(message_id)
-                    except (discord.NotFound, AttributeError):
-                        message = None
-            else:
-                message = None
+                message = await _message_cache.get(bot, mod_channel, message_id)
 
         user_objects = {"user": None, "moderator": None, "amended_by": None}
         for user_key in tuple(user_objects):
@@ -588,6 +723,94 @@ class Case:
         )
 
 
+class CaseSummary:
+    """A lightweight view of a mod log case.
+
+    Only holds IDs and timestamps, so building it doesn't require
+    any requests to Discord. Use `fetch_case()` to get the full `Case`.
+
+    Attributes
+    ----------
+    guild: discord.Guild
+        The guild the case belongs to.
+    case_number: int
+        The case's number.
+    action_type: str
+        The name of the case's case type.
+    created_at: int
+        The timestamp of when the case was created.
+    user_id: int
+        The ID of the user the case is for.
+    moderator_id: Optional[int]
+        The ID of the moderator who took the action.
+    until: Optional[int]
+        The timestamp of when the action is in effect until.
+    modified_at: Optional[int]
+        The timestamp of when the case was last modified.
+    message_id: Optional[int]
+        The ID of the case's message in the mod log channel.
+    """
+
+    __slots__ = (
+        "guild",
+        "case_number",
+        "action_type",
+        "created_at",
+        "user_id",
+        "moderator_id",
+        "until",
+        "modified_at",
+        "message_id",
+        "_data",
+    )
+
+    def __init__(self, guild: discord.Guild, case_number: int, data: dict):
+        self.guild = guild
+        self.case_number = case_number
+        self.action_type: str = data["action_type"]
+        self.created_at: int = data["created_at"]
+        self.user_id: int = data["user"]
+        self.moderator_id: Optional[int] = data.get("moderator")
+        self.until: Optional[int] = data.get("until")
+        self.modified_at: Optional[int] = data.get("modified_at")
+        self.message_id: Optional[int] = data.get("message")
+        self._data = data
+
+    def __repr__(self) -> str:
+        return (
+            f"<CaseSummary guild={self.guild.id} case_number={self.case_number}"
+            f" action_type={self.action_type!r} user_id={self.user_id}>"
+        )
+
+    async def fetch_case(self, bot: Red) -> Case:
+        """Get the full `Case` this summary refers to.
+
+        Parameters
+        ----------
+        bot: Red
+            The bot's instance.
+
+        Returns
+        -------
+        Case
+            The case object.
+
+        Raises
+        ------
+        `discord.Forbidden`
+            Cannot read message history to fetch the original message.
+        `discord.HTTPException`
+            A generic API issue
+        """
+        try:
+            mod_channel = await get_modlog_channel(self.guild)
+        except RuntimeError:
+            mod_channel = None
+        return await Case.from_json(
+            mod_channel, bot, self.case_number, self._data, guild=self.guild
+        )
+
+
 class CaseType:
     """
     A single case type
@@ -766,8 +989,8 @@ async def get_all_cases(guild: discord.Guild, bot: Red) -> List[Case]:
     cases = await _config.custom(_CASES, str(guild.id)).all()
     mod_channel = await get_modlog_channel(guild)
     return [
-        await Case.from_json(mod_channel, bot, case_number, case_data)
-        for case_number, case_data in cases.items()
+        await Case.from_json(mod_channel, bot, int(case_number), case_data)
+        for case_number, case_data in sorted(cases.items(), key=lambda item: int(item[0]))
     ]
 
 
@@ -803,8 +1026,6 @@ async def get_cases_for_member(
         Fetching the user failed.
     """
 
-    cases = await _config.custom(_CASES, str(guild.id)).all()
-
     if not (member_id or member):
         raise ValueError("Expected a member or a member id to be provided.") from None
 
@@ -819,13 +1040,72 @@ async def get_cases_for_member(
     except RuntimeError:
         modlog_channel = None
 
-    cases = [
-        await Case.from_json(modlog_channel, bot, case_number, case_data, user=member, guild=guild)
-        for case_number, case_data in cases.items()
-        if case_data["user"] == member_id
+    return [
+        await Case.from_json(
+            modlog_channel, bot, summary.case_number, summary._data, user=member, guild=guild
+        )
+        for summary in await get_case_summaries(guild, member_id=member_id)
     ]
 
-    return cases
+
+async def get_case_numbers_for_member(guild: discord.Guild, member_id: int) -> List[int]:
+    """
+    Gets the numbers of all cases for the specified member id in a guild.
+
+    This is served from an in-memory index and doesn't fetch any
+    case data, making it suitable for paginating through cases.
+
+    Parameters
+    ----------
+    guild: `discord.Guild`
+        The guild to get the case numbers from
+    member_id: int
+        The id of the member to get case numbers for
+
+    Returns
+    -------
+    List[int]
+        The matching case numbers, in ascending order.
+    """
+    index = await _get_case_index(guild.id)
+    return index.for_user(member_id)
+
+
+async def get_case_summaries(
+    guild: discord.Guild, *, member_id: Optional[int] = None
+) -> List[CaseSummary]:
+    """
+    Gets lightweight summaries of the cases in a guild.
+
+    Unlike `get_all_cases()` and `get_cases_for_member()`,
+    this doesn't make any requests to Discord.
+
+    Parameters
+    ----------
+    guild: `discord.Guild`
+        The guild to get the cases from
+    member_id: Optional[int]
+        If provided, only cases for the member with this id are returned.
+
+    Returns
+    -------
+    List[CaseSummary]
+        The matching case summaries, ordered by case number.
+    """
+    if member_id is None:
+        cases = await _config.custom(_CASES, str(guild.id)).all()
+        return [
+            CaseSummary(guild, int(case_number), case_data)
+            for case_number, case_data in sorted(cases.items(), key=lambda item: int(item[0]))
+        ]
+
+    summaries = []
+    for case_number in await get_case_numbers_for_member(guild, member_id):
+        case_data = await _config.custom(_CASES, str(guild.id), str(case_number)).all()
+        # the index can briefly lag behind data deletion, so double-check the owner
+        if case_data and case_data["user"] == member_id:
+            summaries.append(CaseSummary(guild, case_number, case_data))
+    return summaries
 
 
 async def create_case(
@@ -888,6 +1168,7 @@ async def create_case(
         # We're getting the case number from config, incrementing it, awaiting something, then
         # setting it again. This warrants acquiring the lock.
         next_case_number = await _config.guild(guild).latest_case_number() + 1
+        index = await _get_case_index(guild.id)
 
         case = Case(
             bot,
@@ -907,6 +1188,7 @@ async def create_case(
         )
         await _config.custom(_CASES, str(guild.id), str(next_case_number)).set(case.to_json())
         await _config.guild(guild).latest_case_number.set(next_case_number)
+        index.add(next_case_number, case._get_user_id())
 
     await set_contextual_locales_from_guild(bot, guild)
     bot.dispatch("modlog_case_create", case)
@@ -1151,6 +1433,7 @@ async def reset_cases(guild: discord.Guild) -> None:
     """
     await _config.custom(_CASES, str(guild.id)).clear()
     await _config.guild(guild).latest_case_number.clear()
+    _case_indexes[guild.id] = _GuildCaseIndex()
 
 
 def _strfdelta(delta):
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Union, Set, Iterable, Tuple, overload
+from typing import Dict, FrozenSet, List, Optional, Union, Set, Iterable, Tuple, overload
 import asyncio
 from argparse import Namespace
-from collections import defaultdict
 
 import discord
 
@@ -209,6 +208,63 @@ class IgnoreManager:
             await self._config.guild_from_id(gid).ignored.clear()
 
 
+class AutoImmuneManager:
+    def __init__(self, config: Config):
+        self._config: Config = config
+        self._cached: Dict[int, FrozenSet[int]] = {}
+
+    async def discord_deleted_user(self, user_id: int):
+        await self.discord_deleted_users({user_id})
+
+    async def discord_deleted_users(self, user_ids: Set[int]):
+        all_guilds = await self._config.all_guilds()
+
+        async for guild_id, guild_data in AsyncIter(all_guilds.items(), steps=100):
+            if user_ids.isdisjoint(guild_data.get("autoimmune_ids", [])):
+                continue
+            async with self._config.guild_from_id(guild_id).autoimmune_ids() as ids:
+                # filter the current value, as it may have changed since reading all guilds
+                ids[:] = [i for i in ids if i not in user_ids]
+                self._cached[guild_id] = frozenset(ids)
+
+    async def get_immune_ids(self, guild: discord.Guild) -> FrozenSet[int]:
+        ret: FrozenSet[int]
+
+        gid: int = guild.id
+
+        if gid in self._cached:
+            ret = self._cached[gid]
+        else:
+            ret = frozenset(await self._config.guild_from_id(gid).autoimmune_ids())
+            self._cached[gid] = ret
+
+        return ret
+
+    async def add_immune_id(self, guild: discord.Guild, id_to_add: int) -> bool:
+        """
+        Returns whether or not any change was made.
+        """
+        gid: int = guild.id
+        async with self._config.guild_from_id(gid).autoimmune_ids() as ai_ids:
+            if id_to_add in ai_ids:
+                return False
+            ai_ids.append(id_to_add)
+            self._cached[gid] = frozenset(ai_ids)
+        return True
+
+    async def remove_immune_id(self, guild: discord.Guild, id_to_remove: int) -> bool:
+        """
+        Returns whether or not any change was made.
+        """
+        gid: int = guild.id
+        async with self._config.guild_from_id(gid).autoimmune_ids() as ai_ids:
+            if id_to_remove not in ai_ids:
+                return False
+            ai_ids.remove(id_to_remove)
+            self._cached[gid] = frozenset(ai_ids)
+        return True
+
+
 class WhitelistBlacklistManager:
     def __init__(self, config: Config):
         self._config: Config = config
@@ -221,25 +277,25 @@ class WhitelistBlacklistManager:
         self._access_lock = asyncio.Lock()
 
     async def discord_deleted_user(self, user_id: int):
+        await self.discord_deleted_users({user_id})
+
+    async def discord_deleted_users(self, user_ids: Set[int]):
 
         async with self._access_lock:
 
             async for guild_id_or_none, ids in AsyncIter(
                 self._cached_whitelist.items(), steps=100
             ):
-                ids.discard(user_id)
+                ids.difference_update(user_ids)
 
             async for guild_id_or_none, ids in AsyncIter(
                 self._cached_blacklist.items(), steps=100
             ):
-                ids.discard(user_id)
+                ids.difference_update(user_ids)
 
             for grp in (self._config.whitelist, self._config.blacklist):
                 async with grp() as ul:
-                    try:
-                        ul.remove(user_id)
-                    except ValueError:
-                        pass
+                    ul[:] = [i for i in ul if i not in user_ids]
 
             # don't use this in extensions, it's optimized and controlled for here,
             # but can't be safe in 3rd party use
@@ -247,10 +303,10 @@ class WhitelistBlacklistManager:
             async with self._config._get_base_group("GUILD").all() as abuse:
                 for guild_str, guild_data in abuse.items():
                     for l_name in ("whitelist", "blacklist"):
-                        try:
-                            guild_data[l_name].remove(user_id)
-                        except (ValueError, KeyError):
-                            pass  # this is raw access not filled with defaults
+                        if l_name in guild_data:  # this is raw access not filled with defaults
+                            guild_data[l_name] = [
+                                i for i in guild_data[l_name] if i not in user_ids
+                            ]
 
     async def get_whitelist(self, guild: Optional[discord.Guild] = None) -> Set[int]:
         async with self._access_lock:
@@ -398,11 +454,56 @@ class WhitelistBlacklistManager:
 class DisabledCogCache:
     def __init__(self, config: Config):
         self._config = config
-        self._disable_map: Dict[str, Dict[int, bool]] = defaultdict(dict)
+        # Each cog name gets a bit, which is the same in every guild.
+        self._cog_bits: Dict[str, int] = {}
+        # Per guild, the cogs with a setting in that guild, and which of those are disabled.
+        # Guild ID 0 holds the default settings.
+        self._set_bits: Dict[int, int] = {}
+        self._disabled_bits: Dict[int, int] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    def _get_cog_bit(self, cog_name: str) -> int:
+        try:
+            return self._cog_bits[cog_name]
+        except KeyError:
+            bit = self._cog_bits[cog_name] = 1 << len(self._cog_bits)
+            return bit
+
+    def _set_disabled(self, cog_name: str, guild_id: int, disabled: Optional[bool]):
+        bit = self._get_cog_bit(cog_name)
+        set_bits = self._set_bits.get(guild_id, 0)
+        disabled_bits = self._disabled_bits.get(guild_id, 0) & ~bit
+        if disabled is None:
+            set_bits &= ~bit
+        else:
+            set_bits |= bit
+            if disabled:
+                disabled_bits |= bit
+        self._set_bits[guild_id] = set_bits
+        self._disabled_bits[guild_id] = disabled_bits
 
-    async def cog_disabled_in_guild(self, cog_name: str, guild_id: int) -> bool:
+    async def initialize(self):
         """
-        Check if a cog is disabled in a guild
+        Loads the settings for all cogs and guilds.
+
+        This is done once by the bot before connecting to Discord,
+        and is required for `cog_disabled_in_guild_nowait`.
+        """
+        async with self._load_lock:
+            if self._loaded:
+                return
+            all_settings = await self._config.custom("COG_DISABLE_SETTINGS").all()
+            for cog_name, guild_settings in all_settings.items():
+                for guild_id, data in guild_settings.items():
+                    self._set_disabled(cog_name, int(guild_id), data.get("disabled"))
+            self._loaded = True
+
+    def cog_disabled_in_guild_nowait(self, cog_name: str, guild_id: int) -> bool:
+        """
+        Check if a cog is disabled in a guild without awaiting.
+
+        This is only accurate once `initialize` has been awaited.
 
         Parameters
         ----------
@@ -414,18 +515,31 @@ class DisabledCogCache:
         -------
         bool
         """
+        bit = self._cog_bits.get(cog_name)
+        if bit is None:
+            # No settings for this cog anywhere
+            return False
+        if not self._set_bits.get(guild_id, 0) & bit:
+            guild_id = 0
+        return bool(self._disabled_bits.get(guild_id, 0) & bit)
 
-        if guild_id in self._disable_map[cog_name]:
-            return self._disable_map[cog_name][guild_id]
+    async def cog_disabled_in_guild(self, cog_name: str, guild_id: int) -> bool:
+        """
+        Check if a cog is disabled in a guild
 
-        gset = await self._config.custom("COG_DISABLE_SETTINGS", cog_name, guild_id).disabled()
-        if gset is None:
-            gset = await self._config.custom("COG_DISABLE_SETTINGS", cog_name, 0).disabled()
-            if gset is None:
-                gset = False
+        Parameters
+        ----------
+        cog_name: str
+            This should be the cog's qualified name, not necessarily the classname
+        guild_id: int
 
-        self._disable_map[cog_name][guild_id] = gset
-        return gset
+        Returns
+        -------
+        bool
+        """
+        if not self._loaded:
+            await self.initialize()
+        return self.cog_disabled_in_guild_nowait(cog_name, guild_id)
 
     async def default_disable(self, cog_name: str):
         """
@@ -437,7 +551,7 @@ class DisabledCogCache:
             This should be the cog's qualified name, not necessarily the classname
         """
         await self._config.custom("COG_DISABLE_SETTINGS", cog_name, 0).disabled.set(True)
-        del self._disable_map[cog_name]
+        self._set_disabled(cog_name, 0, True)
 
     async def default_enable(self, cog_name: str):
         """
@@ -449,7 +563,7 @@ class DisabledCogCache:
             This should be the cog's qualified name, not necessarily the classname
         """
         await self._config.custom("COG_DISABLE_SETTINGS", cog_name, 0).disabled.clear()
-        del self._disable_map[cog_name]
+        self._set_disabled(cog_name, 0, None)
 
     async def disable_cog_in_guild(self, cog_name: str, guild_id: int) -> bool:
         """
@@ -471,7 +585,7 @@ class DisabledCogCache:
         if await self.cog_disabled_in_guild(cog_name, guild_id):
             return False
 
-        self._disable_map[cog_name][guild_id] = True
+        self._set_disabled(cog_name, guild_id, True)
         await self._config.custom("COG_DISABLE_SETTINGS", cog_name, guild_id).disabled.set(True)
         return True
 
@@ -495,6 +609,6 @@ class DisabledCogCache:
         if not await self.cog_disabled_in_guild(cog_name, guild_id):
             return False
 
-        self._disable_map[cog_name][guild_id] = False
+        self._set_disabled(cog_name, guild_id, False)
         await self._config.custom("COG_DISABLE_SETTINGS", cog_name, guild_id).disabled.set(False)
         return True
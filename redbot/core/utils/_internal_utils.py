@@ -2,18 +2,23 @@ from __future__ import annotations
 
 import asyncio
 import collections.abc
+import hashlib
+import io
 import json
 import logging
 import os
 import re
 import shutil
 import tarfile
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import (
+    Any,
     AsyncIterator,
     Awaitable,
     Callable,
+    Dict,
     Iterator,
     List,
     Optional,
@@ -24,8 +29,6 @@ from typing import (
 
 import aiohttp
 import discord
-import pkg_resources
-from fuzzywuzzy import fuzz, process
 from redbot import VersionInfo
 
 from redbot.core import data_manager
@@ -138,6 +141,8 @@ async def fuzzy_command_search(
     else:
         choices = set(commands)
 
+    from fuzzywuzzy import fuzz, process
+
     # Do the scoring. `extracted` is a list of tuples in the form `(command, score)`
     extracted = process.extract(term, choices, limit=5, scorer=fuzz.QRatio)
     if not extracted:
@@ -195,14 +200,79 @@ async def format_fuzzy_results(
         return "Perhaps you wanted one of these? " + box("\n".join(lines), lang="vhdl")
 
 
-async def create_backup(dest: Path = Path.home()) -> Optional[Path]:
+BACKUP_MANIFEST_NAME = "backup_manifest.json"
+BACKUP_COMPRESSION_TYPES = ("gz", "bz2", "xz")
+
+
+def _hash_file(path: Path) -> str:
+    sha = hashlib.sha256()
+    with path.open("rb") as fs:
+        for chunk in iter(lambda: fs.read(1 << 16), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _write_backup_archive(
+    backup_fpath: Path,
+    compression: str,
+    data_path: Path,
+    to_archive: List[Path],
+    snapshot: Dict[Path, bytes],
+    manifest: Optional[Dict[str, Any]] = None,
+) -> None:
+    mtime = int(time.time())
+    with tarfile.open(str(backup_fpath), f"w:{compression}") as tar:
+        for f in to_archive:
+            arcname = str(f.relative_to(data_path))
+            contents = snapshot.get(f)
+            if contents is None:
+                tar.add(str(f), arcname=arcname, recursive=False)
+            else:
+                info = tarfile.TarInfo(arcname)
+                info.size = len(contents)
+                info.mtime = mtime
+                tar.addfile(info, io.BytesIO(contents))
+        if manifest is not None:
+            manifest_data = json.dumps(manifest, indent=4).encode("utf-8")
+            info = tarfile.TarInfo(BACKUP_MANIFEST_NAME)
+            info.size = len(manifest_data)
+            info.mtime = mtime
+            tar.addfile(info, io.BytesIO(manifest_data))
+
+
+async def create_backup(
+    dest: Path = Path.home(), *, incremental: bool = False, compression: str = "gz"
+) -> Optional[Path]:
+    """Create a backup of the current instance's data.
+
+    Parameters
+    ----------
+    dest : pathlib.Path
+        The folder in which to store the backup.
+    incremental : bool
+        If ``True``, only the files which changed since the last backup
+        made to ``dest`` will be archived. The manifest of the last backup
+        is kept in ``dest`` and is used to tell which files changed.
+        Backups which aren't incremental don't read or update it.
+    compression : str
+        The compression to use for the archive. One of ``gz``, ``bz2`` or ``xz``.
+
+    Returns
+    -------
+    Optional[pathlib.Path]
+        The path to the created backup, or ``None`` if there was no data to back up.
+    """
+    if compression not in BACKUP_COMPRESSION_TYPES:
+        raise ValueError(f"Unsupported compression type: {compression}")
     data_path = Path(data_manager.core_data_path().parent)
     if not data_path.exists():
         return None
 
     dest.mkdir(parents=True, exist_ok=True)
     timestr = datetime.utcnow().strftime("%Y-%m-%dT%H-%M-%S")
-    backup_fpath = dest / f"redv3_{data_manager.instance_name}_{timestr}.tar.gz"
+    suffix = "_incremental" if incremental else ""
+    backup_fpath = dest / f"redv3_{data_manager.instance_name}_{timestr}{suffix}.tar.{compression}"
+    manifest_fpath = dest / f"redv3_{data_manager.instance_name}_manifest.json"
 
     to_backup = []
     exclusions = [
@@ -216,6 +286,7 @@ async def create_backup(dest: Path = Path.home()) -> Optional[Path]:
 
     # Avoiding circular imports
     from ...cogs.downloader.repo_manager import RepoManager
+    from ..drivers.json import snapshot_json_data
 
     repo_mgr = RepoManager()
     await repo_mgr.initialize()
@@ -232,9 +303,78 @@ async def create_backup(dest: Path = Path.home()) -> Optional[Path]:
         if not any(ex in str(f) for ex in exclusions) and f.is_file():
             to_backup.append(f)
 
-    with tarfile.open(str(backup_fpath), "w:gz") as tar:
-        for f in to_backup:
-            tar.add(str(f), arcname=str(f.relative_to(data_path)), recursive=False)
+    # Data of the JSON drivers loaded in this process is taken from memory,
+    # so that the backup doesn't contain a half-applied set of changes.
+    snapshot = {
+        path: contents
+        for path, contents in (await snapshot_json_data()).items()
+        if path in to_backup
+    }
+
+    loop = asyncio.get_running_loop()
+    if not incremental:
+        # A full backup doesn't need to know which files changed
+        await loop.run_in_executor(
+            None, _write_backup_archive, backup_fpath, compression, data_path, to_backup, snapshot
+        )
+        return backup_fpath
+
+    try:
+        with manifest_fpath.open(encoding="utf-8") as fs:
+            previous_files: Dict[str, Dict[str, Any]] = json.load(fs)["files"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        previous_files = {}
+
+    files: Dict[str, Dict[str, Any]] = {}
+    to_hash = []
+    for f in to_backup:
+        relpath = f.relative_to(data_path).as_posix()
+        stat = f.stat()
+        entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": None}
+        if f in snapshot:
+            entry["size"] = len(snapshot[f])
+            entry["sha256"] = hashlib.sha256(snapshot[f]).hexdigest()
+        else:
+            previous = previous_files.get(relpath)
+            if (
+                previous is not None
+                and previous["size"] == entry["size"]
+                and previous["mtime_ns"] == entry["mtime_ns"]
+            ):
+                # Unchanged size and mtime, no need to read the file again.
+                entry["sha256"] = previous["sha256"]
+            else:
+                to_hash.append((f, entry))
+        files[relpath] = entry
+
+    hashes = await asyncio.gather(*(loop.run_in_executor(None, _hash_file, f) for f, _ in to_hash))
+    for (_, entry), sha in zip(to_hash, hashes):
+        entry["sha256"] = sha
+
+    to_archive = [
+        f
+        for f, (relpath, entry) in zip(to_backup, files.items())
+        if previous_files.get(relpath, {}).get("sha256") != entry["sha256"]
+    ]
+    manifest = {
+        "incremental": bool(previous_files),
+        "created_at": timestr,
+        "files": files,
+        "deleted": sorted(set(previous_files) - set(files)),
+    }
+
+    await loop.run_in_executor(
+        None,
+        _write_backup_archive,
+        backup_fpath,
+        compression,
+        data_path,
+        to_archive,
+        snapshot,
+        manifest,
+    )
+    with manifest_fpath.open("w", encoding="utf-8") as fs:
+        json.dump({"created_at": timestr, "files": files}, fs, indent=4)
     return backup_fpath
 
 
@@ -301,6 +441,8 @@ async def send_to_owners_with_prefix_replaced(bot: Red, content: str, **kwargs):
 
 
 def expected_version(current: str, expected: str) -> bool:
+    import pkg_resources
+
     # `pkg_resources` needs a regular requirement string, so "x" serves as requirement's name here
     return current in pkg_resources.Requirement.parse(f"x{expected}")
 
@@ -13,7 +13,11 @@ import appdirs
 import click
 
 from redbot.core.cli import confirm
-from redbot.core.utils._internal_utils import safe_delete, create_backup as red_create_backup
+from redbot.core.utils._internal_utils import (
+    BACKUP_COMPRESSION_TYPES,
+    safe_delete,
+    create_backup as red_create_backup,
+)
 from redbot.core import config, data_manager, drivers
 from redbot.core.drivers import BackendType, IdentifierData
 
@@ -222,13 +226,21 @@ async def do_migration(
     return new_storage_details
 
 
-async def create_backup(instance: str, destination_folder: Path = Path.home()) -> None:
+async def create_backup(
+    instance: str,
+    destination_folder: Path = Path.home(),
+    *,
+    incremental: bool = False,
+    compression: str = "gz",
+) -> None:
     data_manager.load_basic_configuration(instance)
     backend_type = get_current_backend(instance)
     if backend_type != BackendType.JSON:
         await do_migration(backend_type, BackendType.JSON)
     print("Backing up the instance's data...")
-    backup_fpath = await red_create_backup(destination_folder)
+    backup_fpath = await red_create_backup(
+        destination_folder, incremental=incremental, compression=compression
+    )
     if backup_fpath is not None:
         print(f"A backup of {instance} has been made. It is at {backup_fpath}")
     else:
@@ -422,9 +434,33 @@ def convert(instance, backend):
     ),
     default=Path.home(),
 )
-def backup(instance: str, destination_folder: Union[str, Path]) -> None:
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=False,
+    help=(
+        "Only archive the files which changed since the last backup"
+        " made to the destination folder."
+    ),
+)
+@click.option(
+    "--compression",
+    type=click.Choice(BACKUP_COMPRESSION_TYPES),
+    default="gz",
+    help="Compression to use for the backup archive.",
+)
+def backup(
+    instance: str, destination_folder: Union[str, Path], incremental: bool, compression: str
+) -> None:
     """Backup instance's data."""
-    asyncio.run(create_backup(instance, Path(destination_folder)))
+    asyncio.run(
+        create_backup(
+            instance,
+            Path(destination_folder),
+            incremental=incremental,
+            compression=compression,
+        )
+    )
 
 
 def run_cli():
@@ -1,5 +1,6 @@
 import asyncio
 import pathlib
+import sys
 from collections import namedtuple
 from typing import Any, NamedTuple
 from pathlib import Path
@@ -16,6 +17,7 @@ from redbot.cogs.downloader.errors import (
     ExistingGitRepo,
     GitException,
     UnknownRevision,
+    UpdateError,
 )
 
 
@@ -368,6 +370,50 @@ async def test_lib_install_requirements(monkeypatch, library_installable, repo,
     assert len(failed) == 0
 
 
+@pytest.mark.asyncio
+async def test_install_raw_requirements_batched(mocker, repo, tmp_path):
+    dist_info = tmp_path / "installed_dist-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: installed-dist\nVersion: 1.0\n"
+    )
+    m = _mock_run(mocker, repo, 0)
+
+    ret = await repo.install_raw_requirements(
+        ["installed-dist>=1.0", "other-dist", "installed-dist>=2.0"],
+        tmp_path,
+        cache_dir=tmp_path / "cache",
+    )
+
+    assert ret is True
+    m.assert_called_once_with(
+        ProcessFormatter().format(
+            repo.PIP_INSTALL_WITH_CACHE,
+            python=sys.executable,
+            cache_dir=tmp_path / "cache",
+            target_dir=tmp_path,
+            reqs=["other-dist", "installed-dist>=2.0"],
+        )
+    )
+
+    # satisfied requirements can still be upgraded
+    m.reset_mock()
+    ret = await repo.install_raw_requirements(
+        ["installed-dist>=1.0"], tmp_path, cache_dir=tmp_path / "cache", skip_satisfied=False
+    )
+
+    assert ret is True
+    m.assert_called_once_with(
+        ProcessFormatter().format(
+            repo.PIP_INSTALL_WITH_CACHE,
+            python=sys.executable,
+            cache_dir=tmp_path / "cache",
+            target_dir=tmp_path,
+            reqs=["installed-dist>=1.0"],
+        )
+    )
+
+
 @pytest.mark.asyncio
 async def test_remove_repo(monkeypatch, repo_manager):
     monkeypatch.setattr("redbot.cogs.downloader.repo_manager.Repo._run", fake_run_noprint)
@@ -393,6 +439,43 @@ async def test_existing_repo(mocker, repo_manager):
     repo_manager.does_repo_exist.assert_called_once_with("test")
 
 
+@pytest.mark.asyncio
+async def test_update_repos_concurrently(monkeypatch, repo_manager, tmp_path):
+    running = 0
+    max_running = 0
+
+    async def fake_update(self):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if self.name == "broken":
+            raise UpdateError("failed", "git pull")
+        if self.name == "changed":
+            return "a" * 40, "b" * 40
+        return "a" * 40, "a" * 40
+
+    monkeypatch.setattr("redbot.cogs.downloader.repo_manager.Repo.update", fake_update)
+    repos = [
+        Repo(name, "https://example.com", "master", "a" * 40, tmp_path / name)
+        for name in ("changed", "unchanged", "broken", "other")
+    ]
+    repo_manager._repos = {repo.name: repo for repo in repos}
+
+    progress = []
+
+    async def report(done, total):
+        progress.append((done, total))
+
+    updated, failed = await repo_manager.update_repos(progress=report)
+
+    assert max_running > 1
+    assert set(updated) == {repos[0]}
+    assert failed == ["broken"]
+    assert progress == [(done, 4) for done in range(1, 5)]
+
+
 def test_tree_url_parse(repo_manager):
     cases = [
         {
@@ -466,3 +466,42 @@ async def test_git_find_last_occurrence_non_existent(git_repo):
     )
     assert p.returncode == 0
     assert p.stdout.decode().strip() == ""
+
+
+@pytest.mark.asyncio
+async def test_git_ls_tree(git_repo):
+    # mycog exists at tag "lightweight"
+    p = await git_repo._run(
+        ProcessFormatter().format(
+            git_repo.GIT_LS_TREE,
+            path=git_repo.folder_path,
+            rev="lightweight",
+            paths=("mycog/__init__.py", "mycog/info.json"),
+        )
+    )
+    assert p.returncode == 0
+    assert p.stdout.decode().endswith("\tmycog/__init__.py\x00")
+
+
+@pytest.mark.asyncio
+async def test_get_modules_at_rev_without_checkout(git_repo):
+    module_path = git_repo.folder_path / "othercog"
+    module_path.mkdir()
+    (module_path / "__init__.py").touch()
+    (module_path / "info.json").write_text('{"short": "Other cog."}')
+    git_dirparams = ("git", "-C", str(git_repo.folder_path))
+    sp.run((*git_dirparams, "add", "othercog"), check=True)
+    sp.run(
+        (*git_dirparams, "commit", "-m", "add othercog", "--no-gpg-sign", "--no-verify"),
+        check=True,
+    )
+    head = await git_repo.current_commit()
+
+    modules = await git_repo._get_modules_at_rev("HEAD")
+    assert [(m.name, m.commit, m.short) for m in modules] == [("othercog", head, "Other cog.")]
+
+    modules = await git_repo._get_modules_at_rev("lightweight")
+    assert [m.name for m in modules] == ["mycog"]
+    # working tree is left untouched
+    assert await git_repo.current_commit() == head
+    assert not (git_repo.folder_path / "mycog").exists()
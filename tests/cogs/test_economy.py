@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from redbot.pytest.economy import *
 
@@ -81,3 +83,107 @@ async def test_nonint_transaction_amount(bank, member_factory):
         await bank.withdraw_credits(mbr1, 1.0)
     with pytest.raises(TypeError):
         await bank.transfer_credits(mbr1, mbr2, 1.0)
+
+
+@pytest.mark.asyncio
+async def test_bank_leaderboard(bank, member_factory, empty_guild):
+    MockMember = type(member_factory.get())
+    mbrs = [MockMember(user_id, empty_guild, "Testing_Name") for user_id in (1, 2, 3)]
+    for mbr, balance in zip(mbrs, (300, 100, 200)):
+        await bank.set_balance(mbr, balance)
+
+    leaderboard = await bank.get_leaderboard(guild=empty_guild)
+    assert [user_id for user_id, __ in leaderboard] == [1, 3, 2]
+    assert await bank.get_leaderboard_position(mbrs[1]) == 3
+
+    await bank.set_balance(mbrs[1], 400)
+    leaderboard = await bank.get_leaderboard(positions=2, guild=empty_guild)
+    assert [(user_id, acc["balance"]) for user_id, acc in leaderboard] == [(2, 400), (1, 300)]
+    assert await bank.get_leaderboard_position(mbrs[1]) == 1
+
+    await bank.wipe_bank(empty_guild)
+    assert await bank.get_leaderboard(guild=empty_guild) == []
+    assert await bank.get_leaderboard_position(mbrs[1]) is None
+
+
+@pytest.mark.asyncio
+async def test_bank_transaction(bank, member_factory):
+    from redbot.core.errors import BalanceTooHigh
+
+    mbr1 = member_factory.get()
+    mbr2 = member_factory.get()
+    await bank.set_balance(mbr1, 100)
+    await bank.set_balance(mbr2, 100)
+
+    async with bank.transaction() as txn:
+        await txn.withdraw_credits(mbr1, 30)
+        await txn.deposit_credits(mbr2, 30)
+        assert await txn.get_balance(mbr1) == 70
+        # nothing is written until the transaction is committed
+        assert await bank.get_balance(mbr1) == 100
+    assert await bank.get_balance(mbr1) == 70
+    assert await bank.get_balance(mbr2) == 130
+
+    await bank.set_max_balance(150, mbr2.guild)
+    with pytest.raises(BalanceTooHigh):
+        async with bank.transaction() as txn:
+            await txn.transfer_credits(mbr1, mbr2, 50)
+    assert await bank.get_balance(mbr1) == 70
+    assert await bank.get_balance(mbr2) == 130
+
+
+@pytest.mark.asyncio
+async def test_bank_transaction_keeps_concurrent_changes(bank, member_factory):
+    mbr1 = member_factory.get()
+    mbr2 = member_factory.get()
+    await bank.set_balance(mbr1, 100)
+    await bank.set_balance(mbr2, 100)
+
+    async with bank.transaction() as txn:
+        await txn.withdraw_credits(mbr1, 30)
+        await txn.deposit_credits(mbr2, 30)
+        # changes made outside of the transaction after its accounts were read
+        await bank.deposit_credits(mbr1, 50)
+        await bank.withdraw_credits(mbr2, 20)
+    assert await bank.get_balance(mbr1) == 120
+    assert await bank.get_balance(mbr2) == 110
+
+    with pytest.raises(ValueError):
+        async with bank.transaction() as txn:
+            await txn.withdraw_credits(mbr1, 100)
+            await bank.withdraw_credits(mbr1, 50)
+    assert await bank.get_balance(mbr1) == 70
+
+
+@pytest.mark.asyncio
+async def test_bank_leaderboard_built_during_set_balance(
+    bank, member_factory, empty_guild, monkeypatch
+):
+    MockMember = type(member_factory.get())
+    mbr1, mbr2 = [MockMember(user_id, empty_guild, "Testing_Name") for user_id in (1, 2)]
+    await bank.set_balance(mbr1, 100)
+    await bank.set_balance(mbr2, 300)
+    bank._leaderboard_indexes.clear()
+
+    driver = bank._config.driver
+    original_set = driver.set
+    writing = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_set(*args, **kwargs):
+        writing.set()
+        await release.wait()
+        return await original_set(*args, **kwargs)
+
+    monkeypatch.setattr(driver, "set", slow_set)
+    task = asyncio.ensure_future(bank.set_balance(mbr1, 500))
+    await writing.wait()
+    monkeypatch.setattr(driver, "set", original_set)
+    # the leaderboard is built from the balance from before the write
+    leaderboard = await bank.get_leaderboard(guild=empty_guild)
+    assert [user_id for user_id, __ in leaderboard] == [2, 1]
+    release.set()
+    await task
+
+    leaderboard = await bank.get_leaderboard(guild=empty_guild)
+    assert [user_id for user_id, __ in leaderboard] == [1, 2]
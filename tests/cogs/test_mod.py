@@ -37,3 +37,45 @@ async def test_modlog_case_create(mod, ctx, member_factory):
 async def test_modlog_set_modlog_channel(mod, ctx):
     await mod.set_modlog_channel(ctx.guild, ctx.channel)
     assert await mod.get_modlog_channel(ctx.guild) == ctx.channel.id
+
+
+@pytest.mark.asyncio
+async def test_modlog_case_numbers_for_member(mod, ctx, member_factory):
+    from datetime import datetime, timezone
+
+    await test_modlog_register_casetype(mod)
+
+    first, second = member_factory.get(), member_factory.get()
+    guild = ctx.guild
+    created_at = datetime.now(timezone.utc)
+    for usr in (first, second, first):
+        await mod.create_case(ctx.bot, guild, created_at, "ban", usr, ctx.author)
+
+    assert await mod.get_case_numbers_for_member(guild, first.id) == [1, 3]
+    assert await mod.get_case_numbers_for_member(guild, second.id) == [2]
+
+    await mod.reset_cases(guild)
+    assert await mod.get_case_numbers_for_member(guild, first.id) == []
+
+
+@pytest.mark.asyncio
+async def test_modlog_case_summaries(mod, ctx, member_factory):
+    from datetime import datetime, timezone
+
+    await test_modlog_register_casetype(mod)
+
+    first, second = member_factory.get(), member_factory.get()
+    guild = ctx.guild
+    created_at = datetime.now(timezone.utc)
+    for usr in (first, second, first):
+        await mod.create_case(ctx.bot, guild, created_at, "ban", usr, ctx.author)
+
+    summaries = await mod.get_case_summaries(guild)
+    assert [s.case_number for s in summaries] == [1, 2, 3]
+    assert [s.user_id for s in summaries] == [first.id, second.id, first.id]
+
+    summaries = await mod.get_case_summaries(guild, member_id=second.id)
+    assert len(summaries) == 1
+    assert summaries[0].case_number == 2
+    assert summaries[0].moderator_id == ctx.author.id
+    assert summaries[0].created_at == int(created_at.timestamp())
@@ -0,0 +1,231 @@
+import collections
+import contextlib
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from redbot.cogs.streams import scheduler, streamtypes
+from redbot.cogs.streams.errors import OfflineStream, RateLimited
+from redbot.cogs.streams.scheduler import StreamScheduler, TokenBucket
+from redbot.cogs.streams.streamtypes import PicartoStream, Stream, TwitchStream
+from redbot.cogs.streams.streams import Streams
+
+
+class FakeResponse:
+    def __init__(self, data, status=200):
+        self.status = status
+        self.headers = {}
+        self._data = data
+
+    async def text(self, encoding=None):
+        return json.dumps(self._data)
+
+    async def json(self, encoding=None):
+        return self._data
+
+
+class FakeSession:
+    def __init__(self, handler):
+        self.closed = False
+        self.requests = []
+        self._handler = handler
+
+    @contextlib.asynccontextmanager
+    async def get(self, url, **kwargs):
+        self.requests.append((url, kwargs))
+        yield self._handler(url, kwargs.get("params"))
+
+
+@pytest.mark.asyncio
+async def test_stream_uses_given_session():
+    session = FakeSession(lambda url, params: FakeResponse({"online": False}))
+    stream = PicartoStream(name="test", session=session)
+    with pytest.raises(OfflineStream):
+        await stream.is_online()
+    assert session.requests == [("https://api.picarto.tv/v1/channel/name/test", {})]
+
+
+def test_stream_session_not_exported():
+    stream = PicartoStream(name="test", channels=[1], session=FakeSession(None))
+    assert stream.export() == {
+        "name": "test",
+        "channels": [1],
+        "type": "PicartoStream",
+        "messages": [],
+    }
+
+
+@pytest.mark.asyncio
+async def test_twitch_streams_checked_in_batches():
+    def handler(url, params):
+        ids = [value for key, value in params if key in ("id", "user_id")]
+        if url == streamtypes.TWITCH_STREAMS_ENDPOINT:
+            # every third stream is live
+            data = [
+                {
+                    "user_id": user_id,
+                    "user_name": f"User{user_id}",
+                    "game_id": "1",
+                    "type": "live",
+                    "title": "Title",
+                    "thumbnail_url": "",
+                }
+                for user_id in ids
+                if int(user_id) % 3 == 0
+            ]
+            return FakeResponse({"data": data})
+        elif url == streamtypes.TWITCH_ID_ENDPOINT:
+            data = [
+                {
+                    "id": user_id,
+                    "login": f"user{user_id}",
+                    "profile_image_url": None,
+                    "view_count": 1,
+                }
+                for user_id in ids
+            ]
+            return FakeResponse({"data": data})
+        elif url == streamtypes.TWITCH_GAMES_ENDPOINT:
+            return FakeResponse({"data": [{"id": "1", "name": "Game"}]})
+        elif url == streamtypes.TWITCH_FOLLOWS_ENDPOINT:
+            return FakeResponse({"total": 5})
+        raise AssertionError(url)
+
+    session = FakeSession(handler)
+    streams = [TwitchStream(name=f"user{i}", id=str(i)) for i in range(250)]
+    # this one was already announced
+    streams[6]._messages_cache.append(object())
+    online = await TwitchStream.get_online_streams(streams, client_id="id", session=session)
+
+    assert set(online) == {s for s in streams if int(s.id) % 3 == 0}
+    embed, is_rerun = online[streams[3]]
+    assert embed.footer.text.endswith("Game")
+    assert streams[3].name == "User3"
+    assert online[streams[6]] == (None, False)
+    requests_per_url = collections.Counter(url for url, __ in session.requests)
+    assert requests_per_url[streamtypes.TWITCH_STREAMS_ENDPOINT] == 3
+    assert requests_per_url[streamtypes.TWITCH_ID_ENDPOINT] == 1
+    assert requests_per_url[streamtypes.TWITCH_GAMES_ENDPOINT] == 1
+    # follower counts are only fetched for streams which weren't announced yet
+    assert requests_per_url[streamtypes.TWITCH_FOLLOWS_ENDPOINT] == len(online) - 1
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=0, capacity=2)
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+    bucket = TokenBucket(rate=1000, capacity=2)
+    bucket.pause(60)
+    assert not bucket.try_acquire()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_checks_due_streams(monkeypatch):
+    monkeypatch.setattr(scheduler, "MAX_TICK", 0)
+
+    class FakeStream(Stream):
+        async def is_online(self):
+            if self.name == "limited":
+                raise RateLimited(30)
+            if self.name == "offline":
+                raise OfflineStream()
+            return "embed"
+
+    batches = []
+
+    async def batch_check(streams):
+        batches.append(streams)
+        return {s: None for s in streams}
+
+    streams = [FakeStream(name=name) for name in ("online", "offline", "limited")]
+    twitch_streams = [TwitchStream(name=str(i), id=str(i)) for i in range(3)]
+    sched = StreamScheduler({"TwitchStream": batch_check})
+
+    statuses = await sched.run(streams + twitch_streams, 300)
+    assert statuses == {
+        streams[0]: ("embed", False),
+        streams[1]: None,
+        **{s: None for s in twitch_streams},
+    }
+    assert batches == [twitch_streams]
+    assert sched.stats["FakeStream"].rate_limited == 1
+    assert sched.stats["FakeStream"].checked == 2
+
+    # nothing is due until the refresh timer passes and the service backs off
+    assert await sched.run(streams + twitch_streams, 300) == {}
+    assert sched.stats["FakeStream"].backlog == 1
+
+    # streams of a batched service share a deadline, so they're all checked together
+    twitch_streams.append(TwitchStream(name="3", id="3"))
+    sched._deadlines["TwitchStream"] = 0
+    statuses = await sched.run(twitch_streams, 300)
+    assert statuses == {s: None for s in twitch_streams}
+    assert batches[1] == twitch_streams
+
+
+def test_stream_dirty_tracking():
+    stream = TwitchStream(name="test", id="1")
+    assert stream.dirty
+    stream.mark_clean()
+
+    stream.name = "test"
+    assert not stream.dirty
+    stream._messages_cache = []
+    assert not stream.dirty
+
+    stream.name = "Test"
+    assert stream.dirty
+
+
+@pytest.mark.asyncio
+async def test_save_dirty_streams():
+    saves = []
+
+    class FakeCog:
+        streams = [PicartoStream(name="a"), PicartoStream(name="b")]
+
+        async def save_streams(self):
+            saves.append([s.export() for s in self.streams])
+            for stream in self.streams:
+                stream.mark_clean()
+
+    cog = FakeCog()
+    await Streams.save_dirty_streams(cog)
+    await Streams.save_dirty_streams(cog)
+    assert len(saves) == 1
+
+    cog.streams[0].channels.append(1)
+    cog.streams[0].mark_dirty()
+    cog.streams[1].name = "c"
+    await Streams.save_dirty_streams(cog)
+    assert len(saves) == 2
+
+
+@pytest.mark.asyncio
+async def test_save_streams_keeps_concurrent_changes():
+    class FakeValue:
+        def __init__(self, fail=False):
+            self.fail = fail
+
+        async def set(self, value):
+            # a change made while the streams are being saved
+            cog.streams[0].name = "changed"
+            if self.fail:
+                raise OSError()
+
+    class FakeCog:
+        streams = [PicartoStream(name="a"), PicartoStream(name="b")]
+        config = SimpleNamespace(streams=FakeValue())
+
+    cog = FakeCog()
+    await Streams.save_streams(cog)
+    assert cog.streams[0].dirty
+    assert not cog.streams[1].dirty
+
+    cog.config.streams.fail = True
+    with pytest.raises(OSError):
+        await Streams.save_streams(cog)
+    assert cog.streams[1].dirty
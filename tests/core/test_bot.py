@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+
+from redbot.core import bot as bot_module
+
+
+@pytest.mark.asyncio
+async def test_discord_deletion_requests_batched(red, monkeypatch):
+    monkeypatch.setattr(bot_module, "DELETION_BATCH_WINDOW", 0)
+    red._red_ready.set()
+
+    batches = []
+
+    async def handle_bulk(*, requester, user_ids):
+        batches.append((requester, user_ids))
+        return bot_module.DataDeletionResults([], [], [])
+
+    monkeypatch.setattr(red, "_handle_bulk_data_deletion_request", handle_bulk)
+
+    results = await asyncio.gather(
+        *(
+            red.handle_data_deletion_request(requester="discord_deleted_user", user_id=user_id)
+            for user_id in (1, 2, 3, 2)
+        )
+    )
+    assert batches == [("discord_deleted_user", {1, 2, 3})]
+    assert all(r is results[0] for r in results)
+
+    # other requests aren't queued
+    await red.handle_data_deletion_request(requester="owner", user_id=4)
+    assert batches[1] == ("owner", {4})
+    assert red._discord_deletion_task is None
+
+
+@pytest.mark.asyncio
+async def test_load_packages_at_startup(red, monkeypatch):
+    from types import ModuleType
+
+    from redbot.core import commands
+
+    events = []
+    unloaded = []
+    # package name -> (cog name, setup delay)
+    cogs = {
+        "permissions": ("Permissions", 0),
+        "alias": ("Shared", 3),
+        "filter": ("Shared", 0),
+        "needsdep": ("NeedsDep", 0),
+        "dep": ("Dep", 1),
+    }
+
+    async def find_cogs(names):
+        return {name: (None if name == "missing" else name) for name in names}
+
+    def get_required_packages(spec):
+        return ["dep"] if spec == "needsdep" else []
+
+    def import_extension(spec):
+        lib = ModuleType(f"test_startup_{spec}")
+
+        async def setup(bot):
+            events.append(("start", spec))
+            if spec == "broken":
+                raise RuntimeError("missing API key")
+            if spec == "needsdep":
+                # the cogs of required packages are already loaded
+                assert bot.get_cog("Dep") is not None
+            cog_name, delay = cogs[spec]
+            for __ in range(delay + 1):
+                await asyncio.sleep(0)
+            events.append(("end", spec))
+            cog_cls = type(
+                cog_name,
+                (commands.Cog,),
+                {"__module__": lib.__name__, "cog_unload": lambda self: unloaded.append(spec)},
+            )
+            bot.add_cog(cog_cls())
+
+        lib.setup = setup
+        return lib
+
+    removed = []
+
+    async def remove_loaded_package(name):
+        removed.append(name)
+
+    monkeypatch.setattr(red._cog_mgr, "find_cogs", find_cogs)
+    monkeypatch.setattr(red, "_get_required_packages", get_required_packages)
+    monkeypatch.setattr(red, "_import_extension", import_extension)
+    monkeypatch.setattr(red, "remove_loaded_package", remove_loaded_package)
+
+    loaded = await red._load_packages_at_startup(
+        ["alias", "missing", "broken", "permissions", "filter", "needsdep", "dep", "alias"]
+    )
+
+    # permissions is done loading before anything else starts
+    assert events[:2] == [("start", "permissions"), ("end", "permissions")]
+    # the other packages are set up concurrently, each of them once
+    assert [e[0] for e in events[2:6]] == ["start"] * 4
+    assert sorted(name for kind, name in events if kind == "start") == sorted(
+        ["permissions", "alias", "broken", "filter", "dep", "needsdep"]
+    )
+    # the dependency was loaded before the package requiring it was set up
+    assert events.index(("end", "dep")) < events.index(("start", "needsdep"))
+    # the name conflict is resolved in the given order, regardless of which setup ended first
+    assert events.index(("end", "filter")) < events.index(("end", "alias"))
+    assert red.get_cog("Shared").__module__ == "test_startup_alias"
+    assert loaded == ["permissions", "alias", "needsdep", "dep"]
+    assert set(red.extensions) >= set(loaded)
+    assert sorted(removed) == ["broken", "filter", "missing"]
+    # packages which loaded fine were never unloaded
+    assert unloaded == []
+
+
+@pytest.mark.asyncio
+async def test_message_context_prefix(red, monkeypatch):
+    from types import SimpleNamespace
+
+    calls = []
+
+    async def get_context(message):
+        calls.append(message)
+        return SimpleNamespace(prefix="!")
+
+    monkeypatch.setattr(red, "get_context", get_context)
+    message = SimpleNamespace(content="!ping")
+
+    message_context = red.get_message_context(message)
+    assert message_context.prefix is None
+    # not known yet, e.g. because the context was evicted before the listener ran
+    assert await message_context.get_prefix() == "!"
+    assert await message_context.get_prefix() == "!"
+    assert calls == [message]
+
+    other = SimpleNamespace(content="ping")
+    red.get_message_context(other).prefix = None
+    assert await red.get_message_context(other).get_prefix() is None
+    assert calls == [message]
@@ -49,3 +49,35 @@ async def test_remove_path(cog_mgr, tmpdir):
     await cog_mgr.add_path(path)
     await cog_mgr.remove_path(path)
     assert path not in await cog_mgr.paths()
+
+
+@pytest.mark.asyncio
+async def test_find_cog_index(cog_mgr, tmp_path):
+    await cog_mgr.add_path(tmp_path)
+    assert await cog_mgr.find_cog("indexedcog") is None
+
+    # adding a package changes the path's mtime, which refreshes its index
+    (tmp_path / "indexedcog").mkdir()
+    (tmp_path / "indexedcog" / "__init__.py").touch()
+    spec = await cog_mgr.find_cog("indexedcog")
+    assert spec is not None
+    assert spec.name == "indexedcog"
+    assert "indexedcog" in await cog_mgr.available_modules()
+
+    await cog_mgr.remove_path(tmp_path)
+    assert await cog_mgr.find_cog("indexedcog") is None
+
+
+@pytest.mark.asyncio
+async def test_find_cog_rescans_index(cog_mgr, tmp_path):
+    await cog_mgr.add_path(tmp_path)
+    (tmp_path / "latecog").mkdir()
+    assert await cog_mgr.find_cog("latecog") is None
+
+    # adding __init__.py to an existing directory doesn't change the path's mtime
+    mtime = tmp_path.stat().st_mtime_ns
+    (tmp_path / "latecog" / "__init__.py").touch()
+    assert tmp_path.stat().st_mtime_ns == mtime
+    spec = await cog_mgr.find_cog("latecog")
+    assert spec is not None
+    assert spec.name == "latecog"
@@ -49,3 +49,99 @@ def test_dpy_commands_reexports():
     missing_attrs = dpy_attrs - set(commands.__dict__.keys())
 
     assert not missing_attrs
+
+
+def test_requires_rule_from_ctx(coroutine):
+    from collections import namedtuple
+    from types import SimpleNamespace
+
+    from redbot.core.commands.requires import PermState
+
+    Role = namedtuple("Role", "position id")
+    roles = {11: Role(1, 11), 12: Role(5, 12), 13: Role(3, 13)}
+    guild = SimpleNamespace(id=1, get_role=roles.get)
+    author = SimpleNamespace(id=2, voice=None, _roles=[11, 12, 13])
+    channel = SimpleNamespace(id=3, category_id=4)
+    ctx = SimpleNamespace(author=author, guild=guild, channel=channel)
+
+    requires = commands.command(name="cmd")(coroutine).requires
+    assert requires._get_rule_from_ctx(ctx) is PermState.NORMAL
+
+    # the highest role with a rule wins
+    requires.set_rule(11, PermState.ACTIVE_ALLOW, guild_id=1)
+    requires.set_rule(13, PermState.ACTIVE_DENY, guild_id=1)
+    assert requires._get_rule_from_ctx(ctx) is PermState.ACTIVE_DENY
+
+    # channel rules take precedence over role rules
+    requires.set_rule(4, PermState.ACTIVE_ALLOW, guild_id=1)
+    assert requires._get_rule_from_ctx(ctx) is PermState.ACTIVE_ALLOW
+
+    # and global rules take precedence over guild rules
+    requires.set_rule(1, PermState.ACTIVE_DENY, guild_id=0)
+    assert requires._get_rule_from_ctx(ctx) is PermState.ACTIVE_DENY
+
+    requires.clear_all_rules(0)
+    requires.clear_all_rules(1)
+    assert requires._get_rule_from_ctx(ctx) is PermState.NORMAL
+
+
+@pytest.mark.asyncio
+async def test_requires_shared_check_cache():
+    from types import SimpleNamespace
+
+    from redbot.core.commands.requires import _SharedCheckCache, _shared_check_cache
+
+    calls = []
+
+    async def is_owner(user):
+        calls.append(user)
+        return False
+
+    ctx = SimpleNamespace(author=object(), bot=SimpleNamespace(is_owner=is_owner))
+
+    # without a cache, every check is evaluated again
+    assert await _SharedCheckCache.is_owner(ctx) is False
+    assert await _SharedCheckCache.is_owner(ctx) is False
+    assert len(calls) == 2
+
+    with _shared_check_cache(ctx):
+        with _shared_check_cache(ctx):
+            assert await _SharedCheckCache.is_owner(ctx) is False
+        assert await _SharedCheckCache.is_owner(ctx) is False
+    assert len(calls) == 3
+    assert ctx._shared_check_cache is None
+
+
+def test_help_page_cache():
+    from redbot.core.commands.help import _HelpPageCache
+
+    cache = _HelpPageCache(maxsize=2)
+    cache.put("a", (False, ["a"]))
+    cache.put("b", (False, ["b"]))
+    assert cache.get("a") == (False, ["a"])
+    # "b" is now the least recently used entry
+    cache.put("c", (True, ["c"]))
+    assert cache.get("b") is None
+    assert cache.get("a") == (False, ["a"])
+    assert cache.get("c") == (True, ["c"])
+
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_help_page_cache_key_uses_context_formatted_help():
+    from types import SimpleNamespace
+
+    from redbot.core.commands.help import RedHelpFormatter
+
+    class DynamicHelpCommand:
+        def format_shortdoc_for_context(self, ctx):
+            return f"Help for {ctx.author}"
+
+    coms = {"dynamic": DynamicHelpCommand()}
+    assert RedHelpFormatter._get_shortdocs(SimpleNamespace(author="a"), coms) == (
+        ("dynamic", "Help for a"),
+    )
+    assert RedHelpFormatter._get_shortdocs(
+        SimpleNamespace(author="a"), coms
+    ) != RedHelpFormatter._get_shortdocs(SimpleNamespace(author="b"), coms)
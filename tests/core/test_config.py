@@ -660,3 +660,38 @@ async def test_config_custom_partial_pkeys_set(config, pkeys, raw_args, result):
     group = config.custom("TEST", *pkeys)
     await group.set_raw(*raw_args, value=result)
     assert await group.get_raw(*raw_args) == result
+
+
+@pytest.mark.asyncio
+async def test_config_guilds_with_member_data(config):
+    config.register_member(foo=False)
+    await config.member_from_ids(1, 10).foo.set(True)
+    await config.member_from_ids(2, 10).foo.set(True)
+    await config.member_from_ids(2, 11).foo.set(True)
+
+    assert await config.guilds_with_member_data({10, 11, 12}) == {10: {1, 2}, 11: {2}}
+
+    # the index is kept up to date after being built
+    await config.member_from_ids(3, 12).set_raw("foo", value=True)
+    await config.member_from_ids(3, 10).set({"foo": True})
+    assert await config.guilds_with_member_data({10, 12}) == {10: {1, 2, 3}, 12: {3}}
+
+
+@pytest.mark.asyncio
+async def test_set_many_is_all_or_nothing(config):
+    from redbot.core.errors import CannotSetSubfield
+
+    await config.set_raw("foo", value=1)
+    base = config._get_base_group(config.GLOBAL).identifier_data
+    items = [
+        (base.get_child("foo"), 2),
+        (base.get_child("new", "nested"), 3),
+        # foo is an int, so this can't be set
+        (base.get_child("foo", "bar"), 4),
+    ]
+    with pytest.raises(CannotSetSubfield):
+        await config.driver.set_many(items)
+
+    assert await config.get_raw("foo") == 1
+    with pytest.raises(KeyError):
+        await config.get_raw("new")
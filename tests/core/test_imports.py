@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+# These are slow to import and only needed by a few commands,
+# so they shouldn't be imported when the bot is started.
+LAZILY_IMPORTED_MODULES = ("fuzzywuzzy", "markdown", "pkg_resources", "yaml")
+
+CODE = """
+import sys
+from redbot.core import data_manager
+# Audio needs its data path at import time
+data_manager.basic_config = dict(data_manager.basic_config_default, DATA_PATH=sys.argv[1])
+import redbot.__main__
+import redbot.cogs.audio
+import redbot.cogs.customcom
+import redbot.cogs.downloader
+import redbot.cogs.permissions
+import redbot.cogs.trivia
+import redbot.core.core_commands
+import redbot.core.events
+print("\\n".join(sys.modules))
+"""
+
+
+def test_heavy_modules_not_imported_at_startup(tmp_path):
+    proc = subprocess.run(
+        [sys.executable, "-c", CODE, str(tmp_path)], stdout=subprocess.PIPE, check=True, text=True
+    )
+    imported = set(proc.stdout.splitlines())
+    assert imported.isdisjoint(LAZILY_IMPORTED_MODULES)
@@ -0,0 +1,68 @@
+import pytest
+
+from redbot.core.settings_caches import AutoImmuneManager, DisabledCogCache
+
+
+@pytest.fixture()
+def disabled_cog_cache(config):
+    config.init_custom("COG_DISABLE_SETTINGS", 2)
+    config.register_custom("COG_DISABLE_SETTINGS", disabled=None)
+    return DisabledCogCache(config)
+
+
+@pytest.mark.asyncio
+async def test_disabled_cog_cache(config, disabled_cog_cache):
+    await config.custom("COG_DISABLE_SETTINGS", "Mod", 1).disabled.set(True)
+    await config.custom("COG_DISABLE_SETTINGS", "Filter", 0).disabled.set(True)
+    await config.custom("COG_DISABLE_SETTINGS", "Filter", 2).disabled.set(False)
+    await disabled_cog_cache.initialize()
+
+    assert disabled_cog_cache.cog_disabled_in_guild_nowait("Mod", 1) is True
+    assert disabled_cog_cache.cog_disabled_in_guild_nowait("Mod", 2) is False
+    # Filter is disabled by default, but enabled in guild 2
+    assert disabled_cog_cache.cog_disabled_in_guild_nowait("Filter", 1) is True
+    assert disabled_cog_cache.cog_disabled_in_guild_nowait("Filter", 2) is False
+    assert disabled_cog_cache.cog_disabled_in_guild_nowait("Alias", 1) is False
+
+    assert await disabled_cog_cache.enable_cog_in_guild("Mod", 1) is True
+    assert await disabled_cog_cache.cog_disabled_in_guild("Mod", 1) is False
+    assert await disabled_cog_cache.disable_cog_in_guild("Alias", 3) is True
+    assert await disabled_cog_cache.disable_cog_in_guild("Alias", 3) is False
+    assert disabled_cog_cache.cog_disabled_in_guild_nowait("Alias", 3) is True
+
+    await disabled_cog_cache.default_enable("Filter")
+    assert disabled_cog_cache.cog_disabled_in_guild_nowait("Filter", 1) is False
+    await disabled_cog_cache.default_disable("Mod")
+    # guild 1 explicitly enabled Mod above
+    assert disabled_cog_cache.cog_disabled_in_guild_nowait("Mod", 1) is False
+    assert disabled_cog_cache.cog_disabled_in_guild_nowait("Mod", 4) is True
+
+    # the settings were saved
+    reloaded = DisabledCogCache(config)
+    for cog_name in ("Mod", "Filter", "Alias"):
+        for guild_id in range(5):
+            assert await reloaded.cog_disabled_in_guild(
+                cog_name, guild_id
+            ) is disabled_cog_cache.cog_disabled_in_guild_nowait(cog_name, guild_id)
+
+
+@pytest.mark.asyncio
+async def test_autoimmune_cache(config, empty_guild):
+    config.register_guild(autoimmune_ids=[])
+    await config.guild(empty_guild).autoimmune_ids.set([1])
+    manager = AutoImmuneManager(config)
+
+    assert await manager.get_immune_ids(empty_guild) == {1}
+    # later reads are served from the cache
+    await config.guild(empty_guild).autoimmune_ids.set([1, 2])
+    assert await manager.get_immune_ids(empty_guild) == {1}
+
+    # changes made through the manager update the cache
+    assert await manager.add_immune_id(empty_guild, 3) is True
+    assert await manager.add_immune_id(empty_guild, 3) is False
+    assert await manager.get_immune_ids(empty_guild) == {1, 2, 3}
+    assert await manager.remove_immune_id(empty_guild, 1) is True
+    assert await manager.get_immune_ids(empty_guild) == {2, 3}
+    await manager.discord_deleted_users({2})
+    assert await manager.get_immune_ids(empty_guild) == {3}
+    assert await config.guild(empty_guild).autoimmune_ids() == [3]
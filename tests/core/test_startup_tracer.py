@@ -0,0 +1,46 @@
+import sys
+
+from redbot.core._startup_tracer import StartupTracer
+
+
+def test_startup_tracer_disabled():
+    tracer = StartupTracer()
+    with tracer.phase("phase"):
+        pass
+    with tracer.cog_setup("cog"):
+        pass
+    assert tracer.phases == []
+    assert tracer.cogs == []
+
+
+def test_startup_tracer(tmp_path, monkeypatch):
+    tracer = StartupTracer()
+    tracer.enable(import_times=True)
+    try:
+        with tracer.phase("phase"):
+            with tracer.cog_setup("cog"):
+                monkeypatch.syspath_prepend(str(tmp_path))
+                (tmp_path / "traced_module.py").write_text("import traced_child\n")
+                (tmp_path / "traced_child.py").write_text("x = 1\n")
+                import traced_module  # noqa: F401
+
+                # the module's loader is left in place for pkg_resources
+                import pkg_resources
+
+                assert pkg_resources.resource_exists("traced_module", "traced_child.py")
+        tracer.begin("unfinished phase")
+    finally:
+        tracer.finish()
+        sys.modules.pop("traced_module", None)
+        sys.modules.pop("traced_child", None)
+
+    report = tracer.to_dict()
+    assert [p["name"] for p in report["phases"]] == ["phase"]
+    assert [c["name"] for c in report["cogs"]] == ["cog"]
+    modules = report["imports"]["modules"]
+    assert modules["traced_module"]["cumulative"] >= modules["traced_child"]["cumulative"]
+    assert "traced_module" in report["imports"]["packages"]
+    assert tracer._import_timer not in sys.meta_path
+
+    tracer.dump(tmp_path / "trace.json")
+    assert (tmp_path / "trace.json").exists()
@@ -196,3 +196,36 @@ async def test_bounded_gather_iter_cancel():
 def test_normalize_smartquotes():
     assert common_filters.normalize_smartquotes("Should\u2018 normalize") == "Should' normalize"
     assert common_filters.normalize_smartquotes("Same String") == "Same String"
+
+
+@pytest.mark.asyncio
+async def test_create_backup_incremental(tmp_path):
+    import tarfile
+    from redbot.core import data_manager
+    from redbot.core.utils._internal_utils import create_backup
+
+    data_path = data_manager.core_data_path().parent
+    data_path.mkdir(parents=True, exist_ok=True)
+    (data_path / "unchanged.txt").write_text("same")
+    (data_path / "changed.txt").write_text("before")
+    dest = tmp_path / "backups"
+
+    full = await create_backup(dest, incremental=True)
+    with tarfile.open(str(full)) as tar:
+        assert {"unchanged.txt", "changed.txt"} <= set(tar.getnames())
+
+    (data_path / "changed.txt").write_text("after, and longer")
+    (data_path / "added.txt").write_text("new")
+    incremental = await create_backup(dest, incremental=True, compression="xz")
+    with tarfile.open(str(incremental)) as tar:
+        names = set(tar.getnames())
+    assert "changed.txt" in names
+    assert "added.txt" in names
+    assert "unchanged.txt" not in names
+
+    # full backups archive everything, without a manifest
+    full = await create_backup(dest)
+    with tarfile.open(str(full)) as tar:
+        names = set(tar.getnames())
+    assert {"unchanged.txt", "changed.txt", "added.txt"} <= names
+    assert "backup_manifest.json" not in names